@@ -15,13 +15,14 @@ DOCUMENTATION = '''
     short_description: Profiles maximum memory usage of tasks and full execution using cgroups
     description:
         - This is an ansible callback plugin that profiles maximum memory usage of ansible and individual tasks, and displays a recap at the end using cgroups
+        - With cgroup v2, the recap also shows the CPU time and the I/O of every task.
     notes:
         - Requires ansible to be run from within a cgroup, such as with C(cgexec -g memory:ansible_profile ansible-playbook ...)
         - This cgroup should only be used by ansible to get accurate results
         - To create the cgroup, first use a command such as C(sudo cgcreate -a ec2-user:ec2-user -t ec2-user:ec2-user -g memory:ansible_profile)
+        - Either I(cgroup_path) (cgroup v2) or both I(max_mem_file) and I(cur_mem_file) (cgroup v1) are required.
     options:
       max_mem_file:
-        required: True
         description: Path to cgroups C(memory.max_usage_in_bytes) file. Example C(/sys/fs/cgroup/memory/ansible_profile/memory.max_usage_in_bytes)
         env:
           - name: CGROUP_MAX_MEM_FILE
@@ -29,36 +30,132 @@ DOCUMENTATION = '''
           - section: callback_cgroupmemrecap
             key: max_mem_file
       cur_mem_file:
-        required: True
         description: Path to C(memory.usage_in_bytes) file. Example C(/sys/fs/cgroup/memory/ansible_profile/memory.usage_in_bytes)
         env:
           - name: CGROUP_CUR_MEM_FILE
         ini:
           - section: callback_cgroupmemrecap
             key: cur_mem_file
+      cgroup_path:
+        description:
+          - Path to a cgroup v2 directory. Example C(/sys/fs/cgroup/ansible_profile)
+          - When set, memory usage is read from C(memory.current) and C(memory.peak), and the per-task deltas
+            of C(cpu.stat) and C(io.stat) are reported as well. I(max_mem_file) and I(cur_mem_file) are ignored.
+        env:
+          - name: CGROUP_PATH
+        ini:
+          - section: callback_cgroupmemrecap
+            key: cgroup_path
+        version_added: 1.0.0
+      sample_interval:
+        description: Interval in seconds between two samples of the current memory usage.
+        type: float
+        default: 0.001
+        env:
+          - name: CGROUP_SAMPLE_INTERVAL
+        ini:
+          - section: callback_cgroupmemrecap
+            key: sample_interval
+        version_added: 1.0.0
+      percentile:
+        description:
+          - When set, also display this percentile of the memory usage samples of every task.
+          - The percentile is computed from a fixed size histogram and is accurate within about 10%.
+        type: int
+        env:
+          - name: CGROUP_PERCENTILE
+        ini:
+          - section: callback_cgroupmemrecap
+            key: percentile
+        version_added: 1.0.0
 '''
 
-import time
+import math
+import os
 import threading
+import time
 
+from ansible.errors import AnsibleError
 from ansible.plugins.callback import CallbackBase
 
 
+# Histogram buckets grow by 2^(1/8), about 9%, so any usage fits in a few hundred buckets
+HISTOGRAM_BASE = 2 ** (1 / 8.0)
+
+
+def read_int(fd):
+    """Read the integer value of a cgroup file from an open file descriptor"""
+    try:
+        data = os.pread(fd, 64, 0)
+    except AttributeError:
+        # Python 2 has no os.pread
+        os.lseek(fd, 0, os.SEEK_SET)
+        data = os.read(fd, 64)
+    return int(data.strip())
+
+
+def read_stat(path):
+    """Read a flat keyed cgroup file such as cpu.stat, or sum a nested keyed one such as io.stat over all its entries"""
+    stat = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 2 and '=' not in fields[1]:
+                    stat[fields[0]] = int(fields[1])
+                    continue
+                for field in fields[1:]:
+                    key, value = field.split('=', 1)
+                    stat[key] = stat.get(key, 0) + int(value)
+    except (IOError, OSError):
+        pass
+    return stat
+
+
 class MemProf(threading.Thread):
-    """Python thread for recording memory usage"""
-    def __init__(self, path, obj=None):
+    """Python thread for recording memory usage
+
+    Keeps running aggregates in constant memory instead of all samples"""
+    def __init__(self, path, obj=None, interval=0.001):
         threading.Thread.__init__(self)
         self.obj = obj
         self.path = path
-        self.results = []
+        self.interval = interval
         self.running = True
+        self.count = 0
+        self.max = 0
+        self.histogram = {}
+
+    def add(self, value):
+        self.count += 1
+        self.max = max(self.max, value)
+        bucket = int(math.log(value, HISTOGRAM_BASE)) if value > 0 else 0
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def percentile(self, percent):
+        """Approximate percentile of the samples, from the histogram"""
+        threshold = self.count * percent / 100.0
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= threshold:
+                return min(HISTOGRAM_BASE ** (bucket + 1), self.max)
+        return self.max
+
+    def stop(self):
+        self.running = False
+        self.join()
 
     def run(self):
-        while self.running:
-            with open(self.path) as f:
-                val = f.read()
-            self.results.append(int(val.strip()) / 1024 / 1024)
-            time.sleep(0.001)
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            while True:
+                self.add(read_int(fd))
+                if not self.running:
+                    break
+                time.sleep(self.interval)
+        finally:
+            os.close(fd)
 
 
 class CallbackModule(CallbackBase):
@@ -71,34 +168,68 @@ class CallbackModule(CallbackBase):
         super(CallbackModule, self).__init__(display)
 
         self._task_memprof = None
+        self._task_stats = None
 
         self.task_results = []
+        self.execution_max = 0
 
     def set_options(self, task_keys=None, var_options=None, direct=None):
         super(CallbackModule, self).set_options(task_keys=task_keys, var_options=var_options, direct=direct)
 
+        self.cgroup_path = self.get_option('cgroup_path')
+        self.sample_interval = self.get_option('sample_interval')
+        self.percentile = self.get_option('percentile')
+
+        if self.cgroup_path:
+            self.cgroup_max_file = os.path.join(self.cgroup_path, 'memory.peak')
+            self.cgroup_current_file = os.path.join(self.cgroup_path, 'memory.current')
+            # memory.peak only exists on Linux 5.19 and newer and cannot be reset
+            if not os.path.exists(self.cgroup_max_file):
+                self.cgroup_max_file = None
+            return
+
         self.cgroup_max_file = self.get_option('max_mem_file')
         self.cgroup_current_file = self.get_option('cur_mem_file')
+        if not self.cgroup_max_file or not self.cgroup_current_file:
+            raise AnsibleError('The cgroup_memory_recap callback requires either cgroup_path or both max_mem_file and cur_mem_file')
 
         with open(self.cgroup_max_file, 'w+') as f:
             f.write('0')
 
+    def _read_stats(self):
+        if not self.cgroup_path:
+            return None
+        return (
+            read_stat(os.path.join(self.cgroup_path, 'cpu.stat')),
+            read_stat(os.path.join(self.cgroup_path, 'io.stat')),
+        )
+
     def _profile_memory(self, obj=None):
         prev_task = None
-        results = None
+        prev_stats = self._task_stats
+        memprof = None
         try:
-            self._task_memprof.running = False
-            results = self._task_memprof.results
+            self._task_memprof.stop()
+            memprof = self._task_memprof
             prev_task = self._task_memprof.obj
         except AttributeError:
             pass
 
+        self._task_stats = self._read_stats()
+
         if obj is not None:
-            self._task_memprof = MemProf(self.cgroup_current_file, obj=obj)
+            self._task_memprof = MemProf(self.cgroup_current_file, obj=obj, interval=self.sample_interval)
             self._task_memprof.start()
 
-        if results is not None:
-            self.task_results.append((prev_task, max(results)))
+        if memprof is not None:
+            deltas = None
+            if prev_stats is not None:
+                deltas = tuple(
+                    dict((key, after.get(key, 0) - value) for key, value in before.items())
+                    for before, after in zip(prev_stats, self._task_stats)
+                )
+            self.execution_max = max(self.execution_max, memprof.max)
+            self.task_results.append((prev_task, memprof, deltas))
 
     def v2_playbook_on_task_start(self, task, is_conditional):
         self._profile_memory(task)
@@ -106,11 +237,25 @@ class CallbackModule(CallbackBase):
     def v2_playbook_on_stats(self, stats):
         self._profile_memory()
 
-        with open(self.cgroup_max_file) as f:
-            max_results = int(f.read().strip()) / 1024 / 1024
+        if self.cgroup_max_file:
+            with open(self.cgroup_max_file) as f:
+                max_results = int(f.read().strip()) / 1024 / 1024
+        else:
+            max_results = self.execution_max / 1024 / 1024
 
         self._display.banner('CGROUP MEMORY RECAP')
         self._display.display('Execution Maximum: %0.2fMB\n\n' % max_results)
 
-        for task, memory in self.task_results:
-            self._display.display('%s (%s): %0.2fMB' % (task.get_name(), task._uuid, memory))
+        for task, memprof, deltas in self.task_results:
+            line = '%s (%s): %0.2fMB' % (task.get_name(), task._uuid, memprof.max / 1024 / 1024)
+            if self.percentile:
+                line += ' (p%d: %0.2fMB)' % (self.percentile, memprof.percentile(self.percentile) / 1024 / 1024)
+            if deltas is not None:
+                cpu, io = deltas
+                line += ', CPU: %0.2fs user %0.2fs system, I/O: %0.2fMB read %0.2fMB written' % (
+                    cpu.get('user_usec', 0) / 1000000.0,
+                    cpu.get('system_usec', 0) / 1000000.0,
+                    io.get('rbytes', 0) / 1024 / 1024,
+                    io.get('wbytes', 0) / 1024 / 1024,
+                )
+            self._display.display(line)
@@ -806,6 +806,39 @@ class DummyStdout(object):
         pass
 
 
+class CallbackDIYDict(dict):
+    def __deepcopy__(self, memo):
+        return self
+
+
+class CallbackDIYVars(dict):
+    """
+    Templating variables whose callback namespace is only built when a template accesses it.
+    """
+    def __init__(self, namespace, *args, **kwargs):
+        super(CallbackDIYVars, self).__init__(*args, **kwargs)
+        self._diy_namespace = namespace
+        self._diy_builder = None
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def set_builder(self, builder):
+        self._diy_builder = builder
+
+    def __contains__(self, key):
+        return (key == self._diy_namespace and self._diy_builder is not None) or super(CallbackDIYVars, self).__contains__(key)
+
+    def __getitem__(self, key):
+        if key == self._diy_namespace and self._diy_builder is not None:
+            _builder, self._diy_builder = self._diy_builder, None
+            _builder(self)
+        return super(CallbackDIYVars, self).__getitem__(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
 class CallbackModule(Default):
     """
     Callback plugin that allows you to supply your own custom callback templates to be output.
@@ -816,6 +849,60 @@ class CallbackModule(Default):
 
     DIY_NS = 'ansible_callback_diy'
 
+    _PLAYBOOK_ATTRIBUTES = ['entries', 'file_name', 'basedir']
+
+    _PLAY_ATTRIBUTES = ['any_errors_fatal', 'become', 'become_flags', 'become_method',
+                        'become_user', 'check_mode', 'collections', 'connection',
+                        'debugger', 'diff', 'environment', 'fact_path', 'finalized',
+                        'force_handlers', 'gather_facts', 'gather_subset',
+                        'gather_timeout', 'handlers', 'hosts', 'ignore_errors',
+                        'ignore_unreachable', 'included_conditional', 'included_path',
+                        'max_fail_percentage', 'module_defaults', 'name', 'no_log',
+                        'only_tags', 'order', 'port', 'post_tasks', 'pre_tasks',
+                        'remote_user', 'removed_hosts', 'roles', 'run_once', 'serial',
+                        'skip_tags', 'squashed', 'strategy', 'tags', 'tasks', 'uuid',
+                        'validated', 'vars_files', 'vars_prompt']
+
+    _HOST_ATTRIBUTES = ['name', 'uuid', 'address', 'implicit']
+
+    _TASK_ATTRIBUTES = ['action', 'any_errors_fatal', 'args', 'async', 'async_val',
+                        'become', 'become_flags', 'become_method', 'become_user',
+                        'changed_when', 'check_mode', 'collections', 'connection',
+                        'debugger', 'delay', 'delegate_facts', 'delegate_to', 'diff',
+                        'environment', 'failed_when', 'finalized', 'ignore_errors',
+                        'ignore_unreachable', 'loop', 'loop_control', 'loop_with',
+                        'module_defaults', 'name', 'no_log', 'notify', 'parent', 'poll',
+                        'port', 'register', 'remote_user', 'retries', 'role', 'run_once',
+                        'squashed', 'tags', 'untagged', 'until', 'uuid', 'validated',
+                        'when']
+
+    _INCLUDED_FILE_ATTRIBUTES = ['args', 'filename', 'hosts', 'is_role', 'task']
+
+    _HANDLER_ATTRIBUTES = ['action', 'any_errors_fatal', 'args', 'async', 'async_val',
+                           'become', 'become_flags', 'become_method', 'become_user',
+                           'changed_when', 'check_mode', 'collections', 'connection',
+                           'debugger', 'delay', 'delegate_facts', 'delegate_to', 'diff',
+                           'environment', 'failed_when', 'finalized', 'ignore_errors',
+                           'ignore_unreachable', 'listen', 'loop', 'loop_control',
+                           'loop_with', 'module_defaults', 'name', 'no_log',
+                           'notified_hosts', 'notify', 'parent', 'poll', 'port',
+                           'register', 'remote_user', 'retries', 'role', 'run_once',
+                           'squashed', 'tags', 'untagged', 'until', 'uuid', 'validated',
+                           'when']
+
+    _RESULT_ATTRIBUTES = ['host', 'task', 'task_name']
+
+    _RESULT_METHODS = ['is_changed', 'is_failed', 'is_skipped', 'is_unreachable']
+
+    _STATS_ATTRIBUTES = ['changed', 'custom', 'dark', 'failures', 'ignored',
+                         'ok', 'processed', 'rescued', 'skipped']
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        # attribute snapshots of the playbook, plays and tasks, they do not change during a run
+        self._diy_snapshots = {}
+        self._diy_variable_manager = None
+
     @contextmanager
     def _suppress_stdout(self, enabled):
         saved_stdout = sys.stdout
@@ -829,6 +916,7 @@ class CallbackModule(Default):
         _calling_method = sys._getframe(1).f_code.co_name
         _callback_type = (_calling_method[3:] if _calling_method[:3] == "v2_" else _calling_method)
         _callback_options = ['msg', 'msg_color']
+        _templar = None
 
         for option in _callback_options:
             _option_name = '%s_%s' % (_callback_type, option)
@@ -836,10 +924,19 @@ class CallbackModule(Default):
                 self.DIY_NS + "_" + _option_name,
                 self.get_option(_option_name)
             )
+
+            # nothing to render, or the color of a message that is not output
+            if _option_template is None or (option == 'msg_color' and not self._using_diy(dict(_ret, vars=variables))):
+                _ret.update({option: None})
+                continue
+
+            if _templar is None:
+                _templar = Templar(loader=loader, variables=variables)
             _ret.update({option: self._template(
                 loader=loader,
                 template=_option_template,
-                variables=variables
+                variables=variables,
+                templar=_templar
             )})
 
         _ret.update({'vars': variables})
@@ -852,8 +949,8 @@ class CallbackModule(Default):
     def _parent_has_callback(self):
         return hasattr(super(CallbackModule, self), sys._getframe(1).f_code.co_name)
 
-    def _template(self, loader, template, variables):
-        _templar = Templar(loader=loader, variables=variables)
+    def _template(self, loader, template, variables, templar=None):
+        _templar = templar or Templar(loader=loader, variables=variables)
         return _templar.template(
             template,
             preserve_trailing_newlines=True,
@@ -866,157 +963,139 @@ class CallbackModule(Default):
         if len(_msg) > 0:
             self._display.display(msg=_msg, color=spec['msg_color'], stderr=stderr)
 
-    def _get_vars(self, playbook, play=None, host=None, task=None, included_file=None,
-                  handler=None, result=None, stats=None, remove_attr_ref_loop=True):
-        def _get_value(obj, attr=None, method=None):
-            if attr:
-                return getattr(obj, attr, getattr(obj, "_" + attr, None))
-
-            if method:
-                _method = getattr(obj, method)
-                return _method()
+    @staticmethod
+    def _get_value(obj, attr=None, method=None):
+        if attr:
+            return getattr(obj, attr, getattr(obj, "_" + attr, None))
 
-        def _remove_attr_ref_loop(obj, attributes):
-            _loop_var = getattr(obj, 'loop_control', None)
-            _loop_var = (_loop_var or 'item')
+        if method:
+            _method = getattr(obj, method)
+            return _method()
 
-            for attr in attributes:
-                if str(_loop_var) in str(_get_value(obj=obj, attr=attr)):
-                    attributes.remove(attr)
+    def _remove_attr_ref_loop(self, obj, attributes):
+        _loop_var = getattr(obj, 'loop_control', None)
+        _loop_var = (_loop_var or 'item')
 
-            return attributes
+        for attr in list(attributes):
+            if str(_loop_var) in str(self._get_value(obj=obj, attr=attr)):
+                attributes.remove(attr)
 
-        class CallbackDIYDict(dict):
-            def __deepcopy__(self, memo):
-                return self
+        return attributes
 
-        _ret = {}
+    def _get_snapshot(self, key, obj, attributes):
+        if key not in self._diy_snapshots:
+            self._diy_snapshots[key] = dict(
+                (attr, self._get_value(obj=obj, attr=attr)) for attr in attributes
+            )
+        return dict(self._diy_snapshots[key])
 
-        _variable_manager = VariableManager(loader=playbook.get_loader())
+    def _get_vars(self, playbook, play=None, host=None, task=None, included_file=None,
+                  handler=None, result=None, stats=None, remove_attr_ref_loop=True):
+        _ret = CallbackDIYVars(self.DIY_NS)
 
-        _all = _variable_manager.get_vars()
         if play:
             _all = play.get_variable_manager().get_vars(
                 play=play,
                 host=(host if host else getattr(result, '_host', None)),
                 task=(handler if handler else task)
             )
+        else:
+            if self._diy_variable_manager is None:
+                self._diy_variable_manager = VariableManager(loader=playbook.get_loader())
+            _all = self._diy_variable_manager.get_vars()
         _ret.update(_all)
 
-        _ret.update(_ret.get(self.DIY_NS, {self.DIY_NS: CallbackDIYDict()}))
+        # the callback namespace is only built if a template uses it
+        _ret.set_builder(lambda variables: self._get_diy_vars(
+            variables, playbook, play=play, host=host, task=task, included_file=included_file,
+            handler=handler, result=result, stats=stats, remove_attr_ref_loop=remove_attr_ref_loop
+        ))
+
+        if result:
+            _ret.update(result._result)
+
+        return _ret
 
-        _ret[self.DIY_NS].update({'playbook': {}})
-        _playbook_attributes = ['entries', 'file_name', 'basedir']
+    def _get_diy_vars(self, _ret, playbook, play=None, host=None, task=None, included_file=None,
+                      handler=None, result=None, stats=None, remove_attr_ref_loop=True):
+        _ret.update(dict.get(_ret, self.DIY_NS, {self.DIY_NS: CallbackDIYDict()}))
 
-        for attr in _playbook_attributes:
-            _ret[self.DIY_NS]['playbook'].update({attr: _get_value(obj=playbook, attr=attr)})
+        _ret[self.DIY_NS].update({'playbook': self._get_snapshot(
+            key=('playbook', id(playbook)),
+            obj=playbook,
+            attributes=self._PLAYBOOK_ATTRIBUTES
+        )})
 
         if play:
-            _ret[self.DIY_NS].update({'play': {}})
-            _play_attributes = ['any_errors_fatal', 'become', 'become_flags', 'become_method',
-                                'become_user', 'check_mode', 'collections', 'connection',
-                                'debugger', 'diff', 'environment', 'fact_path', 'finalized',
-                                'force_handlers', 'gather_facts', 'gather_subset',
-                                'gather_timeout', 'handlers', 'hosts', 'ignore_errors',
-                                'ignore_unreachable', 'included_conditional', 'included_path',
-                                'max_fail_percentage', 'module_defaults', 'name', 'no_log',
-                                'only_tags', 'order', 'port', 'post_tasks', 'pre_tasks',
-                                'remote_user', 'removed_hosts', 'roles', 'run_once', 'serial',
-                                'skip_tags', 'squashed', 'strategy', 'tags', 'tasks', 'uuid',
-                                'validated', 'vars_files', 'vars_prompt']
-
-            for attr in _play_attributes:
-                _ret[self.DIY_NS]['play'].update({attr: _get_value(obj=play, attr=attr)})
+            _ret[self.DIY_NS].update({'play': self._get_snapshot(
+                key=('play', play._uuid),
+                obj=play,
+                attributes=self._PLAY_ATTRIBUTES
+            )})
 
         if host:
             _ret[self.DIY_NS].update({'host': {}})
-            _host_attributes = ['name', 'uuid', 'address', 'implicit']
 
-            for attr in _host_attributes:
-                _ret[self.DIY_NS]['host'].update({attr: _get_value(obj=host, attr=attr)})
+            for attr in self._HOST_ATTRIBUTES:
+                _ret[self.DIY_NS]['host'].update({attr: self._get_value(obj=host, attr=attr)})
 
         if task:
-            _ret[self.DIY_NS].update({'task': {}})
-            _task_attributes = ['action', 'any_errors_fatal', 'args', 'async', 'async_val',
-                                'become', 'become_flags', 'become_method', 'become_user',
-                                'changed_when', 'check_mode', 'collections', 'connection',
-                                'debugger', 'delay', 'delegate_facts', 'delegate_to', 'diff',
-                                'environment', 'failed_when', 'finalized', 'ignore_errors',
-                                'ignore_unreachable', 'loop', 'loop_control', 'loop_with',
-                                'module_defaults', 'name', 'no_log', 'notify', 'parent', 'poll',
-                                'port', 'register', 'remote_user', 'retries', 'role', 'run_once',
-                                'squashed', 'tags', 'untagged', 'until', 'uuid', 'validated',
-                                'when']
+            _task_attributes = list(self._TASK_ATTRIBUTES)
+            _remove_loop_refs = bool(task.loop and remove_attr_ref_loop)
 
             # remove arguments that reference a loop var because they cause templating issues in
             # callbacks that do not have the loop context(e.g. playbook_on_task_start)
-            if task.loop and remove_attr_ref_loop:
-                _task_attributes = _remove_attr_ref_loop(obj=task, attributes=_task_attributes)
+            if _remove_loop_refs:
+                _task_attributes = self._remove_attr_ref_loop(obj=task, attributes=_task_attributes)
 
-            for attr in _task_attributes:
-                _ret[self.DIY_NS]['task'].update({attr: _get_value(obj=task, attr=attr)})
+            _ret[self.DIY_NS].update({'task': self._get_snapshot(
+                key=('task', task._uuid, _remove_loop_refs),
+                obj=task,
+                attributes=_task_attributes
+            )})
 
         if included_file:
             _ret[self.DIY_NS].update({'included_file': {}})
-            _included_file_attributes = ['args', 'filename', 'hosts', 'is_role', 'task']
 
-            for attr in _included_file_attributes:
-                _ret[self.DIY_NS]['included_file'].update({attr: _get_value(
+            for attr in self._INCLUDED_FILE_ATTRIBUTES:
+                _ret[self.DIY_NS]['included_file'].update({attr: self._get_value(
                     obj=included_file,
                     attr=attr
                 )})
 
         if handler:
             _ret[self.DIY_NS].update({'handler': {}})
-            _handler_attributes = ['action', 'any_errors_fatal', 'args', 'async', 'async_val',
-                                   'become', 'become_flags', 'become_method', 'become_user',
-                                   'changed_when', 'check_mode', 'collections', 'connection',
-                                   'debugger', 'delay', 'delegate_facts', 'delegate_to', 'diff',
-                                   'environment', 'failed_when', 'finalized', 'ignore_errors',
-                                   'ignore_unreachable', 'listen', 'loop', 'loop_control',
-                                   'loop_with', 'module_defaults', 'name', 'no_log',
-                                   'notified_hosts', 'notify', 'parent', 'poll', 'port',
-                                   'register', 'remote_user', 'retries', 'role', 'run_once',
-                                   'squashed', 'tags', 'untagged', 'until', 'uuid', 'validated',
-                                   'when']
+            _handler_attributes = list(self._HANDLER_ATTRIBUTES)
 
             if handler.loop and remove_attr_ref_loop:
-                _handler_attributes = _remove_attr_ref_loop(obj=handler,
-                                                            attributes=_handler_attributes)
+                _handler_attributes = self._remove_attr_ref_loop(obj=handler,
+                                                                 attributes=_handler_attributes)
 
+            # handlers are not cached, notified_hosts changes during the run
             for attr in _handler_attributes:
-                _ret[self.DIY_NS]['handler'].update({attr: _get_value(obj=handler, attr=attr)})
+                _ret[self.DIY_NS]['handler'].update({attr: self._get_value(obj=handler, attr=attr)})
 
             _ret[self.DIY_NS]['handler'].update({'is_host_notified': handler.is_host_notified(host)})
 
         if result:
             _ret[self.DIY_NS].update({'result': {}})
-            _result_attributes = ['host', 'task', 'task_name']
-
-            for attr in _result_attributes:
-                _ret[self.DIY_NS]['result'].update({attr: _get_value(obj=result, attr=attr)})
 
-            _result_methods = ['is_changed', 'is_failed', 'is_skipped', 'is_unreachable']
+            for attr in self._RESULT_ATTRIBUTES:
+                _ret[self.DIY_NS]['result'].update({attr: self._get_value(obj=result, attr=attr)})
 
-            for method in _result_methods:
-                _ret[self.DIY_NS]['result'].update({method: _get_value(obj=result, method=method)})
+            for method in self._RESULT_METHODS:
+                _ret[self.DIY_NS]['result'].update({method: self._get_value(obj=result, method=method)})
 
             _ret[self.DIY_NS]['result'].update({'output': getattr(result, '_result', None)})
 
-            _ret.update(result._result)
-
         if stats:
             _ret[self.DIY_NS].update({'stats': {}})
-            _stats_attributes = ['changed', 'custom', 'dark', 'failures', 'ignored',
-                                 'ok', 'processed', 'rescued', 'skipped']
 
-            for attr in _stats_attributes:
-                _ret[self.DIY_NS]['stats'].update({attr: _get_value(obj=stats, attr=attr)})
+            for attr in self._STATS_ATTRIBUTES:
+                _ret[self.DIY_NS]['stats'].update({attr: self._get_value(obj=stats, attr=attr)})
 
         _ret[self.DIY_NS].update({'top_level_var_names': _ret.keys()})
 
-        return _ret
-
     def v2_on_any(self, *args, **kwargs):
         self._diy_spec = self._get_output_specification(
             loader=self._diy_loader,
@@ -1213,6 +1292,8 @@ class CallbackModule(Default):
     def v2_playbook_on_start(self, playbook):
         self._diy_playbook = playbook
         self._diy_loader = self._diy_playbook.get_loader()
+        self._diy_snapshots = {}
+        self._diy_variable_manager = None
 
         self._diy_spec = self._get_output_specification(
             loader=self._diy_loader,
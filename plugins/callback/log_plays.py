@@ -23,12 +23,88 @@ DOCUMENTATION = '''
         ini:
           - section: callback_log_plays
             key: log_folder
+      log_format:
+        default: text
+        choices: [text, json]
+        description:
+          - Format of the log files.
+          - C(text) writes one timestamped paragraph per event to a file named after the host.
+          - C(json) writes one JSON object per line to a file named after the host with a C(.jsonl) extension.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_FORMAT
+        ini:
+          - section: callback_log_plays
+            key: log_format
+        version_added: 1.0.0
+      compress:
+        default: false
+        type: bool
+        description: Compress the log files with gzip and add a C(.gz) extension to their name.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_COMPRESS
+        ini:
+          - section: callback_log_plays
+            key: compress
+        version_added: 1.0.0
+      max_open_files:
+        default: 64
+        type: int
+        description: Maximum number of log files kept open at the same time. The least recently used file is closed first.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_MAX_OPEN_FILES
+        ini:
+          - section: callback_log_plays
+            key: max_open_files
+        version_added: 1.0.0
+      flush_interval:
+        default: 5
+        type: float
+        description:
+          - Interval in seconds after which the buffered log lines are written to the log files.
+          - All log files are flushed and closed at the end of the playbook.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_FLUSH_INTERVAL
+        ini:
+          - section: callback_log_plays
+            key: flush_interval
+        version_added: 1.0.0
+      rotate_size:
+        default: 0
+        type: int
+        description:
+          - Rotate a log file once it is this many bytes large. C(0) disables size based rotation.
+          - When I(compress=true), the size is the compressed size on disk, which does not include the lines
+            still buffered by the compressor.
+          - Rotated files get the time of rotation appended to their name.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_ROTATE_SIZE
+        ini:
+          - section: callback_log_plays
+            key: rotate_size
+        version_added: 1.0.0
+      rotate_interval:
+        default: 0
+        type: int
+        description:
+          - Rotate a log file once it is older than this many seconds. C(0) disables time based rotation.
+          - The creation time of every log file is recorded in a hidden C(.<name>.started) file next to it,
+            so that the age of the log files is kept across runs.
+        env:
+          - name: ANSIBLE_LOG_PLAYS_ROTATE_INTERVAL
+        ini:
+          - section: callback_log_plays
+            key: rotate_interval
+        version_added: 1.0.0
 '''
 
+import atexit
+import gzip
 import os
 import time
 import json
 
+from collections import OrderedDict
+
 from ansible.utils.path import makedirs_safe
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.common._collections_compat import MutableMapping
@@ -43,6 +119,123 @@ from ansible.plugins.callback import CallbackBase
 # that want it.
 
 
+def started_path(path):
+    """Path of the file recording the creation time of a log file"""
+    return os.path.join(os.path.dirname(path), '.%s.started' % os.path.basename(path))
+
+
+class LogFile(object):
+    """An open log file and the state needed to decide when to rotate it"""
+
+    def __init__(self, path, started, compress=False):
+        self.path = path
+        self.started = started
+        self.compress = compress
+        if compress:
+            self.fd = gzip.open(path, 'ab')
+        else:
+            self.fd = open(path, 'ab')
+        self.written = os.path.getsize(path)
+
+    @property
+    def size(self):
+        if self.compress:
+            # the compressed size is only known once the compressor wrote the data out
+            return os.fstat(self.fd.fileobj.fileno()).st_size
+        return self.written
+
+    def write(self, msg):
+        self.fd.write(msg)
+        self.written += len(msg)
+
+    def flush(self):
+        self.fd.flush()
+
+    def close(self):
+        self.fd.close()
+
+
+class LogWriterPool(object):
+    """Buffers log lines in a bounded set of open log files"""
+
+    def __init__(self, max_open_files=64, flush_interval=5, rotate_size=0, rotate_interval=0, compress=False):
+        self.max_open_files = max(max_open_files, 1)
+        self.flush_interval = flush_interval
+        self.rotate_size = rotate_size
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.files = OrderedDict()
+        # creation times of the log files, kept when their file is closed by the LRU
+        self.started = {}
+        self.last_flush = time.time()
+
+    def _get_started(self, path):
+        started = self.started.get(path)
+        if started is not None:
+            return started
+        if os.path.exists(path):
+            try:
+                with open(started_path(path)) as f:
+                    started = float(f.read().strip())
+            except (IOError, OSError, ValueError):
+                pass
+        if started is None:
+            started = time.time()
+            if self.rotate_interval:
+                with open(started_path(path), 'w') as f:
+                    f.write('%f\n' % started)
+        self.started[path] = started
+        return started
+
+    def _get_file(self, path):
+        log_file = self.files.pop(path, None)
+        if log_file is None:
+            log_file = LogFile(path, self._get_started(path), compress=self.compress)
+            while len(self.files) >= self.max_open_files:
+                self.files.popitem(last=False)[1].close()
+        # (re)insert as most recently used
+        self.files[path] = log_file
+        return log_file
+
+    def _needs_rotation(self, log_file, now):
+        if self.rotate_size and log_file.size >= self.rotate_size:
+            return True
+        if self.rotate_interval and now - log_file.started >= self.rotate_interval:
+            return True
+        return False
+
+    def _rotate(self, log_file, now):
+        del self.files[log_file.path]
+        log_file.close()
+        rotated = base = '%s.%s' % (log_file.path, time.strftime('%Y%m%d%H%M%S', time.localtime(now)))
+        count = 0
+        while os.path.exists(rotated):
+            count += 1
+            rotated = '%s.%d' % (base, count)
+        os.rename(log_file.path, rotated)
+        del self.started[log_file.path]
+        return self._get_file(log_file.path)
+
+    def write(self, path, msg):
+        now = time.time()
+        log_file = self._get_file(path)
+        if log_file.written and self._needs_rotation(log_file, now):
+            log_file = self._rotate(log_file, now)
+        log_file.write(msg)
+
+        if now - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        for log_file in self.files.values():
+            log_file.flush()
+        self.last_flush = time.time()
+
+    def close(self):
+        while self.files:
+            self.files.popitem(last=False)[1].close()
+
+
 class CallbackModule(CallbackBase):
     """
     logs playbook results, per host, in /var/log/ansible/hosts
@@ -59,15 +252,60 @@ class CallbackModule(CallbackBase):
 
         super(CallbackModule, self).__init__()
 
+        self.writers = None
+
     def set_options(self, task_keys=None, var_options=None, direct=None):
         super(CallbackModule, self).set_options(task_keys=task_keys, var_options=var_options, direct=direct)
 
         self.log_folder = self.get_option("log_folder")
+        self.log_format = self.get_option("log_format")
+        self.compress = self.get_option("compress")
 
         if not os.path.exists(self.log_folder):
             makedirs_safe(self.log_folder)
 
+        if self.writers is None:
+            # make sure buffered lines are written when the playbook does not reach its stats
+            atexit.register(self._close_writers)
+        else:
+            self.writers.close()
+        self.writers = LogWriterPool(
+            max_open_files=self.get_option("max_open_files"),
+            flush_interval=self.get_option("flush_interval"),
+            rotate_size=self.get_option("rotate_size"),
+            rotate_interval=self.get_option("rotate_interval"),
+            compress=self.compress,
+        )
+
+    def _close_writers(self):
+        self.writers.close()
+
+    def _log_path(self, host):
+        path = os.path.join(self.log_folder, host)
+        if self.log_format == 'json':
+            path += '.jsonl'
+        if self.compress:
+            path += '.gz'
+        return path
+
+    def _json_msg(self, host, category, data):
+        record = dict(time=time.strftime(self.TIME_FORMAT, time.localtime()), host=host, category=category)
+        if isinstance(data, MutableMapping):
+            if '_ansible_verbose_override' in data:
+                data = 'omitted'
+            else:
+                data = data.copy()
+                invocation = data.pop('invocation', None)
+                if invocation is not None:
+                    record['invocation'] = invocation
+        record['data'] = data
+        return to_bytes(json.dumps(record, cls=AnsibleJSONEncoder) + "\n")
+
     def log(self, host, category, data):
+        if self.log_format == 'json':
+            self.writers.write(self._log_path(host), self._json_msg(host, category, data))
+            return
+
         if isinstance(data, MutableMapping):
             if '_ansible_verbose_override' in data:
                 # avoid logging extraneous data
@@ -79,12 +317,10 @@ class CallbackModule(CallbackBase):
                 if invocation is not None:
                     data = json.dumps(invocation) + " => %s " % data
 
-        path = os.path.join(self.log_folder, host)
         now = time.strftime(self.TIME_FORMAT, time.localtime())
 
         msg = to_bytes(self.MSG_FORMAT % dict(now=now, category=category, data=data))
-        with open(path, "ab") as fd:
-            fd.write(msg)
+        self.writers.write(self._log_path(host), msg)
 
     def runner_on_failed(self, host, res, ignore_errors=False):
         self.log(host, 'FAILED', res)
@@ -106,3 +342,6 @@ class CallbackModule(CallbackBase):
 
     def playbook_on_not_import_for_host(self, host, missing_file):
         self.log(host, 'NOTIMPORTED', missing_file)
+
+    def v2_playbook_on_stats(self, stats):
+        self.writers.close()
@@ -58,4 +58,13 @@ options:
             - Verify TLS certificates (do not disable this in production).
         type: bool
         default: yes
+
+    token_cache:
+        description:
+            - Cache the access and refresh tokens in C(~/.ansible/tmp/keycloak-tokens.json), only readable by its owner.
+            - A cached access token is reused until it expires, then it is refreshed with its refresh token,
+              so that many tasks using the same credentials do not log in again every time.
+        type: bool
+        default: no
+        version_added: 1.0.0
 '''
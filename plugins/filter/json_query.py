@@ -18,6 +18,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from collections import OrderedDict
+
 from ansible.errors import AnsibleError, AnsibleFilterError
 
 try:
@@ -27,16 +29,31 @@ except ImportError:
     HAS_LIB = False
 
 
-def json_query(data, expr):
-    '''Query data using jmespath query language ( http://jmespath.org ). Example:
-    - debug: msg="{{ instance | json_query(tagged_instances[*].block_device_mapping.*.volume_id') }}"
-    '''
+# Number of compiled expressions kept, least recently used ones are dropped first
+EXPRESSION_CACHE_SIZE = 256
+
+_expression_cache = OrderedDict()
+
+
+def _compile(expr):
+    '''Return the compiled jmespath expression for expr, parsing it only once'''
+    compiled = _expression_cache.pop(expr, None)
+    if compiled is None:
+        compiled = jmespath.compile(expr)
+        if len(_expression_cache) >= EXPRESSION_CACHE_SIZE:
+            _expression_cache.popitem(last=False)
+    _expression_cache[expr] = compiled
+    return compiled
+
+
+def _search(expr, documents):
     if not HAS_LIB:
         raise AnsibleError('You need to install "jmespath" prior to running '
                            'json_query filter')
 
     try:
-        return jmespath.search(expr, data)
+        compiled = _compile(expr)
+        return [compiled.search(data) for data in documents]
     except jmespath.exceptions.JMESPathError as e:
         raise AnsibleFilterError('JMESPathError in json_query filter plugin:\n%s' % e)
     except Exception as e:
@@ -44,10 +61,25 @@ def json_query(data, expr):
         raise AnsibleFilterError('Error in jmespath.search in json_query filter plugin:\n%s' % e)
 
 
+def json_query(data, expr):
+    '''Query data using jmespath query language ( http://jmespath.org ). Example:
+    - debug: msg="{{ instance | json_query(tagged_instances[*].block_device_mapping.*.volume_id') }}"
+    '''
+    return _search(expr, [data])[0]
+
+
+def json_query_map(documents, expr):
+    '''Apply the same jmespath query to every document of a list, and return the list of results. Example:
+    - debug: msg="{{ hostvars | dict2items | map(attribute='value') | list | json_query_map('ansible_facts.default_ipv4.address') }}"
+    '''
+    return _search(expr, documents)
+
+
 class FilterModule(object):
     ''' Query filter '''
 
     def filters(self):
         return {
-            'json_query': json_query
+            'json_query': json_query,
+            'json_query_map': json_query_map,
         }
@@ -12,12 +12,22 @@ DOCUMENTATION = '''
       - Lookup metadata for a playbook from the key value store in a Consul cluster.
         Values can be easily set in the kv store with simple rest commands
       - C(curl -X PUT -d 'some-value' http://localhost:8500/v1/kv/ansible/somedata)
+      - Consul clients are reused by the following lookups of the same Ansible process that connect to the same agent.
+      - Recursive reads are cached by the Ansible process, and a cached read is only used again when the
+        C(X-Consul-Index) of its prefix has not changed.
     requirements:
       - 'python-consul python library U(https://python-consul.readthedocs.io/en/latest/#installation)'
     options:
       _raw:
         description: List of key(s) to retrieve.
         type: list
+      prefix:
+        description:
+          - Read all the keys under this prefix with a single recursive read, and answer the terms
+            whose key starts with it from that read instead of fetching every key.
+          - Terms with an I(index) are always read from Consul.
+        type: str
+        version_added: 1.0.0
       recurse:
         type: boolean
         description: If true, will retrieve all the values that have the given key as prefix.
@@ -92,6 +102,10 @@ EXAMPLES = """
   - name: retrieving a KV from a remote cluster on non default port
     debug:
       msg: "{{ lookup('consul_kv', 'my/key', host='10.10.10.10', port='2000') }}"
+
+  - name: Read many keys of the same tree with one request
+    debug:
+      msg: "{{ lookup('consul_kv', 'app/config/db_host', 'app/config/db_port', prefix='app/config/') }}"
 """
 
 RETURN = """
@@ -105,6 +119,7 @@ from ansible.module_utils.six.moves.urllib.parse import urlparse
 from ansible.errors import AnsibleError, AnsibleAssertionError
 from ansible.plugins.lookup import LookupBase
 from ansible.module_utils._text import to_text
+from ansible.module_utils.parsing.convert_bool import boolean
 
 try:
     import consul
@@ -113,6 +128,11 @@ try:
 except ImportError as e:
     HAS_CONSUL = False
 
+# Clients and recursive reads outlive lookup plugin instances, they are kept per process
+# so that a forked worker never shares the connections of its parent
+CONSUL_CLIENTS = {}
+RECURSE_CACHE = {}
+
 
 class LookupModule(LookupBase):
 
@@ -140,13 +160,32 @@ class LookupModule(LookupBase):
         validate_certs = self.get_option('validate_certs')
         client_cert = self.get_option('client_cert')
 
+        connection = (os.getpid(), scheme, host, port, validate_certs, client_cert)
+        if connection not in CONSUL_CLIENTS:
+            CONSUL_CLIENTS[connection] = consul.Consul(host=host, port=port, scheme=scheme, verify=validate_certs, cert=client_cert)
+        consul_api = CONSUL_CLIENTS[connection]
+
+        prefix = self.get_option('prefix')
+        revalidated = set()
+
         values = []
         try:
             for term in terms:
                 params = self.parse_params(term)
-                consul_api = consul.Consul(host=host, port=port, scheme=scheme, verify=validate_certs, cert=client_cert)
+                key = params['key']
+
+                if params['index'] is None and boolean(params['recurse']):
+                    for r in self.get_tree(consul_api, connection, key, params, revalidated):
+                        values.append(to_text(r['Value']))
+                    continue
 
-                results = consul_api.kv.get(params['key'],
+                if params['index'] is None and prefix and key.startswith(prefix):
+                    for r in self.get_tree(consul_api, connection, prefix, params, revalidated):
+                        if r['Key'] == key:
+                            values.append(to_text(r['Value']))
+                    continue
+
+                results = consul_api.kv.get(key,
                                             token=params['token'],
                                             index=params['index'],
                                             recurse=params['recurse'],
@@ -164,6 +203,24 @@ class LookupModule(LookupBase):
 
         return values
 
+    def get_tree(self, consul_api, connection, prefix, params, revalidated):
+        """Recursive read of prefix, from the cache if the X-Consul-Index of prefix is the one of the cached read"""
+        cache_key = (connection, prefix, params['token'], params['datacenter'])
+        cached = RECURSE_CACHE.get(cache_key)
+        if cached is not None:
+            if cache_key in revalidated:
+                return cached[1]
+            # Listing the keys returns the same index as reading the values, without the values
+            index = consul_api.kv.get(prefix, keys=True, token=params['token'], dc=params['datacenter'])[0]
+            revalidated.add(cache_key)
+            if index == cached[0]:
+                return cached[1]
+
+        index, data = consul_api.kv.get(prefix, recurse=True, token=params['token'], dc=params['datacenter'])
+        RECURSE_CACHE[cache_key] = (index, data or [])
+        revalidated.add(cache_key)
+        return RECURSE_CACHE[cache_key][1]
+
     def parse_params(self, term):
         params = term.split(' ')
 
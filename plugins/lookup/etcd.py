@@ -50,6 +50,19 @@ DOCUMENTATION = '''
                 - toggle checking that the ssl certificates are valid, you normally only want to turn this off with self-signed certs.
             default: True
             type: boolean
+        cache:
+            description:
+                - Keep the values read by the lookups of an Ansible process, and serve them again as long as
+                  the C(X-Etcd-Index) of the etcd server has not changed.
+                - The index is checked with a single C(HEAD) request per lookup, and any write to the
+                  etcd server invalidates all the cached values.
+            default: False
+            type: boolean
+            version_added: 1.0.0
+    notes:
+        - The connection to an etcd server is kept open and reused by the following lookups of the same
+          Ansible process, unless a proxy is configured for its url.
+        - Every key is read recursively, so a directory returns its whole subtree in one request.
 '''
 
 EXAMPLES = '''
@@ -61,6 +74,9 @@ EXAMPLES = '''
 
     - name: "since Ansible 2.5 you can set server options inline"
       debug: msg="{{ lookup('etcd', 'foo', version='v2', url='http://192.168.0.27:4001') }}"
+
+    - name: "values read again in the same run are served from the cache while etcd is unchanged"
+      debug: msg="{{ lookup('etcd', 'foo', 'bar', version='v2', cache=True) }}"
 '''
 
 RETURN = '''
@@ -72,8 +88,14 @@ RETURN = '''
 '''
 
 import json
+import os
+import socket
+import ssl
 
 from ansible.plugins.lookup import LookupBase
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 from ansible.module_utils.urls import open_url
 
 # this can be made configurable, not should not use ansible.cfg
@@ -101,6 +123,10 @@ from ansible.module_utils.urls import open_url
 #
 #
 
+# Servers and cached values outlive lookup plugin instances, they are kept per process
+# so that a forked worker never shares the connection of its parent
+ETCD_SERVERS = {}
+
 
 class Etcd:
     def __init__(self, url, version, validate_certs):
@@ -108,6 +134,69 @@ class Etcd:
         self.version = version
         self.baseurl = '%s/%s/keys' % (self.url, self.version)
         self.validate_certs = validate_certs
+        self.connection = None
+        self.index = None
+        self.values = {}
+
+        parsed = urlparse(url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.basepath = '%s/%s/keys' % (parsed.path.rstrip('/'), self.version)
+        # Keep-alive connections do not go through proxies, open_url does
+        self.keep_alive = self.scheme in ('http', 'https') and not (
+            self.scheme in getproxies() and not proxy_bypass(parsed.hostname or ''))
+
+    def _connect(self):
+        if self.scheme == 'https':
+            context = ssl.create_default_context()
+            if not self.validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            return http_client.HTTPSConnection(self.netloc, context=context)
+        return http_client.HTTPConnection(self.netloc)
+
+    def _request(self, method, path):
+        """Send a request on the kept-alive connection, reconnecting once if the server closed it"""
+        for attempt in (1, 2):
+            reused = self.connection is not None
+            if self.connection is None:
+                self.connection = self._connect()
+            try:
+                self.connection.request(method, path)
+                r = self.connection.getresponse()
+                data = r.read()
+            except (socket.error, http_client.HTTPException):
+                self.connection.close()
+                self.connection = None
+                if reused and attempt == 1:
+                    continue
+                raise
+            if r.getheader('connection', '').lower() == 'close':
+                self.connection.close()
+                self.connection = None
+            return r.status, r.getheader('x-etcd-index'), data
+
+    def _read(self, method, key, query='?recursive=true'):
+        """Return the status, the X-Etcd-Index header and the body of a read of key"""
+        if not self.keep_alive:
+            r = open_url("%s/%s%s" % (self.baseurl, key, query), method=method, validate_certs=self.validate_certs)
+            return r.getcode(), r.info().get('x-etcd-index'), r.read()
+        return self._request(method, "%s/%s%s" % (self.basepath, key, query))
+
+    def revalidate(self):
+        """Drop the cached values if the etcd index changed since they were read"""
+        try:
+            index = self._read('HEAD', '', query='')[1]
+        except Exception:
+            index = None
+        if index is None or index != self.index:
+            self.values = {}
+        self.index = index
+
+    def get_cached(self, key):
+        if key not in self.values:
+            self.values[key] = self.get(key)
+        return self.values[key]
 
     def _parse_node(self, node):
         # This function will receive all etcd tree,
@@ -127,14 +216,15 @@ class Etcd:
         return path
 
     def get(self, key):
-        url = "%s/%s?recursive=true" % (self.baseurl, key)
         data = None
         value = {}
         try:
-            r = open_url(url, validate_certs=self.validate_certs)
-            data = r.read()
+            status, index, data = self._read('GET', key)
         except Exception:
             return None
+        # open_url raises on errors such as a missing key
+        if status >= 400:
+            return None
 
         try:
             # I will not support Version 1 of etcd for folder parsing
@@ -167,11 +257,21 @@ class LookupModule(LookupBase):
         url = self.get_option('url')
         version = self.get_option('version')
 
-        etcd = Etcd(url=url, version=version, validate_certs=validate_certs)
+        server = (os.getpid(), url, version, validate_certs)
+        if server not in ETCD_SERVERS:
+            ETCD_SERVERS[server] = Etcd(url=url, version=version, validate_certs=validate_certs)
+        etcd = ETCD_SERVERS[server]
+
+        cache = self.get_option('cache')
+        if cache:
+            etcd.revalidate()
 
         ret = []
         for term in terms:
             key = term.split()[0]
-            value = etcd.get(key)
+            if cache:
+                value = etcd.get_cached(key)
+            else:
+                value = etcd.get(key)
             ret.append(value)
         return ret
@@ -86,11 +86,23 @@ DOCUMENTATION = '''
             env:
             - name: ETCDCTL_PASSWORD
             type: str
+        cache:
+            description:
+            - Keep the results of the lookups of an Ansible process, and serve them again as long as the
+              raft index of the etcd3 server has not changed.
+            - The raft index is read with a single status request per lookup, and any write to the
+              etcd3 server invalidates all the cached results.
+            type: bool
+            default: False
+            version_added: 1.0.0
 
     notes:
     - I(host) and I(port) options take precedence over (endpoints) option.
     - The recommanded way to connect to etcd3 server is using C(ETCDCTL_ENDPOINT)
       environment variable and keep I(endpoints), I(host), and I(port) unused.
+    - Clients are reused by the following lookups of the same Ansible process that use the same
+      connection parameters.
+    - With I(prefix), every key of the prefix is read with a single range request.
     seealso:
     - module: etcd3
     - ref: etcd_lookup
@@ -112,6 +124,10 @@ EXAMPLES = '''
       debug:
         msg: "{{ lookup('community.general.etcd3', '/foo/bar', prefix=True) }}"
 
+    - name: "read a prefix once and reuse it while etcd3 is unchanged"
+      debug:
+        msg: "{{ lookup('community.general.etcd3', '/foo/bar', prefix=True, cache=True) }}"
+
     - name: "connect to etcd3 with a client certificate"
       debug:
         msg: "{{ lookup('community.general.etcd3', 'foo/bar', cert_cert='/etc/ssl/etcd/client.pem', cert_key='/etc/ssl/etcd/client.key') }}"
@@ -132,9 +148,9 @@ RETURN = '''
                 type: str
 '''
 
+import os
 import re
 
-from ansible.plugins.lookup import LookupBase
 from ansible.utils.display import Display
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils._text import to_native
@@ -149,6 +165,10 @@ except ImportError:
 
 display = Display()
 
+# Clients and cached results outlive lookup plugin instances, they are kept per process
+# so that a forked worker never shares the gRPC channel of its parent
+ETCD3_CLIENTS = {}
+
 etcd3_cnx_opts = (
     'host',
     'port',
@@ -205,24 +225,55 @@ class LookupModule(LookupBase):
             cnx_log['password'] = '<redacted>'
         display.verbose("etcd3 connection parameters: %s" % cnx_log)
 
-        # connect to etcd3 server
-        etcd = etcd3_client(client_params)
+        # connect to etcd3 server, or reuse the client of a previous lookup
+        cnx_key = (os.getpid(), tuple(sorted(client_params.items())))
+        if cnx_key not in ETCD3_CLIENTS:
+            ETCD3_CLIENTS[cnx_key] = {'client': etcd3_client(client_params), 'raft_index': None, 'results': {}}
+        cnx = ETCD3_CLIENTS[cnx_key]
+        etcd = cnx['client']
+
+        cache = self.get_option('cache')
+        if cache:
+            try:
+                raft_index = etcd.status().raft_index
+            except Exception as exp:
+                display.warning('Caught except during etcd3.status: %s' % (to_native(exp)))
+                raft_index = None
+            if raft_index is None or raft_index != cnx['raft_index']:
+                cnx['results'] = {}
+            cnx['raft_index'] = raft_index
 
         ret = []
         # we can pass many keys to lookup
         for term in terms:
+            result_key = (term, self.get_option('prefix'))
+            if cache and result_key in cnx['results']:
+                ret.extend(cnx['results'][result_key])
+                continue
+
+            result = []
+            failed = False
             if self.get_option('prefix'):
                 try:
                     for val, meta in etcd.get_prefix(term):
                         if val and meta:
-                            ret.append({'key': to_native(meta.key), 'value': to_native(val)})
+                            result.append({'key': to_native(meta.key), 'value': to_native(val)})
                 except Exception as exp:
+                    failed = True
                     display.warning('Caught except during etcd3.get_prefix: %s' % (to_native(exp)))
             else:
                 try:
                     val, meta = etcd.get(term)
                     if val and meta:
-                        ret.append({'key': to_native(meta.key), 'value': to_native(val)})
+                        result.append({'key': to_native(meta.key), 'value': to_native(val)})
                 except Exception as exp:
+                    failed = True
                     display.warning('Caught except during etcd3.get: %s' % (to_native(exp)))
+
+            if failed:
+                # The channel may be broken, the next lookup connects again
+                ETCD3_CLIENTS.pop(cnx_key, None)
+            elif cache:
+                cnx['results'][result_key] = result
+            ret.extend(result)
         return ret
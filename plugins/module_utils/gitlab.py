@@ -67,6 +67,29 @@ def findProject(gitlab_instance, identifier):
     return project
 
 
+def indexProjects(gitlab_instance, identifiers):
+    """Return a dict of the projects matching identifiers (paths or ids), indexed by identifier.
+
+    The projects are resolved from a single paginated listing of the projects of the authenticated user,
+    the ones missing from the listing are looked up one by one and are None when they do not exist."""
+    wanted = set(identifiers)
+    index = {}
+    try:
+        for project in gitlab_instance.projects.list(as_list=False, membership=True, simple=True, per_page=100):
+            for identifier in (project.path_with_namespace, str(project.id)):
+                if identifier in wanted:
+                    index[identifier] = project
+            if len(index) == len(wanted):
+                break
+    except Exception:
+        pass
+
+    for identifier in wanted - set(index):
+        index[identifier] = findProject(gitlab_instance, identifier)
+
+    return index
+
+
 def findGroup(gitlab_instance, identifier):
     try:
         project = gitlab_instance.groups.get(identifier)
@@ -29,12 +29,17 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import hashlib
 import json
+import os
+import tempfile
+import time
 
 from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.six.moves.urllib.error import HTTPError
-from ansible.module_utils._text import to_native
+from ansible.module_utils._text import to_bytes, to_native
+from ansible_collections.community.general.plugins.module_utils.keep_alive import KeepAliveClient
 
 URL_TOKEN = "{url}/realms/{realm}/protocol/openid-connect/token"
 URL_CLIENT = "{url}/admin/realms/{realm}/clients/{id}"
@@ -47,6 +52,10 @@ URL_CLIENTTEMPLATES = "{url}/admin/realms/{realm}/client-templates"
 URL_GROUPS = "{url}/admin/realms/{realm}/groups"
 URL_GROUP = "{url}/admin/realms/{realm}/groups/{groupid}"
 
+TOKEN_CACHE_PATH = os.path.expanduser('~/.ansible/tmp/keycloak-tokens.json')
+# Cached tokens are not used anymore this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 30
+
 
 def keycloak_argument_spec():
     """
@@ -61,7 +70,8 @@ def keycloak_argument_spec():
         auth_client_secret=dict(type='str', default=None),
         auth_username=dict(type='str', aliases=['username'], required=True),
         auth_password=dict(type='str', aliases=['password'], required=True, no_log=True),
-        validate_certs=dict(type='bool', default=True)
+        validate_certs=dict(type='bool', default=True),
+        token_cache=dict(type='bool', default=False),
     )
 
 
@@ -73,23 +83,14 @@ class KeycloakError(Exception):
     pass
 
 
-def get_token(base_url, validate_certs, auth_realm, client_id,
-              auth_username, auth_password, client_secret):
-    auth_url = URL_TOKEN.format(url=base_url, realm=auth_realm)
-    temp_payload = {
-        'grant_type': 'password',
-        'client_id': client_id,
-        'client_secret': client_secret,
-        'username': auth_username,
-        'password': auth_password,
-    }
+def _request_token(auth_url, validate_certs, temp_payload):
     # Remove empty items, for instance missing client_secret
     payload = dict(
         (k, v) for k, v in temp_payload.items() if v is not None)
     try:
-        r = json.loads(to_native(open_url(auth_url, method='POST',
-                                          validate_certs=validate_certs,
-                                          data=urlencode(payload)).read()))
+        return json.loads(to_native(open_url(auth_url, method='POST',
+                                             validate_certs=validate_certs,
+                                             data=urlencode(payload)).read()))
     except ValueError as e:
         raise KeycloakError(
             'API returned invalid JSON when trying to obtain access token from %s: %s'
@@ -98,8 +99,82 @@ def get_token(base_url, validate_certs, auth_realm, client_id,
         raise KeycloakError('Could not obtain access token from %s: %s'
                             % (auth_url, str(e)))
 
+
+def _read_token_cache():
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def _write_token_cache(cache):
+    """ Write the token cache, dropping the tokens which cannot be used nor refreshed anymore.
+    The cache is only readable by its owner, and replaced atomically.
+    """
+    now = time.time()
+    cache = dict((k, v) for k, v in cache.items() if max(v['expires_at'], v['refresh_expires_at']) > now)
+    cache_dir = os.path.dirname(TOKEN_CACHE_PATH)
     try:
-        return {
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, 0o700)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.rename(tmp_path, TOKEN_CACHE_PATH)
+    except (IOError, OSError):
+        # The cache is only an optimization
+        pass
+
+
+def get_token(base_url, validate_certs, auth_realm, client_id,
+              auth_username, auth_password, client_secret, token_cache=False):
+    """ Obtain an access token and return the headers to use it
+
+    With token_cache, the tokens are cached in TOKEN_CACHE_PATH. A cached access token is reused
+    until it expires, then its refresh token is used, and a new password grant is only done when
+    the refresh fails or the refresh token has expired too.
+    """
+    auth_url = URL_TOKEN.format(url=base_url, realm=auth_realm)
+    temp_payload = {
+        'grant_type': 'password',
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'username': auth_username,
+        'password': auth_password,
+    }
+
+    cache = {}
+    cached = None
+    if token_cache:
+        # The secrets are part of the key, so a token is only reused with the credentials which obtained it
+        cache_key = hashlib.sha256(to_bytes(json.dumps(
+            [base_url, auth_realm, client_id, auth_username, auth_password, client_secret]))).hexdigest()
+        cache = _read_token_cache()
+        cached = cache.get(cache_key)
+
+    now = time.time()
+    r = None
+    if cached is not None and cached['expires_at'] > now:
+        r = {'access_token': cached['access_token']}
+    elif cached is not None and cached['refresh_expires_at'] > now:
+        try:
+            r = _request_token(auth_url, validate_certs, {
+                'grant_type': 'refresh_token',
+                'client_id': client_id,
+                'client_secret': client_secret,
+                'refresh_token': cached['refresh_token'],
+            })
+        except KeycloakError:
+            r = None
+        if r is not None and 'access_token' not in r:
+            r = None
+
+    if r is None:
+        r = _request_token(auth_url, validate_certs, temp_payload)
+
+    try:
+        headers = {
             'Authorization': 'Bearer ' + r['access_token'],
             'Content-Type': 'application/json'
         }
@@ -107,6 +182,18 @@ def get_token(base_url, validate_certs, auth_realm, client_id,
         raise KeycloakError(
             'Could not obtain access token from %s' % auth_url)
 
+    if token_cache and 'expires_in' in r:
+        # A refresh_expires_in of 0 is an offline token, which is not refreshed here
+        cache[cache_key] = {
+            'access_token': r['access_token'],
+            'expires_at': now + r['expires_in'] - TOKEN_EXPIRY_MARGIN,
+            'refresh_token': r.get('refresh_token'),
+            'refresh_expires_at': now + r.get('refresh_expires_in', 0) - TOKEN_EXPIRY_MARGIN if r.get('refresh_token') else 0,
+        }
+        _write_token_cache(cache)
+
+    return headers
+
 
 class KeycloakAPI(object):
     """ Keycloak API access; Keycloak uses OAuth 2.0 to protect its API, an access token for which
@@ -118,6 +205,20 @@ class KeycloakAPI(object):
         self.validate_certs = self.module.params.get('validate_certs')
         self.restheaders = connection_header
 
+        # All the requests share a kept-alive connection when possible
+        self.client = KeepAliveClient(self.baseurl, validate_certs=self.validate_certs)
+
+    def _open(self, url, method='GET', data=None):
+        """ Send a request to the API, on the kept-alive connection when possible
+
+        :param url: URL of the request
+        :param method: HTTP method of the request
+        :param data: body of the request
+        :return: file-like object with the body of the response
+        :raise HTTPError: if the response status is an error, like open_url
+        """
+        return self.client.open(url, method=method, headers=self.restheaders, data=data)
+
     def get_clients(self, realm='master', filter=None):
         """ Obtains client representations for clients in a realm
 
@@ -130,8 +231,7 @@ class KeycloakAPI(object):
             clientlist_url += '?clientId=%s' % filter
 
         try:
-            return json.loads(to_native(open_url(clientlist_url, method='GET', headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(clientlist_url, method='GET').read()))
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain list of clients for realm %s: %s'
                                       % (realm, str(e)))
@@ -161,8 +261,7 @@ class KeycloakAPI(object):
         client_url = URL_CLIENT.format(url=self.baseurl, realm=realm, id=id)
 
         try:
-            return json.loads(to_native(open_url(client_url, method='GET', headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(client_url, method='GET').read()))
 
         except HTTPError as e:
             if e.code == 404:
@@ -200,8 +299,7 @@ class KeycloakAPI(object):
         client_url = URL_CLIENT.format(url=self.baseurl, realm=realm, id=id)
 
         try:
-            return open_url(client_url, method='PUT', headers=self.restheaders,
-                            data=json.dumps(clientrep), validate_certs=self.validate_certs)
+            return self._open(client_url, method='PUT', data=json.dumps(clientrep))
         except Exception as e:
             self.module.fail_json(msg='Could not update client %s in realm %s: %s'
                                       % (id, realm, str(e)))
@@ -215,8 +313,7 @@ class KeycloakAPI(object):
         client_url = URL_CLIENTS.format(url=self.baseurl, realm=realm)
 
         try:
-            return open_url(client_url, method='POST', headers=self.restheaders,
-                            data=json.dumps(clientrep), validate_certs=self.validate_certs)
+            return self._open(client_url, method='POST', data=json.dumps(clientrep))
         except Exception as e:
             self.module.fail_json(msg='Could not create client %s in realm %s: %s'
                                       % (clientrep['clientId'], realm, str(e)))
@@ -231,8 +328,7 @@ class KeycloakAPI(object):
         client_url = URL_CLIENT.format(url=self.baseurl, realm=realm, id=id)
 
         try:
-            return open_url(client_url, method='DELETE', headers=self.restheaders,
-                            validate_certs=self.validate_certs)
+            return self._open(client_url, method='DELETE')
         except Exception as e:
             self.module.fail_json(msg='Could not delete client %s in realm %s: %s'
                                       % (id, realm, str(e)))
@@ -246,8 +342,7 @@ class KeycloakAPI(object):
         url = URL_CLIENTTEMPLATES.format(url=self.baseurl, realm=realm)
 
         try:
-            return json.loads(to_native(open_url(url, method='GET', headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(url, method='GET').read()))
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain list of client templates for realm %s: %s'
                                       % (realm, str(e)))
@@ -265,8 +360,7 @@ class KeycloakAPI(object):
         url = URL_CLIENTTEMPLATE.format(url=self.baseurl, id=id, realm=realm)
 
         try:
-            return json.loads(to_native(open_url(url, method='GET', headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(url, method='GET').read()))
         except ValueError as e:
             self.module.fail_json(msg='API returned incorrect JSON when trying to obtain client templates %s for realm %s: %s'
                                       % (id, realm, str(e)))
@@ -311,8 +405,7 @@ class KeycloakAPI(object):
         url = URL_CLIENTTEMPLATE.format(url=self.baseurl, realm=realm, id=id)
 
         try:
-            return open_url(url, method='PUT', headers=self.restheaders,
-                            data=json.dumps(clienttrep), validate_certs=self.validate_certs)
+            return self._open(url, method='PUT', data=json.dumps(clienttrep))
         except Exception as e:
             self.module.fail_json(msg='Could not update client template %s in realm %s: %s'
                                       % (id, realm, str(e)))
@@ -326,8 +419,7 @@ class KeycloakAPI(object):
         url = URL_CLIENTTEMPLATES.format(url=self.baseurl, realm=realm)
 
         try:
-            return open_url(url, method='POST', headers=self.restheaders,
-                            data=json.dumps(clienttrep), validate_certs=self.validate_certs)
+            return self._open(url, method='POST', data=json.dumps(clienttrep))
         except Exception as e:
             self.module.fail_json(msg='Could not create client template %s in realm %s: %s'
                                       % (clienttrep['clientId'], realm, str(e)))
@@ -342,8 +434,7 @@ class KeycloakAPI(object):
         url = URL_CLIENTTEMPLATE.format(url=self.baseurl, realm=realm, id=id)
 
         try:
-            return open_url(url, method='DELETE', headers=self.restheaders,
-                            validate_certs=self.validate_certs)
+            return self._open(url, method='DELETE')
         except Exception as e:
             self.module.fail_json(msg='Could not delete client template %s in realm %s: %s'
                                       % (id, realm, str(e)))
@@ -358,8 +449,7 @@ class KeycloakAPI(object):
         """
         groups_url = URL_GROUPS.format(url=self.baseurl, realm=realm)
         try:
-            return json.loads(to_native(open_url(groups_url, method="GET", headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(groups_url, method="GET").read()))
         except Exception as e:
             self.module.fail_json(msg="Could not fetch list of groups in realm %s: %s"
                                       % (realm, str(e)))
@@ -375,8 +465,7 @@ class KeycloakAPI(object):
         """
         groups_url = URL_GROUP.format(url=self.baseurl, realm=realm, groupid=gid)
         try:
-            return json.loads(to_native(open_url(groups_url, method="GET", headers=self.restheaders,
-                                                 validate_certs=self.validate_certs).read()))
+            return json.loads(to_native(self._open(groups_url, method="GET").read()))
 
         except HTTPError as e:
             if e.code == 404:
@@ -421,8 +510,7 @@ class KeycloakAPI(object):
         """
         groups_url = URL_GROUPS.format(url=self.baseurl, realm=realm)
         try:
-            return open_url(groups_url, method='POST', headers=self.restheaders,
-                            data=json.dumps(grouprep), validate_certs=self.validate_certs)
+            return self._open(groups_url, method='POST', data=json.dumps(grouprep))
         except Exception as e:
             self.module.fail_json(msg="Could not create group %s in realm %s: %s"
                                       % (grouprep['name'], realm, str(e)))
@@ -436,8 +524,7 @@ class KeycloakAPI(object):
         group_url = URL_GROUP.format(url=self.baseurl, realm=realm, groupid=grouprep['id'])
 
         try:
-            return open_url(group_url, method='PUT', headers=self.restheaders,
-                            data=json.dumps(grouprep), validate_certs=self.validate_certs)
+            return self._open(group_url, method='PUT', data=json.dumps(grouprep))
         except Exception as e:
             self.module.fail_json(msg='Could not update group %s in realm %s: %s'
                                       % (grouprep['name'], realm, str(e)))
@@ -473,8 +560,7 @@ class KeycloakAPI(object):
         # should have a good groupid by here.
         group_url = URL_GROUP.format(realm=realm, groupid=groupid, url=self.baseurl)
         try:
-            return open_url(group_url, method='DELETE', headers=self.restheaders,
-                            validate_certs=self.validate_certs)
+            return self._open(group_url, method='DELETE')
 
         except Exception as e:
             self.module.fail_json(msg="Unable to delete group %s: %s" % (groupid, str(e)))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import socket
+import ssl
+
+from ansible.module_utils.urls import open_url
+from ansible.module_utils.six import BytesIO
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urljoin, urlparse
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils._text import to_bytes
+
+
+class KeepAliveResponse(BytesIO):
+    """ Body of a response received on a kept-alive connection, with the interface of an open_url response."""
+
+    def __init__(self, url, status, reason, headers, body):
+        BytesIO.__init__(self, body)
+        self.url = url
+        self.status = self.code = status
+        self.reason = self.msg = reason
+        self.headers = headers
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+
+class KeepAliveClient(object):
+    """ Sends the requests to one HTTP(S) server on a single kept-alive connection.
+
+    open() behaves like open_url(): it returns a file-like response and raises HTTPError for
+    error statuses. The requests go through open_url() instead when the kept-alive connection
+    cannot do the same:
+      - when a proxy applies to the server,
+      - when the system default CA bundle is empty and certificates are validated, open_url()
+        looks for a bundle in more places,
+      - to follow a redirection, with the same method and body changes as open_url().
+    """
+
+    def __init__(self, base_url, validate_certs=True, ca_path=None, http_agent='ansible-httpget', timeout=10):
+        parsed = urlparse(base_url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.validate_certs = validate_certs
+        self.ca_path = ca_path
+        self.http_agent = http_agent
+        self.timeout = timeout
+        self.connection = None
+        self.context = None
+        self.keep_alive = self.scheme in ('http', 'https') and not (
+            self.scheme in getproxies() and not proxy_bypass(parsed.hostname or ''))
+        if self.keep_alive and self.scheme == 'https':
+            self.context = ssl.create_default_context(cafile=ca_path)
+            if not validate_certs:
+                self.context.check_hostname = False
+                self.context.verify_mode = ssl.CERT_NONE
+            elif not self.context.cert_store_stats()['x509_ca']:
+                self.keep_alive = False
+
+    def _connect(self):
+        if self.scheme == 'https':
+            return http_client.HTTPSConnection(self.netloc, timeout=self.timeout, context=self.context)
+        return http_client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def _open_url(self, url, method, headers, data):
+        return open_url(url, method=method, headers=headers, data=data, validate_certs=self.validate_certs,
+                        ca_path=self.ca_path, http_agent=self.http_agent, timeout=self.timeout)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def open(self, url, method='GET', headers=None, data=None):
+        """ Send a request, on the kept-alive connection when possible
+
+        :param url: URL of the request, on the server of the client
+        :param method: HTTP method of the request
+        :param headers: dict of headers of the request
+        :param data: body of the request
+        :return: file-like object with the body of the response
+        :raise HTTPError: if the response status is an error, like open_url
+        """
+        headers = dict(headers or {})
+        data = to_bytes(data, nonstring='passthru')
+        parsed = urlparse(url)
+        if not self.keep_alive or (parsed.scheme, parsed.netloc) != (self.scheme, self.netloc):
+            return self._open_url(url, method, headers, data)
+
+        request_headers = dict(headers)
+        request_headers.setdefault('User-Agent', self.http_agent)
+        if data is not None:
+            request_headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+        path = parsed.path + ('?' + parsed.query if parsed.query else '')
+        for attempt in (1, 2):
+            # Reconnect once if the server closed the kept-alive connection
+            reused = self.connection is not None
+            if self.connection is None:
+                self.connection = self._connect()
+            try:
+                self.connection.request(method, path, body=data, headers=request_headers)
+                response = self.connection.getresponse()
+                body = response.read()
+            except (socket.error, http_client.HTTPException):
+                self.close()
+                if reused and attempt == 1:
+                    continue
+                raise
+            break
+
+        if response.getheader('connection', '').lower() == 'close':
+            self.close()
+
+        location = response.getheader('location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            # Same changes of the request as the urllib redirection handler used by open_url
+            if response.status in (301, 302, 303) and method not in ('GET', 'HEAD'):
+                method, data = 'GET', None
+                headers = dict((k, v) for k, v in headers.items() if k.lower() not in ('content-type', 'content-length'))
+            return self._open_url(urljoin(url, location), method, headers, data)
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.msg, BytesIO(body))
+        return KeepAliveResponse(url, response.status, response.reason, response.msg, body)
@@ -68,32 +68,80 @@ class LXDClient(object):
             parts = generic_urlparse(urlparse(self.url))
             ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
             ctx.load_cert_chain(cert_file, keyfile=key_file)
-            self.connection = HTTPSConnection(parts.get('netloc'), context=ctx)
+            self._new_connection = lambda: HTTPSConnection(parts.get('netloc'), context=ctx)
         elif url.startswith('unix:'):
             unix_socket_path = url[len('unix:'):]
-            self.connection = UnixHTTPConnection(unix_socket_path)
+            self._new_connection = lambda: UnixHTTPConnection(unix_socket_path)
         else:
             raise LXDClientException('URL scheme must be unix: or https:')
-
-    def do(self, method, url, body_json=None, ok_error_codes=None, timeout=None):
+        self.connection = self._new_connection()
+        # Whether a response was already read from the current connection. A reused
+        # keep-alive connection may have been closed by the server in the meantime.
+        self._connection_reused = False
+
+    def do(self, method, url, body_json=None, ok_error_codes=None, timeout=None, wait=True):
+        """Send a request, and wait for its operation to finish if the request is asynchronous.
+
+        :param timeout: The maximum time in seconds to wait for the operation.
+        :type timeout: ``int``
+        :param wait: Whether to wait for asynchronous operations. When false, the response
+                     of an asynchronous request is returned as is, so that several operations
+                     can run concurrently on the server and be waited for with ``wait_operation``.
+        :type wait: ``bool``
+        """
         resp_json = self._send_request(method, url, body_json=body_json, ok_error_codes=ok_error_codes, timeout=timeout)
-        if resp_json['type'] == 'async':
-            url = '{0}/wait'.format(resp_json['operation'])
-            resp_json = self._send_request('GET', url)
-            if resp_json['metadata']['status'] != 'Success':
-                self._raise_err_from_json(resp_json)
+        if resp_json['type'] == 'async' and wait:
+            resp_json = self.wait_operation(resp_json['operation'], timeout=timeout)
+        return resp_json
+
+    def wait_operation(self, operation, timeout=None):
+        """Wait for an operation to finish using the operation wait endpoint.
+
+        :param operation: The URL of the operation, as returned in an asynchronous response.
+        :type operation: ``str``
+        :param timeout: The maximum time in seconds to wait, or None to wait until the operation finishes.
+        :type timeout: ``int``
+        """
+        url = '{0}/wait'.format(operation)
+        if timeout is not None:
+            url = '{0}?timeout={1}'.format(url, timeout)
+        resp_json = self._send_request('GET', url)
+        if resp_json['metadata']['status'] in ('Pending', 'Running'):
+            raise LXDClientException('timeout waiting for operation {0}'.format(operation))
+        if resp_json['metadata']['status'] != 'Success':
+            self._raise_err_from_json(resp_json)
         return resp_json
 
     def authenticate(self, trust_password):
         body_json = {'type': 'client', 'password': trust_password}
         return self._send_request('POST', '/1.0/certificates', body_json=body_json)
 
-    def _send_request(self, method, url, body_json=None, ok_error_codes=None, timeout=None):
+    def _request(self, method, url, body):
         try:
-            body = json.dumps(body_json)
             self.connection.request(method, url, body=body)
             resp = self.connection.getresponse()
             resp_data = resp.read()
+        except (socket.error, http_client.HTTPException):
+            self.connection.close()
+            if not self._connection_reused:
+                raise
+            # The server closed the idle keep-alive connection, retry once with a new one.
+            self.connection = self._new_connection()
+            self._connection_reused = False
+            self.connection.request(method, url, body=body)
+            resp = self.connection.getresponse()
+            resp_data = resp.read()
+        if resp.will_close:
+            self.connection.close()
+            self._connection_reused = False
+        else:
+            self._connection_reused = True
+        return resp_data
+
+    def _send_request(self, method, url, body_json=None, ok_error_codes=None, timeout=None):
+        try:
+            body = json.dumps(body_json)
+            resp_data = self._request(method, url, body)
             resp_data = to_text(resp_data, errors='surrogate_or_strict')
             resp_json = json.loads(resp_data)
             self.logs.append({
@@ -109,7 +157,7 @@ class LXDClient(object):
                     return resp_json
                 self._raise_err_from_json(resp_json)
             return resp_json
-        except socket.error as e:
+        except (socket.error, http_client.HTTPException) as e:
             raise LXDClientException('cannot connect to the LXD server', err=e)
 
     def _raise_err_from_json(self, resp_json):
@@ -39,8 +39,18 @@ class OpenNebulaModule:
         wait_timeout=dict(type='int', default=300),
     )
 
+    # Pools that can be cached: the pool client and the name of its element list.
+    pools = dict(
+        host=('hostpool', 'HOST'),
+        cluster=('clusterpool', 'CLUSTER'),
+        template=('templatepool', 'VMTEMPLATE'),
+    )
+
     def __init__(self, argument_spec, supports_check_mode=False, mutually_exclusive=None):
 
+        self.pool_cache = dict()
+        self.pool_indexes = dict()
+
         module_args = OpenNebulaModule.common_args
         module_args.update(argument_spec)
 
@@ -132,10 +142,9 @@ class OpenNebulaModule:
         resolved_params = dict(self.module.params)
 
         if 'cluster_name' in self.module.params:
-            clusters = self.one.clusterpool.info()
-            for cluster in clusters.CLUSTER:
-                if cluster.NAME == self.module.params.get('cluster_name'):
-                    resolved_params['cluster_id'] = cluster.ID
+            cluster = self.get_cluster_by_name(self.module.params.get('cluster_name'))
+            if cluster is not None:
+                resolved_params['cluster_id'] = cluster.ID
 
         return resolved_params
 
@@ -157,6 +166,52 @@ class OpenNebulaModule:
         """
         return self.resolved_parameters.get(name)
 
+    def get_pool(self, pool_name):
+        '''
+        Returns the elements of an OpenNebula pool. The pool is only fetched once
+        until it is invalidated.
+        Args:
+            pool_name: the name of the pool, one of the keys of pools: host, cluster, template
+
+        Returns: the list of elements in the pool.
+
+        '''
+        if pool_name not in self.pool_cache:
+            pool_client, element_name = self.pools[pool_name]
+            self.pool_cache[pool_name] = getattr(getattr(self.one, pool_client).info(), element_name)
+        return self.pool_cache[pool_name]
+
+    def get_pool_index(self, pool_name, attribute='NAME'):
+        '''
+        Returns a dictionary of the elements of an OpenNebula pool by one of their attributes.
+        When several elements have the same value, the first one in the pool is kept.
+        Args:
+            pool_name: the name of the pool
+            attribute: the attribute to index the elements by
+
+        Returns: the index of the pool.
+
+        '''
+        key = (pool_name, attribute)
+        if key not in self.pool_indexes:
+            index = dict()
+            for element in self.get_pool(pool_name):
+                index.setdefault(getattr(element, attribute), element)
+            self.pool_indexes[key] = index
+        return self.pool_indexes[key]
+
+    def invalidate_pool(self, pool_name):
+        '''
+        Drops the cached elements and indexes of a pool, must be called after changing any of its elements.
+        Args:
+            pool_name: the name of the pool
+
+        '''
+        self.pool_cache.pop(pool_name, None)
+        for key in list(self.pool_indexes):
+            if key[0] == pool_name:
+                del self.pool_indexes[key]
+
     def get_host_by_name(self, name):
         '''
         Returns a host given its name.
@@ -166,11 +221,7 @@ class OpenNebulaModule:
         Returns: the host object or None if the host is absent.
 
         '''
-        hosts = self.one.hostpool.info()
-        for h in hosts.HOST:
-            if h.NAME == name:
-                return h
-        return None
+        return self.get_pool_index('host').get(name)
 
     def get_cluster_by_name(self, name):
         """
@@ -181,11 +232,7 @@ class OpenNebulaModule:
         Returns: the cluster object or None if the host is absent.
         """
 
-        clusters = self.one.clusterpool.info()
-        for c in clusters.CLUSTER:
-            if c.NAME == name:
-                return c
-        return None
+        return self.get_pool_index('cluster').get(name)
 
     def get_template_by_name(self, name):
         '''
@@ -196,11 +243,7 @@ class OpenNebulaModule:
         Returns: the template object or None if the host is absent.
 
         '''
-        templates = self.one.templatepool.info()
-        for t in templates.TEMPLATE:
-            if t.NAME == name:
-                return t
-        return None
+        return self.get_pool_index('template').get(name)
 
     def cast_template(self, template):
         """
@@ -5,6 +5,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+from multiprocessing.pool import ThreadPool
+
 from ansible.module_utils.urls import open_url
 from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves import http_client
@@ -25,6 +27,32 @@ DEPRECATE_MSG = 'Issuing a data modification command without specifying the '\
                 'target %(resource)s ID'
 
 
+def run_on_baseuris(baseuris, func, concurrency=10):
+    """
+    Call func for every OOB controller in baseuris on a bounded pool of threads
+    :param baseuris: list of base URIs of OOB controllers
+    :param func: function taking a base URI and returning a {'ret': ...} dict
+    :param concurrency: maximum number of controllers handled at the same time
+    :return: list of the results of func, in the order of baseuris
+    """
+    def run(baseuri):
+        try:
+            return func(baseuri)
+        # A single controller must not abort the others
+        except Exception as e:
+            return {'ret': False,
+                    'msg': "Failed on OOB controller '%s': '%s'" % (baseuri, to_text(e))}
+
+    if not baseuris:
+        return []
+    pool = ThreadPool(max(1, min(concurrency, len(baseuris))))
+    try:
+        return pool.map(run, baseuris)
+    finally:
+        pool.close()
+        pool.join()
+
+
 class RedfishUtils(object):
 
     def __init__(self, creds, root_uri, timeout, module, resource_id=None,
@@ -36,6 +64,7 @@ class RedfishUtils(object):
         self.service_root = '/redfish/v1/'
         self.resource_id = resource_id
         self.data_modification = data_modification
+        self._service_root_response = None
         self._init_session()
 
     # The following functions are to send GET/POST/PATCH/DELETE requests
@@ -170,8 +199,17 @@ class RedfishUtils(object):
     def _init_session(self):
         pass
 
+    def _get_service_root(self):
+        """GET the service root, reusing the first successful response for later resource lookups"""
+        if self._service_root_response is None:
+            response = self.get_request(self.root_uri + self.service_root)
+            if response['ret'] is False:
+                return response
+            self._service_root_response = response
+        return self._service_root_response
+
     def _find_accountservice_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -190,7 +228,7 @@ class RedfishUtils(object):
         return {'ret': True}
 
     def _find_sessionservice_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -219,7 +257,7 @@ class RedfishUtils(object):
         return None
 
     def _find_systems_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -249,7 +287,7 @@ class RedfishUtils(object):
         return {'ret': True}
 
     def _find_updateservice_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -270,7 +308,7 @@ class RedfishUtils(object):
             return {'ret': True}
 
     def _find_chassis_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -300,7 +338,7 @@ class RedfishUtils(object):
         return {'ret': True}
 
     def _find_managers_resource(self):
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
@@ -1120,7 +1158,7 @@ class RedfishUtils(object):
         account_properties = user.get('account_properties')
 
         # Find AccountService
-        response = self.get_request(self.root_uri + self.service_root)
+        response = self._get_service_root()
         if response['ret'] is False:
             return response
         data = response['data']
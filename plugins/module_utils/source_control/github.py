@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils._text import to_bytes, to_native, to_text
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.urls import fetch_url, basic_auth_header
+
+
+ETAG_CACHE_PATH = os.path.expanduser('~/.ansible/tmp/github-etags.json')
+
+
+class GitHubAPIError(Exception):
+    def __init__(self, msg, status=None):
+        super(GitHubAPIError, self).__init__(msg)
+        self.status = status
+
+
+class GitHubAPI(object):
+    """ Read only access to the GitHub REST API for many repositories.
+
+    GET requests are conditional: with etag_cache, the ETag and the content of the responses are cached in
+    ETAG_CACHE_PATH, and a response which did not change (304) is served from the cache. GitHub does not
+    count these requests against the rate limit.
+    """
+
+    def __init__(self, module, base_url='https://api.github.com', user=None, password=None, token=None, etag_cache=True):
+        self.module = module
+        self.base_url = base_url.rstrip('/')
+        self.headers = {'Accept': 'application/vnd.github.v3+json'}
+        if token and not user:
+            self.headers['Authorization'] = 'token %s' % token
+        elif password or token:
+            self.headers['Authorization'] = basic_auth_header(user, password or token)
+        # Responses differ between credentials, so they are cached apart
+        self.cache_prefix = hashlib.sha256(to_bytes(self.headers.get('Authorization', ''))).hexdigest()[:16] + ' '
+        self.etag_cache = etag_cache
+        self.cache = self._read_cache() if etag_cache else {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _read_cache():
+        try:
+            with open(ETAG_CACHE_PATH) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def save_cache(self):
+        """ Write the cache, only readable by its owner, and replaced atomically."""
+        if not self.etag_cache:
+            return
+        cache_dir = os.path.dirname(ETAG_CACHE_PATH)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.cache, f)
+            os.rename(tmp_path, ETAG_CACHE_PATH)
+        except (IOError, OSError):
+            # The cache is only an optimization
+            pass
+
+    def get(self, url):
+        """ Return the decoded content and the URL of the next page of a GET of url. Does not fail the module,
+        so that it can be used from threads, but raises GitHubAPIError."""
+        if not url.startswith('http'):
+            url = self.base_url + url
+        key = self.cache_prefix + url
+        headers = dict(self.headers)
+        with self.lock:
+            cached = self.cache.get(key)
+        if cached is not None:
+            headers['If-None-Match'] = cached['etag']
+
+        response, info = fetch_url(self.module, url, headers=headers)
+        if info['status'] == 304 and cached is not None:
+            return cached['content'], cached['next']
+        if info['status'] != 200:
+            raise GitHubAPIError('GET %s failed: %s %s' % (url, info['status'], info.get('msg')), info['status'])
+
+        content = json.loads(to_text(response.read(), errors='surrogate_or_strict'))
+        next_url = None
+        match = re.search('<([^>]+)>; rel="next"', info.get('link', ''))
+        if match:
+            next_url = match.group(1)
+        if self.etag_cache and info.get('etag'):
+            with self.lock:
+                self.cache[key] = dict(etag=info['etag'], content=content, next=next_url)
+        return content, next_url
+
+    def get_all(self, url):
+        """ Return the concatenated content of all the pages of a listing."""
+        result = []
+        while url:
+            content, url = self.get(url)
+            result.extend(content)
+        return result
+
+    def list_organization_repositories(self, organization):
+        return [repo['full_name'] for repo in self.get_all('/orgs/%s/repos?per_page=100' % quote(organization, safe=''))]
+
+    @staticmethod
+    def repository_path(repository):
+        """ Return the quoted API path of a repository from its full name."""
+        owner, name = repository.split('/', 1)
+        return '/repos/%s/%s' % (quote(owner, safe=''), quote(name, safe=''))
+
+    def fan_out(self, func, items, concurrency):
+        """ Return the list of (item, result, error) of func called on every item, with up to concurrency calls at a time.
+        error is the message of the exception raised by func, if any."""
+        def call(item):
+            try:
+                return item, func(item), None
+            except Exception as e:
+                return item, None, to_native(e)
+
+        if not items:
+            return []
+        pool = ThreadPool(max(1, min(concurrency, len(items))))
+        try:
+            return pool.map(call, items)
+        finally:
+            pool.close()
+            pool.join()
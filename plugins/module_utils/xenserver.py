@@ -321,12 +321,15 @@ def get_object_ref(module, name, uuid=None, obj_type="VM", fail=True, msg_prefix
     return obj_ref
 
 
-def gather_vm_params(module, vm_ref):
+def gather_vm_params(module, vm_ref, cache=None):
     """Gathers all VM parameters available in XAPI database.
 
     Args:
         module: Reference to Ansible module object.
         vm_ref (str): XAPI reference to VM.
+        cache (XAPIObjectCache): Cache of XAPI object records to look
+            referenced objects up in (default: None, objects are
+            fetched one by one).
 
     Returns:
         dict: VM parameters.
@@ -335,22 +338,23 @@ def gather_vm_params(module, vm_ref):
     if not vm_ref or vm_ref == "OpaqueRef:NULL":
         return {}
 
-    xapi_session = XAPI.connect(module)
+    if cache is None:
+        cache = XAPIObjectCache(module)
 
     try:
-        vm_params = xapi_session.xenapi.VM.get_record(vm_ref)
+        vm_params = cache.get_record('VM', vm_ref)
 
         # We need some params like affinity, VBDs, VIFs, VDIs etc. dereferenced.
 
         # Affinity.
         if vm_params['affinity'] != "OpaqueRef:NULL":
-            vm_affinity = xapi_session.xenapi.host.get_record(vm_params['affinity'])
+            vm_affinity = cache.get_record('host', vm_params['affinity'])
             vm_params['affinity'] = vm_affinity
         else:
             vm_params['affinity'] = {}
 
         # VBDs.
-        vm_vbd_params_list = [xapi_session.xenapi.VBD.get_record(vm_vbd_ref) for vm_vbd_ref in vm_params['VBDs']]
+        vm_vbd_params_list = [cache.get_record('VBD', vm_vbd_ref) for vm_vbd_ref in vm_params['VBDs']]
 
         # List of VBDs is usually sorted by userdevice but we sort just
         # in case. We need this list sorted by userdevice so that we can
@@ -361,14 +365,14 @@ def gather_vm_params(module, vm_ref):
         # VDIs.
         for vm_vbd_params in vm_params['VBDs']:
             if vm_vbd_params['VDI'] != "OpaqueRef:NULL":
-                vm_vdi_params = xapi_session.xenapi.VDI.get_record(vm_vbd_params['VDI'])
+                vm_vdi_params = cache.get_record('VDI', vm_vbd_params['VDI'])
             else:
                 vm_vdi_params = {}
 
             vm_vbd_params['VDI'] = vm_vdi_params
 
         # VIFs.
-        vm_vif_params_list = [xapi_session.xenapi.VIF.get_record(vm_vif_ref) for vm_vif_ref in vm_params['VIFs']]
+        vm_vif_params_list = [cache.get_record('VIF', vm_vif_ref) for vm_vif_ref in vm_params['VIFs']]
 
         # List of VIFs is usually sorted by device but we sort just
         # in case. We need this list sorted by device so that we can
@@ -379,7 +383,7 @@ def gather_vm_params(module, vm_ref):
         # Networks.
         for vm_vif_params in vm_params['VIFs']:
             if vm_vif_params['network'] != "OpaqueRef:NULL":
-                vm_network_params = xapi_session.xenapi.network.get_record(vm_vif_params['network'])
+                vm_network_params = cache.get_record('network', vm_vif_params['network'])
             else:
                 vm_network_params = {}
 
@@ -387,13 +391,13 @@ def gather_vm_params(module, vm_ref):
 
         # Guest metrics.
         if vm_params['guest_metrics'] != "OpaqueRef:NULL":
-            vm_guest_metrics = xapi_session.xenapi.VM_guest_metrics.get_record(vm_params['guest_metrics'])
+            vm_guest_metrics = cache.get_record('VM_guest_metrics', vm_params['guest_metrics'])
             vm_params['guest_metrics'] = vm_guest_metrics
         else:
             vm_params['guest_metrics'] = {}
 
         # Detect customization agent.
-        xenserver_version = get_xenserver_version(module)
+        xenserver_version = cache.get_xenserver_version()
 
         if (xenserver_version[0] >= 7 and xenserver_version[1] >= 0 and vm_params.get('guest_metrics') and
                 "feature-static-ip-setting" in vm_params['guest_metrics']['other']):
@@ -407,13 +411,48 @@ def gather_vm_params(module, vm_ref):
     return vm_params
 
 
-def gather_vm_facts(module, vm_params):
+def gather_all_vm_params(module, cache=None):
+    """Gathers parameters of all VMs available in XAPI database.
+
+    Templates, snapshots and control domains are skipped. Instead of
+    fetching every referenced object one by one, all records of each
+    object class are fetched with a single call.
+
+    Args:
+        module: Reference to Ansible module object.
+        cache (XAPIObjectCache): Cache to fetch records into so that it
+            can be reused by gather_vm_facts() (default: None, a new
+            cache is used).
+
+    Returns:
+        list of dict: VM parameters sorted by VM name.
+    """
+    if cache is None:
+        cache = XAPIObjectCache(module)
+
+    try:
+        vm_refs = cache.prefetch('VM', 'field "is_a_template" = "false" and field "is_a_snapshot" = "false" and field "is_control_domain" = "false"')
+
+        for obj_class in ['host', 'VBD', 'VDI', 'SR', 'VIF', 'network', 'VM_guest_metrics']:
+            cache.prefetch(obj_class)
+    except XenAPI.Failure as f:
+        module.fail_json(msg="XAPI ERROR: %s" % f.details)
+
+    vm_params_list = [gather_vm_params(module, vm_ref, cache) for vm_ref in vm_refs]
+
+    return sorted(vm_params_list, key=lambda vm_params: (vm_params['name_label'], vm_params['uuid']))
+
+
+def gather_vm_facts(module, vm_params, cache=None):
     """Gathers VM facts.
 
     Args:
         module: Reference to Ansible module object.
         vm_params (dict): A dictionary with VM parameters as returned
             by gather_vm_params() function.
+        cache (XAPIObjectCache): Cache of XAPI object records to look
+            referenced objects up in (default: None, objects are
+            fetched one by one).
 
     Returns:
         dict: VM facts.
@@ -422,7 +461,8 @@ def gather_vm_facts(module, vm_params):
     if not vm_params:
         return {}
 
-    xapi_session = XAPI.connect(module)
+    if cache is None:
+        cache = XAPIObjectCache(module)
 
     # Gather facts.
     vm_facts = {
@@ -450,7 +490,7 @@ def gather_vm_facts(module, vm_params):
 
     for vm_vbd_params in vm_params['VBDs']:
         if vm_vbd_params['type'] == "Disk":
-            vm_disk_sr_params = xapi_session.xenapi.SR.get_record(vm_vbd_params['VDI']['SR'])
+            vm_disk_sr_params = cache.get_record('SR', vm_vbd_params['VDI']['SR'])
 
             vm_disk_params = {
                 "size": int(vm_vbd_params['VDI']['virtual_size']),
@@ -617,6 +657,38 @@ def set_vm_power_state(module, vm_ref, power_state, timeout=300):
     return (state_changed, vm_power_state_resulting)
 
 
+def wait_for_event(module, classes, token, timeout):
+    """Waits for changes to XAPI objects.
+
+    Uses XAPI event.from subscription so that waiting returns as soon
+    as one of the subscribed objects changes. Falls back to sleeping
+    on hosts that do not support event.from.
+
+    Args:
+        module: Reference to Ansible module object.
+        classes (list of str): XAPI classes or objects to watch, either
+            as "class" or "class/ref".
+        token (str): Token returned by previous call or an empty string
+            to get current state of objects without waiting.
+        timeout (float): maximum time to wait in seconds.
+
+    Returns:
+        str: token to pass to next call.
+    """
+    xapi_session = XAPI.connect(module)
+
+    try:
+        events = xapi_session.xenapi_request("event.from", (classes, token, float(timeout)))
+        return events['token']
+    except XenAPI.Failure as f:
+        if not f.details or f.details[0] != "MESSAGE_METHOD_UNKNOWN":
+            raise
+
+    time.sleep(min(timeout, 2))
+
+    return token
+
+
 def wait_for_task(module, task_ref, timeout=300):
     """Waits for async XAPI task to finish.
 
@@ -634,40 +706,38 @@ def wait_for_task(module, task_ref, timeout=300):
 
     xapi_session = XAPI.connect(module)
 
-    interval = 2
+    # Wait for at most this many seconds at once if we wait indefinitely.
+    interval = 60
 
     result = ""
 
-    # If we have to wait indefinitely, make time_left larger than 0 so we can
-    # enter while loop.
-    if timeout == 0:
-        time_left = 1
-    else:
-        time_left = timeout
+    deadline = time.time() + timeout
+    token = ""
 
     try:
-        while time_left > 0:
+        while True:
             task_status = xapi_session.xenapi.task.get_status(task_ref).lower()
 
-            if task_status == "pending":
-                # Task is still running.
-                time.sleep(interval)
-
-                # We decrease time_left only if we don't wait indefinitely.
-                if timeout != 0:
-                    time_left -= interval
-
-                continue
-            elif task_status == "success":
+            if task_status == "success":
                 # Task is done.
                 break
-            else:
+            elif task_status != "pending":
                 # Task failed.
                 result = task_status
                 break
-        else:
-            # We timed out.
-            result = "timeout"
+
+            # Task is still running.
+            if timeout == 0:
+                time_left = interval
+            else:
+                time_left = deadline - time.time()
+
+            if time_left <= 0:
+                # We timed out.
+                result = "timeout"
+                break
+
+            token = wait_for_event(module, ["task/%s" % task_ref], token, time_left)
 
         xapi_session.xenapi.task.destroy(task_ref)
     except XenAPI.Failure as f:
@@ -705,33 +775,39 @@ def wait_for_vm_ip_address(module, vm_ref, timeout=300):
         if vm_power_state != 'poweredon':
             module.fail_json(msg="Cannot wait for VM IP address when VM is in state '%s'!" % vm_power_state)
 
-        interval = 2
+        # Wait for at most this many seconds at once if we wait indefinitely.
+        interval = 60
 
-        # If we have to wait indefinitely, make time_left larger than 0 so we can
-        # enter while loop.
-        if timeout == 0:
-            time_left = 1
-        else:
-            time_left = timeout
+        deadline = time.time() + timeout
+        token = ""
+
+        while True:
+            # Guest metrics are created when guest agent starts and are
+            # updated when IP address is acquired, so we watch both VM
+            # and its guest metrics.
+            classes = ["VM/%s" % vm_ref]
 
-        while time_left > 0:
             vm_guest_metrics_ref = xapi_session.xenapi.VM.get_guest_metrics(vm_ref)
 
             if vm_guest_metrics_ref != "OpaqueRef:NULL":
+                classes.append("VM_guest_metrics/%s" % vm_guest_metrics_ref)
+
                 vm_guest_metrics = xapi_session.xenapi.VM_guest_metrics.get_record(vm_guest_metrics_ref)
                 vm_ips = vm_guest_metrics['networks']
 
                 if "0/ip" in vm_ips:
                     break
 
-            time.sleep(interval)
+            if timeout == 0:
+                time_left = interval
+            else:
+                time_left = deadline - time.time()
 
-            # We decrease time_left only if we don't wait indefinitely.
-            if timeout != 0:
-                time_left -= interval
-        else:
-            # We timed out.
-            module.fail_json(msg="Timed out waiting for VM IP address!")
+            if time_left <= 0:
+                # We timed out.
+                module.fail_json(msg="Timed out waiting for VM IP address!")
+
+            token = wait_for_event(module, classes, token, time_left)
 
     except XenAPI.Failure as f:
         module.fail_json(msg="XAPI ERROR: %s" % f.details)
@@ -825,6 +901,78 @@ class XAPI(object):
         return cls._xapi_session
 
 
+class XAPIObjectCache(object):
+    """Cache of XAPI object records.
+
+    Records can be fetched in bulk with prefetch() so that dereferencing
+    objects related to many VMs does not need a round trip per object.
+    Records missing from the cache are fetched one by one.
+
+    Attributes:
+        module: Reference to Ansible module object.
+        xapi_session: Reference to XAPI session.
+        records (dict): XAPI records by XAPI class and reference.
+    """
+
+    def __init__(self, module):
+        """Inits XAPIObjectCache.
+
+        Args:
+            module: Reference to Ansible module object.
+        """
+        self.module = module
+        self.xapi_session = XAPI.connect(module)
+        self.records = {}
+        self.xenserver_version = None
+
+    def prefetch(self, obj_class, where=None):
+        """Fetches all records of XAPI class with a single call.
+
+        Args:
+            obj_class (str): Any valid XAPI class.
+            where (str): XAPI query expression to filter records with
+                (default: None, all records are fetched).
+
+        Returns:
+            list of str: XAPI references of fetched records.
+        """
+        xapi_class = getattr(self.xapi_session.xenapi, obj_class)
+
+        if where:
+            obj_records = xapi_class.get_all_records_where(where)
+        else:
+            obj_records = xapi_class.get_all_records()
+
+        self.records.setdefault(obj_class, {}).update(obj_records)
+
+        return list(obj_records.keys())
+
+    def get_record(self, obj_class, obj_ref):
+        """Returns a copy of XAPI object record.
+
+        Args:
+            obj_class (str): Any valid XAPI class.
+            obj_ref (str): XAPI reference to object.
+
+        Returns:
+            dict: XAPI object record.
+        """
+        obj_records = self.records.setdefault(obj_class, {})
+
+        if obj_ref not in obj_records:
+            obj_records[obj_ref] = getattr(self.xapi_session.xenapi, obj_class).get_record(obj_ref)
+
+        # Callers dereference fields in place so they get their own copy.
+        return dict(obj_records[obj_ref])
+
+    def get_xenserver_version(self):
+        """Returns XenServer version as returned by get_xenserver_version()."""
+        if self.xenserver_version is None:
+            self.xenserver_version = get_xenserver_version(self.module)
+
+        return self.xenserver_version
+
+
 class XenServerObject(object):
     """Base class for all XenServer objects.
 
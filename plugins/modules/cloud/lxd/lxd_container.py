@@ -19,7 +19,21 @@ options:
     name:
         description:
           - Name of a container.
-        required: true
+          - One of I(name) or I(names) is required.
+    names:
+        description:
+          - Names of several containers to manage with the same options.
+          - The containers are created, started and changed concurrently, each with its own connection to the LXD server.
+          - One of I(name) or I(names) is required.
+        type: list
+        elements: str
+        version_added: 1.0.0
+    concurrency:
+        description:
+          - Maximum number of containers in I(names) that are managed at the same time.
+        type: int
+        default: 10
+        version_added: 1.0.0
     architecture:
         description:
           - The architecture for the container (e.g. "x86_64" or "i686").
@@ -198,6 +212,23 @@ EXAMPLES = '''
         wait_for_ipv4_addresses: true
         timeout: 600
 
+# An example for creating and starting many containers at once
+- hosts: localhost
+  connection: local
+  tasks:
+    - name: Create started containers
+      lxd_container:
+        names: "{{ query('sequence', 'start=1 end=200 format=web%03d') }}"
+        state: started
+        source:
+          type: image
+          mode: pull
+          server: https://images.linuxcontainers.org
+          protocol: lxd
+          alias: ubuntu/xenial/amd64
+        profiles: ["default"]
+        concurrency: 20
+
 # An example for deleting a container
 - hosts: localhost
   connection: local
@@ -266,10 +297,20 @@ actions:
   returned: success
   type: list
   sample: '["create", "start"]'
+containers:
+  description:
+    - Results for every container when I(names) is used, with the same keys as for a single container
+      plus C(name), and C(msg) for the containers that failed.
+  returned: when I(names) is used
+  type: list
+  elements: dict
+  sample: '[{"name": "web001", "changed": true, "old_state": "absent", "actions": ["create", "start"]}]'
+  version_added: 1.0.0
 '''
 import datetime
 import os
 import time
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.community.general.plugins.module_utils.lxd import LXDClient, LXDClientException
@@ -303,14 +344,16 @@ CONFIG_PARAMS = [
 
 
 class LXDContainerManagement(object):
-    def __init__(self, module):
+    def __init__(self, module, name=None):
         """Management of LXC containers via Ansible.
 
         :param module: Processed Ansible Module.
         :type module: ``object``
+        :param name: Name of the container, defaults to the name module parameter.
+        :type name: ``str``
         """
         self.module = module
-        self.name = self.module.params['name']
+        self.name = name or self.module.params['name']
         self._build_config()
 
         self.state = self.module.params['state']
@@ -422,11 +465,11 @@ class LXDContainerManagement(object):
         try:
             due = datetime.datetime.now() + datetime.timedelta(seconds=self.timeout)
             while datetime.datetime.now() < due:
-                time.sleep(1)
                 addresses = self._container_ipv4_addresses()
                 if self._has_all_ipv4_addresses(addresses):
                     self.addresses = addresses
                     return
+                time.sleep(1)
         except LXDClientException as e:
             e.msg = 'timeout for getting IPv4 addresses'
             raise
@@ -540,40 +583,89 @@ class LXDContainerManagement(object):
         self.client.do('PUT', '/1.0/containers/{0}'.format(self.name), body_json=body_json)
         self.actions.append('apply_container_configs')
 
+    def manage(self, authenticate=True):
+        """Bring the container to the requested state.
+
+        :param authenticate: Whether to authenticate with the trust password first.
+        :type authenticate: ``bool``
+        :returns: The result of the module for this container.
+        :rtype: ``dict``
+        """
+        if authenticate and self.trust_password is not None:
+            self.client.authenticate(self.trust_password)
+
+        self.old_container_json = self._get_container_json()
+        self.old_state = self._container_json_to_module_state(self.old_container_json)
+        action = getattr(self, LXD_ANSIBLE_STATES[self.state])
+        action()
+
+        state_changed = len(self.actions) > 0
+        result_json = {
+            'log_verbosity': self.module._verbosity,
+            'changed': state_changed,
+            'old_state': self.old_state,
+            'actions': self.actions
+        }
+        if self.client.debug:
+            result_json['logs'] = self.client.logs
+        if self.addresses is not None:
+            result_json['addresses'] = self.addresses
+        return result_json
+
+    def _fail_params(self, e):
+        state_changed = len(self.actions) > 0
+        fail_params = {
+            'msg': e.msg,
+            'changed': state_changed,
+            'actions': self.actions
+        }
+        if self.client.debug:
+            fail_params['logs'] = e.kwargs['logs']
+        return fail_params
+
     def run(self):
         """Run the main method."""
 
         try:
-            if self.trust_password is not None:
-                self.client.authenticate(self.trust_password)
-
-            self.old_container_json = self._get_container_json()
-            self.old_state = self._container_json_to_module_state(self.old_container_json)
-            action = getattr(self, LXD_ANSIBLE_STATES[self.state])
-            action()
-
-            state_changed = len(self.actions) > 0
-            result_json = {
-                'log_verbosity': self.module._verbosity,
-                'changed': state_changed,
-                'old_state': self.old_state,
-                'actions': self.actions
-            }
-            if self.client.debug:
-                result_json['logs'] = self.client.logs
-            if self.addresses is not None:
-                result_json['addresses'] = self.addresses
-            self.module.exit_json(**result_json)
+            self.module.exit_json(**self.manage())
+        except LXDClientException as e:
+            self.module.fail_json(**self._fail_params(e))
+
+
+def _manage_container(lxd_manage):
+    try:
+        result = lxd_manage.manage(authenticate=False)
+    except LXDClientException as e:
+        result = lxd_manage._fail_params(e)
+        result['failed'] = True
+    result['name'] = lxd_manage.name
+    return result
+
+
+def run_many(module):
+    """Manage all containers in the names parameter concurrently."""
+    managers = [LXDContainerManagement(module=module, name=name) for name in module.params['names']]
+    if not managers:
+        module.exit_json(changed=False, containers=[])
+
+    # The trust store is shared by all connections, so authenticate only once.
+    if managers[0].trust_password is not None:
+        try:
+            managers[0].client.authenticate(managers[0].trust_password)
         except LXDClientException as e:
-            state_changed = len(self.actions) > 0
-            fail_params = {
-                'msg': e.msg,
-                'changed': state_changed,
-                'actions': self.actions
-            }
-            if self.client.debug:
-                fail_params['logs'] = e.kwargs['logs']
-            self.module.fail_json(**fail_params)
+            module.fail_json(msg=e.msg)
+
+    pool = ThreadPool(max(1, min(module.params['concurrency'], len(managers))))
+    try:
+        results = pool.map(_manage_container, managers)
+    finally:
+        pool.close()
+
+    changed = any(result['changed'] for result in results)
+    failed = [result['name'] for result in results if result.get('failed')]
+    if failed:
+        module.fail_json(msg='failed to manage containers: {0}'.format(', '.join(failed)), changed=changed, containers=results)
+    module.exit_json(changed=changed, containers=results)
 
 
 def main():
@@ -583,7 +675,14 @@ def main():
         argument_spec=dict(
             name=dict(
                 type='str',
-                required=True
+            ),
+            names=dict(
+                type='list',
+                elements='str',
+            ),
+            concurrency=dict(
+                type='int',
+                default=10
             ),
             architecture=dict(
                 type='str',
@@ -640,8 +739,13 @@ def main():
             trust_password=dict(type='str', no_log=True)
         ),
         supports_check_mode=False,
+        required_one_of=[['name', 'names']],
+        mutually_exclusive=[['name', 'names']],
     )
 
+    if module.params['names'] is not None:
+        run_many(module)
+
     lxd_manage = LXDContainerManagement(module=module)
     lxd_manage.run()
 
@@ -145,6 +145,7 @@ class HostModule(OpenNebulaModule):
             self.fail(msg="could not allocate host")
         else:
             self.result['changed'] = True
+            self.invalidate_pool('host')
         return True
 
     def wait_for_host_state(self, host, target_states):
@@ -191,6 +192,7 @@ class HostModule(OpenNebulaModule):
                 self.wait_for_host_state(host, [HOST_STATES.MONITORED])
             elif current_state in [HOST_STATES.DISABLED, HOST_STATES.OFFLINE]:
                 if one.host.status(host.ID, HOST_STATUS.ENABLED):
+                    self.invalidate_pool('host')
                     self.wait_for_host_state(host, [HOST_STATES.MONITORED])
                     result['changed'] = True
                 else:
@@ -205,6 +207,7 @@ class HostModule(OpenNebulaModule):
                 self.fail(msg='absent host cannot be put in disabled state')
             elif current_state in [HOST_STATES.MONITORED, HOST_STATES.OFFLINE]:
                 if one.host.status(host.ID, HOST_STATUS.DISABLED):
+                    self.invalidate_pool('host')
                     self.wait_for_host_state(host, [HOST_STATES.DISABLED])
                     result['changed'] = True
                 else:
@@ -219,6 +222,7 @@ class HostModule(OpenNebulaModule):
                 self.fail(msg='absent host cannot be placed in offline state')
             elif current_state in [HOST_STATES.MONITORED, HOST_STATES.DISABLED]:
                 if one.host.status(host.ID, HOST_STATUS.OFFLINE):
+                    self.invalidate_pool('host')
                     self.wait_for_host_state(host, [HOST_STATES.OFFLINE])
                     result['changed'] = True
                 else:
@@ -231,6 +235,7 @@ class HostModule(OpenNebulaModule):
         elif desired_state == 'absent':
             if current_state != HOST_ABSENT:
                 if one.host.delete(host.ID):
+                    self.invalidate_pool('host')
                     result['changed'] = True
                 else:
                     self.fail(msg="could not delete host from cluster")
@@ -252,6 +257,7 @@ class HostModule(OpenNebulaModule):
                 # setup the root element so that pyone will generate XML instead of attribute vector
                 desired_template_changes = {"TEMPLATE": desired_template_changes}
                 if one.host.update(host.ID, desired_template_changes, 1):  # merge the template
+                    self.invalidate_pool('host')
                     result['changed'] = True
                 else:
                     self.fail(msg="failed to update the host template")
@@ -259,6 +265,8 @@ class HostModule(OpenNebulaModule):
             # the cluster
             if host.CLUSTER_ID != self.get_parameter('cluster_id'):
                 if one.cluster.addhost(self.get_parameter('cluster_id'), host.ID):
+                    self.invalidate_pool('host')
+                    self.invalidate_pool('cluster')
                     result['changed'] = True
                 else:
                     self.fail(msg="failed to update the host cluster")
@@ -1040,14 +1040,11 @@ def create_count_of_vms(
         new_vms_list.append(new_vm)
         count -= 1
 
-    if vm_start_on_hold:
-        if wait:
-            for vm in new_vms_list:
-                wait_for_hold(module, client, vm, wait_timeout)
-    else:
-        if wait:
-            for vm in new_vms_list:
-                wait_for_running(module, client, vm, wait_timeout)
+    if wait and new_vms_list:
+        if vm_start_on_hold:
+            wait_for_vms_state(module, client, new_vms_list, wait_timeout, hold_predicate)
+        else:
+            wait_for_vms_state(module, client, new_vms_list, wait_timeout, running_predicate)
 
     return True, new_vms_list, []
 
@@ -1085,8 +1082,7 @@ def create_exact_count_of_vms(module, client, template_id, exact_count, attribut
             vm_count_diff += 1
 
         if wait:
-            for vm in old_vms_list:
-                wait_for_done(module, client, vm, wait_timeout)
+            wait_for_vms_state(module, client, old_vms_list, wait_timeout, done_predicate)
 
         instances_list = old_vms_list
         # store only the remaining instances
@@ -1104,41 +1100,62 @@ LCM_STATES = ['LCM_INIT', 'PROLOG', 'BOOT', 'RUNNING', 'MIGRATE', 'SAVE_STOP',
               'HOTPLUG_SAVEAS', 'HOTPLUG_SAVEAS_POWEROFF', 'HOTPULG_SAVEAS_SUSPENDED', 'SHUTDOWN_UNDEPLOY']
 
 
-def wait_for_state(module, client, vm, wait_timeout, state_predicate):
+def get_vms_by_ids_from_pool(client, vm_ids):
+    # Fetch all VMs in any state, including DONE, but only in the range of requested IDs
+    pool = client.vmpool.info(-2, min(vm_ids), max(vm_ids), -2)
+    return dict((vm.ID, vm) for vm in pool.VM if vm.ID in vm_ids)
+
+
+def wait_for_vms_state(module, client, vms, wait_timeout, state_predicate):
     import time
     start_time = time.time()
 
+    pending_ids = set(vm.ID for vm in vms)
+    done_vms = {}
+
     while (time.time() - start_time) < wait_timeout:
-        vm = client.vm.info(vm.ID)
-        state = vm.STATE
-        lcm_state = vm.LCM_STATE
+        # Track the states of all VMs with a single pool request per iteration
+        for vm_id, vm in get_vms_by_ids_from_pool(client, pending_ids).items():
+            state = vm.STATE
+            lcm_state = vm.LCM_STATE
+
+            if state_predicate(state, lcm_state):
+                done_vms[vm_id] = vm
+                pending_ids.discard(vm_id)
+            elif state not in [VM_STATES.index('INIT'), VM_STATES.index('PENDING'), VM_STATES.index('HOLD'),
+                               VM_STATES.index('ACTIVE'), VM_STATES.index('CLONING'), VM_STATES.index('POWEROFF')]:
+                module.fail_json(msg='Action is unsuccessful. VM state: ' + VM_STATES[state])
 
-        if state_predicate(state, lcm_state):
-            return vm
-        elif state not in [VM_STATES.index('INIT'), VM_STATES.index('PENDING'), VM_STATES.index('HOLD'),
-                           VM_STATES.index('ACTIVE'), VM_STATES.index('CLONING'), VM_STATES.index('POWEROFF')]:
-            module.fail_json(msg='Action is unsuccessful. VM state: ' + VM_STATES[state])
+        if not pending_ids:
+            return [done_vms[vm.ID] for vm in vms]
 
         time.sleep(1)
 
     module.fail_json(msg="Wait timeout has expired!")
 
 
-def wait_for_running(module, client, vm, wait_timeout):
-    return wait_for_state(module, client, vm, wait_timeout, lambda state,
-                          lcm_state: (state in [VM_STATES.index('ACTIVE')] and lcm_state in [LCM_STATES.index('RUNNING')]))
+def wait_for_state(module, client, vm, wait_timeout, state_predicate):
+    return wait_for_vms_state(module, client, [vm], wait_timeout, state_predicate)[0]
+
+
+def running_predicate(state, lcm_state):
+    return state in [VM_STATES.index('ACTIVE')] and lcm_state in [LCM_STATES.index('RUNNING')]
 
 
-def wait_for_done(module, client, vm, wait_timeout):
-    return wait_for_state(module, client, vm, wait_timeout, lambda state, lcm_state: (state in [VM_STATES.index('DONE')]))
+def done_predicate(state, lcm_state):
+    return state in [VM_STATES.index('DONE')]
 
 
-def wait_for_hold(module, client, vm, wait_timeout):
-    return wait_for_state(module, client, vm, wait_timeout, lambda state, lcm_state: (state in [VM_STATES.index('HOLD')]))
+def hold_predicate(state, lcm_state):
+    return state in [VM_STATES.index('HOLD')]
+
+
+def poweroff_predicate(state, lcm_state):
+    return state in [VM_STATES.index('POWEROFF')]
 
 
 def wait_for_poweroff(module, client, vm, wait_timeout):
-    return wait_for_state(module, client, vm, wait_timeout, lambda state, lcm_state: (state in [VM_STATES.index('POWEROFF')]))
+    return wait_for_state(module, client, vm, wait_timeout, poweroff_predicate)
 
 
 def terminate_vm(module, client, vm, hard=False):
@@ -1207,8 +1224,8 @@ def reboot_vms(module, client, vms, wait_timeout, hard):
                 poweroff_vm(module, client, vm, hard)
 
         # Wait for all to be power-off
-        for vm in vms:
-            wait_for_poweroff(module, client, vm, wait_timeout)
+        if vms:
+            wait_for_vms_state(module, client, vms, wait_timeout, poweroff_predicate)
 
         for vm in vms:
             resume_vm(module, client, vm)
@@ -1543,14 +1560,14 @@ def main():
 
     if wait and not module.check_mode and state != 'present':
         wait_for = {
-            'absent': wait_for_done,
-            'rebooted': wait_for_running,
-            'poweredoff': wait_for_poweroff,
-            'running': wait_for_running
+            'absent': done_predicate,
+            'rebooted': running_predicate,
+            'poweredoff': poweroff_predicate,
+            'running': running_predicate
         }
-        for vm in vms:
-            if vm is not None:
-                wait_for[state](module, one_client, vm, wait_timeout)
+        vms_to_wait_for = [vm for vm in vms if vm is not None]
+        if vms_to_wait_for:
+            wait_for_vms_state(module, one_client, vms_to_wait_for, wait_timeout, wait_for[state])
 
     if disk_saveas is not None:
         if len(vms) == 0:
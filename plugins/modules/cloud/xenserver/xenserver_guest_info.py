@@ -45,6 +45,15 @@ options:
     - UUID of the VM to gather fact of. This is XenServer's unique identifier.
     - It is required if name is not unique.
     type: str
+  all_vms:
+    description:
+    - Gather facts of all VMs in the pool instead of a single VM.
+    - Templates, snapshots and control domains are skipped.
+    - Records of all VMs and their related objects are fetched with one call per object type, which is much faster than
+      gathering facts of each VM separately.
+    - Mutually exclusive with C(name) and C(uuid).
+    type: bool
+    version_added: 1.0.0
 extends_documentation_fragment:
 - community.general.xenserver.documentation
 
@@ -59,12 +68,27 @@ EXAMPLES = r'''
     name: testvm_11
   delegate_to: localhost
   register: facts
+
+- name: Gather facts of all VMs in the pool
+  xenserver_guest_info:
+    hostname: "{{ xenserver_hostname }}"
+    username: "{{ xenserver_username }}"
+    password: "{{ xenserver_password }}"
+    all_vms: yes
+  delegate_to: localhost
+  register: all_facts
 '''
 
 RETURN = r'''
+instances:
+    description: Metadata about all VMs sorted by name, in the same format as C(instance)
+    returned: when I(all_vms=yes)
+    type: list
+    elements: dict
+    version_added: 1.0.0
 instance:
     description: Metadata about the VM
-    returned: always
+    returned: when I(all_vms=no)
     type: dict
     sample: {
         "cdrom": {
@@ -159,7 +183,8 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.community.general.plugins.module_utils.xenserver import (xenserver_common_argument_spec, XAPI, XenServerObject, get_object_ref,
-                                                                                  gather_vm_params, gather_vm_facts)
+                                                                                  gather_vm_params, gather_all_vm_params, gather_vm_facts,
+                                                                                  XAPIObjectCache)
 
 
 class XenServerVM(XenServerObject):
@@ -191,17 +216,52 @@ class XenServerVM(XenServerObject):
         return gather_vm_facts(self.module, self.vm_params)
 
 
+class XenServerVMs(XenServerObject):
+    """Class for gathering facts of all XenServer VMs at once.
+
+    Attributes:
+        cache (XAPIObjectCache): Cache of records of VMs and related
+            objects.
+        vm_params_list (list of dict): VM parameters as returned by
+            gather_vm_params() function for every VM.
+    """
+
+    def __init__(self, module):
+        """Inits XenServerVMs using module parameters.
+
+        Args:
+            module: Reference to AnsibleModule object.
+        """
+        super(XenServerVMs, self).__init__(module)
+
+        self.cache = XAPIObjectCache(self.module)
+        self.gather_params()
+
+    def gather_params(self):
+        """Gathers parameters of all VMs available in XAPI database."""
+        self.vm_params_list = gather_all_vm_params(self.module, self.cache)
+
+    def gather_facts(self):
+        """Gathers and returns facts of all VMs."""
+        return [gather_vm_facts(self.module, vm_params, self.cache) for vm_params in self.vm_params_list]
+
+
 def main():
     argument_spec = xenserver_common_argument_spec()
     argument_spec.update(
         name=dict(type='str', aliases=['name_label']),
         uuid=dict(type='str'),
+        all_vms=dict(type='bool'),
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
                            required_one_of=[
-                               ['name', 'uuid'],
+                               ['name', 'uuid', 'all_vms'],
+                           ],
+                           mutually_exclusive=[
+                               ['name', 'all_vms'],
+                               ['uuid', 'all_vms'],
                            ],
                            )
 
@@ -211,11 +271,17 @@ def main():
 
     result = {'failed': False, 'changed': False}
 
-    # Module will exit with an error message if no VM is found.
-    vm = XenServerVM(module)
+    if module.params['all_vms']:
+        vms = XenServerVMs(module)
+
+        # Gather facts.
+        result['instances'] = vms.gather_facts()
+    else:
+        # Module will exit with an error message if no VM is found.
+        vm = XenServerVM(module)
 
-    # Gather facts.
-    result['instance'] = vm.gather_facts()
+        # Gather facts.
+        result['instance'] = vm.gather_facts()
 
     if result['failed']:
         module.fail_json(**result)
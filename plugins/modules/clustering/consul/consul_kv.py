@@ -18,8 +18,12 @@ description:
   - If the C(key) represents a prefix then note that when a value is removed, the existing
     value if any is returned as part of the results.
   - See http://www.consul.io/docs/agent/http.html#kv for more details.
+  - With I(items), many keys are read and written through the C(/v1/txn) endpoint, 64 operations per
+    transaction. Every transaction is atomic, and writes use check-and-set so a transaction fails if one
+    of its keys was modified after it was read. A task with more than 64 changes is not atomic as a whole,
+    the transactions before the failed one stay applied.
 requirements:
-  - python-consul
+  - python-consul (>= 1.1.0 for I(items))
   - requests
 author:
   - Steve Gargan (@sgargan)
@@ -42,8 +46,19 @@ options:
     key:
         description:
           - The key at which the value should be stored.
+          - Exactly one of I(key) and I(items) is required.
         type: str
-        required: yes
+    items:
+        description:
+          - Dictionary of keys and the values that should be associated with them.
+          - If the I(state) is C(present), all the keys are set to their values in as few transactions as
+            possible. If the I(state) is C(absent), all the keys are removed and the values are ignored.
+          - Only each transaction of 64 changes is atomic, not the whole task. When a transaction fails, the
+            keys changed by the previous ones are returned in C(changed_keys).
+          - Only the C(present) and C(absent) states are supported, and I(recurse), I(retrieve) and I(cas)
+            are ignored.
+        type: dict
+        version_added: 1.0.0
     value:
         description:
           - The value should be associated with the given key, required if C(state)
@@ -129,6 +144,13 @@ EXAMPLES = '''
     key: ansible/groups/dc1/somenode
     value: top_secret
 
+- name: Add or update many keys at once
+  consul_kv:
+    items:
+      app/config/db_host: db.example.com
+      app/config/db_port: 5432
+      app/config/debug: "false"
+
 - name: Register a key/value pair with an associated session
   consul_kv:
     key: stg/node/server_birthday
@@ -137,7 +159,19 @@ EXAMPLES = '''
     state: acquire
 '''
 
-from ansible.module_utils._text import to_text
+RETURN = '''
+changed_keys:
+    description:
+      - The keys of I(items) that were set or removed.
+      - When a transaction fails, the keys changed by the transactions committed before it.
+    returned: when I(items) is used
+    type: list
+    sample: ["app/config/db_host", "app/config/db_port"]
+'''
+
+import base64
+
+from ansible.module_utils._text import to_bytes, to_text
 
 try:
     import consul
@@ -153,6 +187,9 @@ from ansible.module_utils.basic import AnsibleModule
 # the value just defaults to an empty string (https://www.consul.io/api/kv.html#create-update-key)
 NOT_SET = None
 
+# Maximum number of operations of a Consul transaction
+TXN_MAX_OPS = 64
+
 
 def _has_value_changed(consul_client, key, target_value):
     """
@@ -175,10 +212,62 @@ def _has_value_changed(consul_client, key, target_value):
         return index, True
 
 
+class TxnError(Exception):
+    """
+    A Consul transaction failed, after the given number of operations were committed by the previous ones.
+    """
+    def __init__(self, msg, committed):
+        super(TxnError, self).__init__(msg)
+        self.committed = committed
+
+
+def _txn(consul_client, operations):
+    """
+    Runs the given operations in as few Consul transactions as possible.
+    :param consul_client: Consul connected client
+    :param operations: list of transaction operations
+    :return: the results of all the operations
+    :raise TxnError: if a transaction fails, the ones before it stay committed
+    """
+    results = []
+    for i in range(0, len(operations), TXN_MAX_OPS):
+        try:
+            response = consul_client.txn.put(operations[i:i + TXN_MAX_OPS])
+        except Exception as e:
+            raise TxnError(str(e), i)
+        # A rolled back transaction is not an HTTP error for python-consul
+        if response.get('Errors'):
+            raise TxnError('Transaction failed: %s' % ', '.join(
+                error.get('What', str(error)) for error in response['Errors']), i)
+        results.extend(response.get('Results') or [])
+    return results
+
+
+def _get_many(consul_client, keys):
+    """
+    Uses the given Consul client to read many keys with transactions.
+    :param consul_client: Consul connected client
+    :param keys: keys in Consul
+    :return: dictionary of the entries of the keys that exist, with their decoded value
+    """
+    # Unlike "get", "get-tree" does not fail the whole transaction when a key does not exist
+    operations = [{'KV': {'Verb': 'get-tree', 'Key': key}} for key in keys]
+    wanted = set(keys)
+    existing = {}
+    for result in _txn(consul_client, operations):
+        entry = result['KV']
+        if entry['Key'] in wanted:
+            entry['Value'] = base64.b64decode(entry['Value']) if entry.get('Value') else None
+            existing[entry['Key']] = entry
+    return existing
+
+
 def execute(module):
     state = module.params.get('state')
 
-    if state == 'acquire' or state == 'release':
+    if module.params.get('items') is not None:
+        set_or_remove_items(module)
+    elif state == 'acquire' or state == 'release':
         lock(module, state)
     elif state == 'present':
         if module.params.get('value') is NOT_SET:
@@ -258,6 +347,47 @@ def set_value(module):
                      data=stored)
 
 
+def set_or_remove_items(module):
+    consul_api = get_consul_api(module)
+
+    state = module.params.get('state')
+    if state not in ('present', 'absent'):
+        module.fail_json(msg='items cannot be used with state=%s' % state)
+
+    items = dict((key, to_text(value)) for key, value in module.params.get('items').items())
+    existing = _get_many(consul_api, list(items))
+
+    flags = module.params.get('flags')
+    changed_keys = []
+    operations = []
+    for key in sorted(items):
+        current = existing.get(key)
+        if state == 'absent':
+            if current is None:
+                continue
+            operation = {'Verb': 'delete-cas', 'Key': key, 'Index': current['ModifyIndex']}
+        else:
+            value = items[key]
+            if current is not None and to_text(current['Value'] or b'', errors='surrogate_then_replace') == value:
+                continue
+            # An index of 0 only creates the key if it still does not exist
+            operation = {'Verb': 'cas', 'Key': key, 'Index': current['ModifyIndex'] if current else 0,
+                         'Value': to_text(base64.b64encode(to_bytes(value)))}
+            if flags is not None:
+                operation['Flags'] = int(flags)
+        changed_keys.append(key)
+        operations.append({'KV': operation})
+
+    if operations and not module.check_mode:
+        try:
+            _txn(consul_api, operations)
+        except TxnError as e:
+            # Every operation changes one key, in order
+            module.fail_json(msg=str(e), changed=e.committed > 0, changed_keys=changed_keys[:e.committed])
+
+    module.exit_json(changed=bool(changed_keys), changed_keys=changed_keys)
+
+
 def remove_value(module):
     ''' remove the value associated with the given key. if the recurse parameter
      is set then any key prefixed with the given key will be removed. '''
@@ -298,7 +428,8 @@ def main():
         argument_spec=dict(
             cas=dict(type='str'),
             flags=dict(type='str'),
-            key=dict(type='str', required=True),
+            key=dict(type='str'),
+            items=dict(type='dict'),
             host=dict(type='str', default='localhost'),
             scheme=dict(type='str', default='http'),
             validate_certs=dict(type='bool', default=True),
@@ -310,6 +441,8 @@ def main():
             value=dict(type='str', default=NOT_SET),
             session=dict(type='str'),
         ),
+        required_one_of=[('key', 'items')],
+        mutually_exclusive=[('key', 'items')],
         supports_check_mode=True
     )
 
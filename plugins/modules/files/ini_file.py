@@ -36,8 +36,8 @@ options:
         a single value is being set.
       - If left empty or set to C(null), the I(option) will be placed before the first I(section).
       - Using C(null) is also required if the config format does not support sections.
+      - One of I(section) or I(settings) is required.
     type: str
-    required: true
   option:
     description:
       - If set (required for changing a I(value)), this is the name of the option.
@@ -76,6 +76,16 @@ options:
       - Allow option without value and without '=' symbol.
     type: bool
     default: no
+  settings:
+    description:
+      - A dictionary mapping section names to a dictionary of I(option)/I(value) pairs, to manage many options at once.
+      - The file is read and indexed by section once, all changes are applied and the file is written once.
+      - Use an empty string as the section name to place options before the first section.
+      - With C(state=absent), the listed options are removed and their values are ignored.
+        A section mapped to C(null) or to an empty dictionary is removed as a whole.
+      - Mutually exclusive with I(section), I(option) and I(value).
+    type: dict
+    version_added: 1.0.0
 notes:
    - While it is possible to add an I(option) without specifying a I(value), this makes no sense.
    - As of Ansible 2.3, the I(dest) option has been changed to I(path) as default, but I(dest) still works as well.
@@ -102,6 +112,16 @@ EXAMPLES = r'''
     option: temperature
     value: cold
     backup: yes
+
+- name: Ensure several options in several sections with a single read and write of the file
+  ini_file:
+    path: /etc/conf
+    settings:
+      drinks:
+        fav: lemonade
+        temperature: cold
+      food:
+        fav: pizza
 '''
 
 import os
@@ -110,6 +130,11 @@ import tempfile
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
+
+# Fake random section to do not match any other in the file
+# Using commit hash as fake section name
+FAKE_SECTION_NAME = "ad01e11446efb704fcdbdb21f2c43757423d91c5"
 
 
 def match_opt(option, line):
@@ -124,10 +149,8 @@ def match_active_opt(option, line):
     return re.match('( |\t)*%s( |\t)*(=|$)' % option, line)
 
 
-def do_ini(module, filename, section=None, option=None, value=None,
-           state='present', backup=False, no_extra_spaces=False, create=True,
-           allow_no_value=False):
-
+def read_ini(module, filename, create=True):
+    """ Read the INI file into a list of lines and start the diff """
     diff = dict(
         before='',
         after='',
@@ -152,6 +175,38 @@ def do_ini(module, filename, section=None, option=None, value=None,
     if module._diff:
         diff['before'] = ''.join(ini_lines)
 
+    return (ini_lines, diff)
+
+
+def write_ini(module, filename, ini_lines, backup=False):
+    """ Atomically replace the INI file with the given lines, returns the backup file name if any """
+    backup_file = None
+    if backup:
+        backup_file = module.backup_local(filename)
+
+    try:
+        tmpfd, tmpfile = tempfile.mkstemp(dir=module.tmpdir)
+        f = os.fdopen(tmpfd, 'w')
+        f.writelines(ini_lines)
+        f.close()
+    except IOError:
+        module.fail_json(msg="Unable to create temporary file %s", traceback=traceback.format_exc())
+
+    try:
+        module.atomic_move(tmpfile, filename)
+    except IOError:
+        module.ansible.fail_json(msg='Unable to move temporary \
+                               file %s to %s, IOError' % (tmpfile, filename), traceback=traceback.format_exc())
+
+    return backup_file
+
+
+def do_ini(module, filename, section=None, option=None, value=None,
+           state='present', backup=False, no_extra_spaces=False, create=True,
+           allow_no_value=False):
+
+    (ini_lines, diff) = read_ini(module, filename, create)
+
     changed = False
 
     # ini file could be empty
@@ -165,19 +220,15 @@ def do_ini(module, filename, section=None, option=None, value=None,
 
     # append fake section lines to simplify the logic
     # At top:
-    # Fake random section to do not match any other in the file
-    # Using commit hash as fake section name
-    fake_section_name = "ad01e11446efb704fcdbdb21f2c43757423d91c5"
-
-    # Insert it at the beginning
-    ini_lines.insert(0, '[%s]' % fake_section_name)
+    # Insert the fake section at the beginning
+    ini_lines.insert(0, '[%s]' % FAKE_SECTION_NAME)
 
     # At botton:
     ini_lines.append('[')
 
     # If no section is defined, fake section is used
     if not section:
-        section = fake_section_name
+        section = FAKE_SECTION_NAME
 
     within_section = not section
     section_start = 0
@@ -263,22 +314,135 @@ def do_ini(module, filename, section=None, option=None, value=None,
 
     backup_file = None
     if changed and not module.check_mode:
-        if backup:
-            backup_file = module.backup_local(filename)
+        backup_file = write_ini(module, filename, ini_lines, backup)
 
-        try:
-            tmpfd, tmpfile = tempfile.mkstemp(dir=module.tmpdir)
-            f = os.fdopen(tmpfd, 'w')
-            f.writelines(ini_lines)
-            f.close()
-        except IOError:
-            module.fail_json(msg="Unable to create temporary file %s", traceback=traceback.format_exc())
+    return (changed, backup_file, diff, msg)
 
-        try:
-            module.atomic_move(tmpfile, filename)
-        except IOError:
-            module.ansible.fail_json(msg='Unable to move temporary \
-                                   file %s to %s, IOError' % (tmpfile, filename), traceback=traceback.format_exc())
+
+def index_sections(ini_lines):
+    """ Split the lines into sections and index them by name
+
+    Every section is a list of lines starting with its header line. The first
+    occurrence of a section name wins, like in do_ini."""
+    sections = []
+    index = {}
+    for line in ini_lines:
+        if line.startswith('['):
+            current = [line]
+            sections.append(current)
+            name = line[1:].split(']', 1)[0]
+            if name not in index:
+                index[name] = current
+        else:
+            current.append(line)
+    return (sections, index)
+
+
+def set_section_option(lines, option, newline):
+    """ Set an option within the lines of a single section, returns whether the section changed """
+    for index in range(1, len(lines)):
+        if match_opt(option, lines[index]):
+            if lines[index] == newline:
+                return False
+            lines[index] = newline
+            # remove all possible option occurrences from the rest of the section
+            lines[index + 1:] = [line for line in lines[index + 1:] if not match_active_opt(option, line)]
+            return True
+
+    # insert missing option line at the end of the section
+    for i in range(len(lines), 0, -1):
+        # search backwards for previous non-blank or non-comment line
+        if not re.match(r'^[ \t]*([#;].*)?$', lines[i - 1]):
+            lines.insert(i, newline)
+            return True
+
+
+def remove_section_option(lines, option):
+    """ Remove an option from the lines of a single section, returns whether the section changed """
+    for index in range(1, len(lines)):
+        if match_active_opt(option, lines[index]):
+            del lines[index]
+            return True
+    return False
+
+
+def do_ini_settings(module, filename, settings, state='present', backup=False,
+                    no_extra_spaces=False, create=True, allow_no_value=False):
+
+    (ini_lines, diff) = read_ini(module, filename, create)
+
+    changed = False
+
+    # ini file could be empty
+    if not ini_lines:
+        ini_lines.append('\n')
+
+    # last line of file may not contain a trailing newline
+    if ini_lines[-1] == "" or ini_lines[-1][-1] != '\n':
+        ini_lines[-1] += '\n'
+        changed = True
+
+    # the fake section holds the options before the first section
+    ini_lines.insert(0, '[%s]' % FAKE_SECTION_NAME)
+    (sections, index) = index_sections(ini_lines)
+
+    if no_extra_spaces:
+        assignment_format = '%s=%s\n'
+    else:
+        assignment_format = '%s = %s\n'
+
+    changes = 0
+    for section, options in settings.items():
+        section = section or FAKE_SECTION_NAME
+        lines = index.get(section)
+
+        if state == 'absent':
+            if lines is None:
+                continue
+            if not options:
+                if section != FAKE_SECTION_NAME:
+                    sections.remove(lines)
+                    del index[section]
+                    changes += 1
+                continue
+            for option in options:
+                if remove_section_option(lines, option):
+                    changes += 1
+            continue
+
+        if lines is None:
+            lines = ['[%s]\n' % section]
+            sections.append(lines)
+            index[section] = lines
+            if not options:
+                # an empty section is a change of its own, otherwise its options are
+                changes += 1
+
+        for option, value in (options or {}).items():
+            if value is not None:
+                value = to_text(value)
+            if not value and allow_no_value:
+                newline = '%s\n' % option
+            else:
+                newline = assignment_format % (option, value)
+            if set_section_option(lines, option, newline):
+                changes += 1
+
+    # remove the fake section line
+    ini_lines = [line for lines in sections for line in lines][1:]
+
+    if changes:
+        changed = True
+        msg = '%d settings changed' % changes
+    else:
+        msg = 'OK'
+
+    if module._diff:
+        diff['after'] = ''.join(ini_lines)
+
+    backup_file = None
+    if changed and not module.check_mode:
+        backup_file = write_ini(module, filename, ini_lines, backup)
 
     return (changed, backup_file, diff, msg)
 
@@ -288,15 +452,24 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             path=dict(type='path', required=True, aliases=['dest']),
-            section=dict(type='str', required=True),
+            section=dict(type='str'),
             option=dict(type='str'),
             value=dict(type='str'),
             backup=dict(type='bool', default=False),
             state=dict(type='str', default='present', choices=['absent', 'present']),
             no_extra_spaces=dict(type='bool', default=False),
             allow_no_value=dict(type='bool', default=False),
-            create=dict(type='bool', default=True)
+            create=dict(type='bool', default=True),
+            settings=dict(type='dict'),
         ),
+        required_one_of=[
+            ['section', 'settings'],
+        ],
+        mutually_exclusive=[
+            ['settings', 'section'],
+            ['settings', 'option'],
+            ['settings', 'value'],
+        ],
         add_file_common_args=True,
         supports_check_mode=True,
     )
@@ -310,8 +483,12 @@ def main():
     no_extra_spaces = module.params['no_extra_spaces']
     allow_no_value = module.params['allow_no_value']
     create = module.params['create']
+    settings = module.params['settings']
 
-    (changed, backup_file, diff, msg) = do_ini(module, path, section, option, value, state, backup, no_extra_spaces, create, allow_no_value)
+    if settings is not None:
+        (changed, backup_file, diff, msg) = do_ini_settings(module, path, settings, state, backup, no_extra_spaces, create, allow_no_value)
+    else:
+        (changed, backup_file, diff, msg) = do_ini(module, path, section, option, value, state, backup, no_extra_spaces, create, allow_no_value)
 
     if not module.check_mode and os.path.exists(path):
         file_args = module.load_file_common_arguments(module.params)
@@ -134,6 +134,60 @@ options:
       - This parameter requires C(xpath) to be set.
     type: bool
     default: no
+  edits:
+    description:
+      - A list of edits to apply, in order, to a single parse of the document.
+      - The document is parsed once, every edit is applied to the same tree and the result is written once.
+      - All XPath expressions are compiled before any edit is applied, so a syntax error in any edit leaves the document untouched.
+      - The top-level C(namespaces) are used for all edits.
+      - Mutually exclusive with C(xpath) and the single-edit parameters.
+    type: list
+    elements: dict
+    suboptions:
+      xpath:
+        description:
+          - A valid XPath expression describing the item(s) you want to manipulate.
+        type: str
+        required: yes
+      state:
+        description:
+          - Set or remove an xpath selection (node(s), attribute(s)).
+        type: str
+        choices: [ absent, present ]
+        default: present
+      attribute:
+        description:
+          - The attribute to select when using parameter C(value).
+        type: raw
+      value:
+        description:
+          - Desired state of the selected attribute, see the top-level C(value) option.
+        type: raw
+      add_children:
+        description:
+          - Add additional child-element(s) to a selected element, see the top-level C(add_children) option.
+        type: list
+      set_children:
+        description:
+          - Set the child-element(s) of a selected element, see the top-level C(set_children) option.
+        type: list
+      input_type:
+        description:
+          - Type of input for C(add_children) and C(set_children).
+        type: str
+        choices: [ xml, yaml ]
+        default: yaml
+      insertbefore:
+        description:
+          - Add C(add_children) before the first selected element.
+        type: bool
+        default: no
+      insertafter:
+        description:
+          - Add C(add_children) after the last selected element.
+        type: bool
+        default: no
+    version_added: 1.0.0
 requirements:
 - lxml >= 2.3.0
 notes:
@@ -285,6 +339,20 @@ EXAMPLES = r'''
       z: http://z.test
     attribute: z:my_namespaced_attribute
     value: 'false'
+
+- name: Apply several edits with a single parse and write of the file
+  xml:
+    path: /foo/bar.xml
+    edits:
+    - xpath: /business/rating
+      value: '11'
+    - xpath: /business/rating/@subjective
+      state: absent
+    - xpath: /business/beers
+      add_children:
+      - beer: Old Rasputin
+    - xpath: /business/website/validxhtml
+  register: xml_edits
 '''
 
 RETURN = r'''
@@ -298,6 +366,12 @@ backup_file:
     type: str
     returned: when backup=yes
     sample: /path/to/file.xml.1942.2017-08-24@14:16:01~
+edits:
+    description: The per-edit result, in the order the edits were given.
+    type: list
+    returned: when parameter 'edits' is set
+    sample: [{xpath: /business/rating, state: present, changed: true}]
+    version_added: 1.0.0
 count:
     description: The count of xpath matches.
     type: int
@@ -409,8 +483,9 @@ def xpath_matches(tree, xpath, namespaces):
     return False
 
 
-def delete_xpath_target(module, tree, xpath, namespaces):
+def delete_xpath_target_inner(module, tree, xpath, namespaces):
     """ Delete an attribute or element from a tree """
+    changed = False
     try:
         for result in tree.xpath(xpath, namespaces=namespaces):
             # Get the xpath for this result
@@ -426,10 +501,16 @@ def delete_xpath_target(module, tree, xpath, namespaces):
                 result.getparent().remove(result)
             else:
                 raise Exception("Impossible error")
+            changed = True
     except Exception as e:
         module.fail_json(msg="Couldn't delete xpath target: %s (%s)" % (xpath, e))
-    else:
-        finish(module, tree, xpath, namespaces, changed=True)
+
+    return changed
+
+
+def delete_xpath_target(module, tree, xpath, namespaces):
+    delete_xpath_target_inner(module, tree, xpath, namespaces)
+    finish(module, tree, xpath, namespaces, changed=True)
 
 
 def replace_children_of(children, match):
@@ -469,7 +550,7 @@ def set_target_children(module, tree, xpath, namespaces, children, in_type):
     finish(module, tree, xpath, namespaces, changed=changed)
 
 
-def add_target_children(module, tree, xpath, namespaces, children, in_type, insertbefore, insertafter):
+def add_target_children_inner(module, tree, xpath, namespaces, children, in_type, insertbefore, insertafter):
     if is_node(tree, xpath, namespaces):
         new_kids = children_to_nodes(module, children, in_type)
         if insertbefore or insertafter:
@@ -477,9 +558,14 @@ def add_target_children(module, tree, xpath, namespaces, children, in_type, inse
         else:
             for node in tree.xpath(xpath, namespaces=namespaces):
                 node.extend(new_kids)
-        finish(module, tree, xpath, namespaces, changed=True)
-    else:
-        finish(module, tree, xpath, namespaces)
+        return True
+
+    return False
+
+
+def add_target_children(module, tree, xpath, namespaces, children, in_type, insertbefore, insertafter):
+    changed = add_target_children_inner(module, tree, xpath, namespaces, children, in_type, insertbefore, insertafter)
+    finish(module, tree, xpath, namespaces, changed=changed)
 
 
 def insert_target_children(tree, xpath, namespaces, children, insertbefore, insertafter):
@@ -613,12 +699,17 @@ def check_or_make_target(module, tree, xpath, namespaces):
     return changed
 
 
-def ensure_xpath_exists(module, tree, xpath, namespaces):
+def ensure_xpath_exists_inner(module, tree, xpath, namespaces):
     changed = False
 
     if not is_node(tree, xpath, namespaces):
         changed = check_or_make_target(module, tree, xpath, namespaces)
 
+    return changed
+
+
+def ensure_xpath_exists(module, tree, xpath, namespaces):
+    changed = ensure_xpath_exists_inner(module, tree, xpath, namespaces)
     finish(module, tree, xpath, namespaces, changed)
 
 
@@ -761,7 +852,46 @@ def make_pretty(module, tree):
     module.exit_json(**result)
 
 
-def finish(module, tree, xpath, namespaces, changed=False, msg='', hitcount=0, matches=tuple()):
+def validate_edits(module, edits, namespaces):
+    """ Check the syntax of all edit xpaths up front, so that no edit is applied when any of them is invalid """
+    for edit in edits:
+        try:
+            etree.XPath(edit['xpath'], namespaces=namespaces)
+        except etree.XPathSyntaxError as e:
+            module.fail_json(msg="Syntax error in xpath expression: %s (%s)" % (edit['xpath'], e))
+        except etree.XPathEvalError as e:
+            module.fail_json(msg="Evaluation error in xpath expression: %s (%s)" % (edit['xpath'], e))
+
+
+def apply_edits(module, tree, edits, namespaces):
+    """ Apply a list of edits to one parsed tree and write it out once """
+    validate_edits(module, edits, namespaces)
+
+    results = []
+    for edit in edits:
+        xpath = edit['xpath']
+        value = json_dict_bytes_to_unicode(edit['value'])
+        set_children = json_dict_bytes_to_unicode(edit['set_children'])
+        add_children = json_dict_bytes_to_unicode(edit['add_children'])
+
+        if edit['state'] == 'absent':
+            changed = delete_xpath_target_inner(module, tree, xpath, namespaces)
+        elif set_children is not None:
+            changed = set_target_children_inner(module, tree, xpath, namespaces, set_children, edit['input_type'])
+        elif add_children:
+            changed = add_target_children_inner(module, tree, xpath, namespaces, add_children, edit['input_type'],
+                                                edit['insertbefore'], edit['insertafter'])
+        elif value is not None:
+            changed = set_target_inner(module, tree, xpath, namespaces, edit['attribute'], value)
+        else:
+            changed = ensure_xpath_exists_inner(module, tree, xpath, namespaces)
+
+        results.append(dict(xpath=xpath, state=edit['state'], changed=changed))
+
+    finish(module, tree, None, namespaces, edits=results)
+
+
+def finish(module, tree, xpath, namespaces, changed=False, msg='', hitcount=0, matches=tuple(), edits=None):
 
     result = dict(
         actions=dict(
@@ -778,6 +908,9 @@ def finish(module, tree, xpath, namespaces, changed=False, msg='', hitcount=0, m
     if module.params['print_match'] or matches:
         result['matches'] = matches
 
+    if edits is not None:
+        result['edits'] = edits
+
     if msg:
         result['msg'] = msg
 
@@ -820,6 +953,20 @@ def main():
             strip_cdata_tags=dict(type='bool', default=False),
             insertbefore=dict(type='bool', default=False),
             insertafter=dict(type='bool', default=False),
+            edits=dict(type='list', elements='dict', options=dict(
+                xpath=dict(type='str', required=True),
+                state=dict(type='str', default='present', choices=['absent', 'present']),
+                attribute=dict(type='raw'),
+                value=dict(type='raw'),
+                add_children=dict(type='list'),
+                set_children=dict(type='list'),
+                input_type=dict(type='str', default='yaml', choices=['xml', 'yaml']),
+                insertbefore=dict(type='bool', default=False),
+                insertafter=dict(type='bool', default=False),
+            ), mutually_exclusive=[
+                ['add_children', 'set_children', 'value'],
+                ['insertbefore', 'insertafter'],
+            ]),
         ),
         supports_check_mode=True,
         required_by=dict(
@@ -838,10 +985,11 @@ def main():
         ],
         required_one_of=[
             ['path', 'xmlstring'],
-            ['add_children', 'content', 'count', 'pretty_print', 'print_match', 'set_children', 'value'],
+            ['add_children', 'content', 'count', 'edits', 'pretty_print', 'print_match', 'set_children', 'value'],
         ],
         mutually_exclusive=[
-            ['add_children', 'content', 'count', 'print_match', 'set_children', 'value'],
+            ['add_children', 'content', 'count', 'edits', 'print_match', 'set_children', 'value'],
+            ['edits', 'xpath'],
             ['path', 'xmlstring'],
             ['insertbefore', 'insertafter'],
         ],
@@ -865,6 +1013,7 @@ def main():
     strip_cdata_tags = module.params['strip_cdata_tags']
     insertbefore = module.params['insertbefore']
     insertafter = module.params['insertafter']
+    edits = module.params['edits']
 
     # Check if we have lxml 2.3.0 or newer installed
     if not HAS_LXML:
@@ -908,6 +1057,9 @@ def main():
     global orig_doc
     orig_doc = copy.deepcopy(doc)
 
+    if edits is not None:
+        apply_edits(module, doc, edits, namespaces)
+
     if print_match:
         do_print_match(module, doc, xpath, namespaces)
 
@@ -467,6 +467,17 @@ options:
                     - For OpenID-Connect clients, client certificate for validating JWT issued by
                       client and signed by its key, base64-encoded.
 
+    clients:
+        description:
+            - A list of clients to manage in I(realm), instead of the client described by the other options.
+            - Each item takes the options of this module which describe a client, such as I(client_id),
+              I(id), I(name) or I(redirect_uris), and I(state), which defaults to the value of the I(state) option.
+            - The clients of the realm are read once and the changes are sent over a single kept-alive
+              connection. Clients which already match their item are not updated.
+        type: list
+        elements: dict
+        version_added: 1.0.0
+
 extends_documentation_fragment:
 - community.general.keycloak
 
@@ -584,6 +595,25 @@ EXAMPLES = '''
       use.jwks.url: true
       jwks.url: JWKS_URL_FOR_CLIENT_AUTH_JWT
       jwt.credential.certificate: JWT_CREDENTIAL_CERTIFICATE_FOR_CLIENT_AUTH
+
+- name: Manage many Keycloak clients of a realm at once
+  local_action:
+    module: keycloak_client
+    auth_client_id: admin-cli
+    auth_keycloak_url: https://auth.example.com/auth
+    auth_realm: master
+    auth_username: USERNAME
+    auth_password: PASSWORD
+    token_cache: yes
+    realm: master
+    clients:
+      - client_id: app01
+        redirect_uris:
+          - https://app01.example.com/*
+      - client_id: app02
+        public_client: True
+      - client_id: old_app
+        state: absent
 '''
 
 RETURN = '''
@@ -620,6 +650,18 @@ end_state:
             "request.object.signature.alg": "RS256",
         }
     }
+
+clients:
+    description: The result of each item of I(clients), with the C(diff) between the client before and after in diff mode
+    returned: when I(clients) is used
+    type: list
+    elements: dict
+    sample: [{
+        "client_id": "app01",
+        "changed": true,
+        "msg": "Client app01 has been updated."
+    }]
+    version_added: 1.0.0
 '''
 
 from ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak import KeycloakAPI, camel, \
@@ -642,6 +684,101 @@ def sanitize_cr(clientrep):
     return result
 
 
+def client_changeset(params):
+    """ Builds the changes to a client representation from module parameters
+
+    :param params: the module parameters, or the parameters of an item of clients
+    :return: dict of the client representation parameters to change
+    """
+    # convert module parameters to client representation parameters (if they belong in there)
+    client_params = [x for x in params
+                     if x not in list(keycloak_argument_spec().keys()) + ['state', 'realm', 'clients'] and
+                     params.get(x) is not None]
+
+    changeset = dict()
+
+    for client_param in client_params:
+        new_param_value = params.get(client_param)
+
+        # some lists in the Keycloak API are sorted, some are not.
+        if isinstance(new_param_value, list):
+            if client_param in ['attributes']:
+                try:
+                    new_param_value = sorted(new_param_value)
+                except TypeError:
+                    pass
+        # Unfortunately, the ansible argument spec checker introduces variables with null values when
+        # they are not specified
+        if client_param == 'protocol_mappers':
+            new_param_value = [dict((k, v) for k, v in x.items() if x[k] is not None) for x in new_param_value]
+
+        changeset[camel(client_param)] = new_param_value
+
+    return changeset
+
+
+def sync_clients(module, kc, realm, items):
+    """ Creates, updates and deletes the clients of items, reading the clients of the realm only once
+
+    :param module: the AnsibleModule
+    :param kc: the KeycloakAPI
+    :param realm: the realm of the clients
+    :param items: list of dicts of client parameters and state
+    :return: list of dicts with the result of each item
+    """
+    existing = kc.get_clients(realm=realm)
+    by_id = dict((client['id'], client) for client in existing)
+    by_client_id = dict((client['clientId'], client) for client in existing)
+
+    results = []
+    for item in items:
+        changeset = client_changeset(item)
+        if item['id'] is not None:
+            before_client = by_id.get(item['id'], dict())
+        else:
+            before_client = by_client_id.get(item['client_id'], dict())
+
+        updated_client = before_client.copy()
+        updated_client.update(changeset)
+        client_id = updated_client.get('clientId', item['id'])
+        result = dict(client_id=client_id, changed=False)
+
+        if before_client == dict():
+            if item['state'] == 'absent':
+                after_client = dict()
+                result['msg'] = 'Client %s does not exist, doing nothing.' % client_id
+            else:
+                if 'clientId' not in updated_client:
+                    module.fail_json(msg='client_id needs to be specified when creating a new client', clients=results)
+                result['changed'] = True
+                if not module.check_mode:
+                    kc.create_client(updated_client, realm=realm)
+                after_client = updated_client
+                result['msg'] = 'Client %s has been created.' % client_id
+        elif item['state'] == 'present':
+            after_client = updated_client
+            if before_client != updated_client:
+                result['changed'] = True
+                if not module.check_mode:
+                    kc.update_client(before_client['id'], updated_client, realm=realm)
+                result['msg'] = 'Client %s has been updated.' % client_id
+            else:
+                result['msg'] = 'Client %s is up to date.' % client_id
+        else:
+            after_client = dict()
+            result['changed'] = True
+            if not module.check_mode:
+                kc.delete_client(before_client['id'], realm=realm)
+            result['msg'] = 'Client %s has been deleted.' % client_id
+
+        if module._diff:
+            result['diff'] = dict(before=sanitize_cr(before_client) if before_client else '',
+                                  after=sanitize_cr(after_client) if after_client else '')
+        results.append(result)
+
+    return results
+
+
 def main():
     """
     Module execution
@@ -701,11 +838,16 @@ def main():
         protocol_mappers=dict(type='list', elements='dict', options=protmapper_spec, aliases=['protocolMappers']),
         authorization_settings=dict(type='dict', aliases=['authorizationSettings']),
     )
+    client_spec = dict((k, v) for k, v in meta_args.items() if k not in ['state', 'realm'])
+    client_spec['state'] = dict(choices=['present', 'absent'])
+    meta_args['clients'] = dict(type='list', elements='dict', options=client_spec,
+                                required_one_of=[['client_id', 'id']])
     argument_spec.update(meta_args)
 
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
-                           required_one_of=([['client_id', 'id']]))
+                           required_one_of=([['client_id', 'id', 'clients']]),
+                           mutually_exclusive=([['clients', 'client_id'], ['clients', 'id']]))
 
     result = dict(changed=False, msg='', diff={}, proposed={}, existing={}, end_state={})
 
@@ -719,6 +861,7 @@ def main():
             auth_username=module.params.get('auth_username'),
             auth_password=module.params.get('auth_password'),
             client_secret=module.params.get('auth_client_secret'),
+            token_cache=module.params.get('token_cache'),
         )
     except KeycloakError as e:
         module.fail_json(msg=str(e))
@@ -729,11 +872,19 @@ def main():
     cid = module.params.get('id')
     state = module.params.get('state')
 
-    # convert module parameters to client representation parameters (if they belong in there)
-    client_params = [x for x in module.params
-                     if x not in list(keycloak_argument_spec().keys()) + ['state', 'realm'] and
-                     module.params.get(x) is not None]
-    keycloak_argument_spec().keys()
+    if module.params.get('clients') is not None:
+        items = []
+        for item in module.params.get('clients'):
+            # Drop the aliases, which are kept next to the option names in the items
+            item = dict((k, v) for k, v in item.items() if k in client_spec)
+            if item['state'] is None:
+                item['state'] = state
+            items.append(item)
+        results = sync_clients(module, kc, realm, items)
+        changed = any(item_result['changed'] for item_result in results)
+        module.exit_json(changed=changed, clients=results,
+                         msg='%d of %d clients have been changed.' % (len([r for r in results if r['changed']]), len(results)))
+
     # See whether the client already exists in Keycloak
     if cid is None:
         before_client = kc.get_client_by_clientid(module.params.get('client_id'), realm=realm)
@@ -746,24 +897,7 @@ def main():
         before_client = dict()
 
     # Build a proposed changeset from parameters given to this module
-    changeset = dict()
-
-    for client_param in client_params:
-        new_param_value = module.params.get(client_param)
-
-        # some lists in the Keycloak API are sorted, some are not.
-        if isinstance(new_param_value, list):
-            if client_param in ['attributes']:
-                try:
-                    new_param_value = sorted(new_param_value)
-                except TypeError:
-                    pass
-        # Unfortunately, the ansible argument spec checker introduces variables with null values when
-        # they are not specified
-        if client_param == 'protocol_mappers':
-            new_param_value = [dict((k, v) for k, v in x.items() if x[k] is not None) for x in new_param_value]
-
-        changeset[camel(client_param)] = new_param_value
+    changeset = client_changeset(module.params)
 
     # Whether creating or updating a client, take the before-state and merge the changeset into it
     updated_client = before_client.copy()
@@ -293,6 +293,7 @@ def main():
             auth_username=module.params.get('auth_username'),
             auth_password=module.params.get('auth_password'),
             client_secret=module.params.get('auth_client_secret'),
+            token_cache=module.params.get('token_cache'),
         )
     except KeycloakError as e:
         module.fail_json(msg=str(e))
@@ -306,7 +307,7 @@ def main():
     clientt_params = [x for x in module.params
                       if x not in ['state', 'auth_keycloak_url', 'auth_client_id', 'auth_realm',
                                    'auth_client_secret', 'auth_username', 'auth_password',
-                                   'validate_certs', 'realm'] and module.params.get(x) is not None]
+                                   'validate_certs', 'token_cache', 'realm'] and module.params.get(x) is not None]
 
     # See whether the client template already exists in Keycloak
     if cid is None:
@@ -238,6 +238,7 @@ def main():
             auth_username=module.params.get('auth_username'),
             auth_password=module.params.get('auth_password'),
             client_secret=module.params.get('auth_client_secret'),
+            token_cache=module.params.get('token_cache'),
         )
     except KeycloakError as e:
         module.fail_json(msg=str(e))
@@ -148,6 +148,72 @@ options:
     type: str
     required: true
     aliases: [ domain ]
+  records:
+    description:
+    - List of records to synchronize with the zone.
+    - The records of the zone are fetched once, the records to create, update and delete are computed locally
+      and the changes are applied concurrently, see I(concurrency) and I(rate_limit).
+    - Only the record types with a plain value are supported.
+    - I(ttl), I(priority), I(proxied), I(solo) and I(state) default to the values of the options of the same name.
+    - Cannot be used with I(type) and I(value).
+    type: list
+    elements: dict
+    suboptions:
+      record:
+        description:
+        - Record name, see the I(record) option.
+        type: str
+        default: '@'
+        aliases: [ name ]
+      type:
+        description:
+        - The type of the record.
+        type: str
+        required: true
+        choices: [ A, AAAA, CNAME, MX, NS, SPF, TXT ]
+      value:
+        description:
+        - The record value.
+        - Required when the record is present.
+        - When the record is absent and I(value) is not set, all the records with this name and type are deleted.
+        type: str
+        aliases: [ content ]
+      ttl:
+        description:
+        - The TTL of the record.
+        type: int
+      priority:
+        description:
+        - Priority of the C(MX) record.
+        type: int
+      proxied:
+        description:
+        - Proxy through Cloudflare network or just use DNS.
+        type: bool
+      solo:
+        description:
+        - Delete all the other records with the same record name and type that are not in I(records).
+        type: bool
+      state:
+        description:
+        - Whether the record should exist or not.
+        type: str
+        choices: [ absent, present ]
+    version_added: 1.0.0
+  concurrency:
+    description:
+    - Number of concurrent API calls when synchronizing I(records).
+    type: int
+    default: 4
+    version_added: 1.0.0
+  rate_limit:
+    description:
+    - Maximum number of API calls per second when synchronizing I(records).
+    - The default stays below the Cloudflare limit of 1200 calls per 5 minutes.
+      Rate limited calls are retried.
+    type: float
+    default: 4
+    version_added: 1.0.0
 '''
 
 EXAMPLES = r'''
@@ -260,6 +326,30 @@ EXAMPLES = r'''
     algorithm: 8
     hash_type: 2
     value: B4EB5AC4467D2DFB3BAF9FB9961DC1B6FED54A58CDFAA3E465081EC86F89BFAB
+
+- name: Synchronize many records of example.net at once
+  cloudflare_dns:
+    zone: example.net
+    api_token: dummyapitoken
+    ttl: 600
+    records:
+      - record: test
+        type: A
+        value: 127.0.0.1
+      - record: www
+        type: CNAME
+        value: example.com
+        proxied: yes
+      - type: MX
+        value: mail.example.net
+        priority: 10
+      - record: test
+        type: TXT
+        value: unique value
+        solo: yes
+      - record: old
+        type: A
+        state: absent
 '''
 
 RETURN = r'''
@@ -351,9 +441,30 @@ record:
             returned: success
             type: str
             sample: sample.com
+created:
+    description: The records created when synchronizing I(records).
+    returned: success, when I(records) is used
+    type: list
+    elements: dict
+    version_added: 1.0.0
+updated:
+    description: The records updated when synchronizing I(records).
+    returned: success, when I(records) is used
+    type: list
+    elements: dict
+    version_added: 1.0.0
+deleted:
+    description: The records deleted when synchronizing I(records).
+    returned: success, when I(records) is used
+    type: list
+    elements: dict
+    version_added: 1.0.0
 '''
 
 import json
+import threading
+import time
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves.urllib.parse import urlencode
@@ -361,12 +472,41 @@ from ansible.module_utils._text import to_native, to_text
 from ansible.module_utils.urls import fetch_url
 
 
+# Maximum page size of the DNS records list
+CF_MAX_PER_PAGE = 5000
+# Number of retries of a rate limited call when synchronizing records
+CF_MAX_RETRIES = 5
+
+
 def lowercase_string(param):
     if not isinstance(param, str):
         return param
     return param.lower()
 
 
+class CloudflareAPIError(Exception):
+    def __init__(self, msg, status=None):
+        super(CloudflareAPIError, self).__init__(msg)
+        self.status = status
+
+
+class RateLimiter(object):
+    """Space the start of the calls made by several threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_call = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.time()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class CloudflareAPI(object):
 
     cf_api_endpoint = 'https://api.cloudflare.com/client/v4'
@@ -426,6 +566,13 @@ class CloudflareAPI(object):
                 self.module.fail_json(msg="DS records only apply to subdomains.")
 
     def _cf_simple_api_call(self, api_call, method='GET', payload=None):
+        try:
+            return self._cf_request(api_call, method, payload)
+        except CloudflareAPIError as e:
+            self.module.fail_json(msg=to_native(e))
+
+    def _cf_request(self, api_call, method='GET', payload=None):
+        # Raise CloudflareAPIError instead of failing, so that it can be called from threads
         if self.api_token:
             headers = {
                 'Authorization': 'Bearer ' + self.api_token,
@@ -442,7 +589,7 @@ class CloudflareAPI(object):
             try:
                 data = json.dumps(payload)
             except Exception as e:
-                self.module.fail_json(msg="Failed to encode payload as JSON: %s " % to_native(e))
+                raise CloudflareAPIError("Failed to encode payload as JSON: %s " % to_native(e))
 
         resp, info = fetch_url(self.module,
                                self.cf_api_endpoint + api_call,
@@ -452,7 +599,8 @@ class CloudflareAPI(object):
                                timeout=self.timeout)
 
         if info['status'] not in [200, 304, 400, 401, 403, 429, 405, 415]:
-            self.module.fail_json(msg="Failed API call {0}; got unexpected HTTP code {1}: {2}".format(api_call, info['status'], info.get('msg')))
+            raise CloudflareAPIError("Failed API call {0}; got unexpected HTTP code {1}: {2}".format(api_call, info['status'], info.get('msg')),
+                                     info['status'])
 
         error_msg = ''
         if info['status'] == 401:
@@ -491,11 +639,11 @@ class CloudflareAPI(object):
 
         # Without a valid/parsed JSON response no more error processing can be done
         if result is None:
-            self.module.fail_json(msg=error_msg)
+            raise CloudflareAPIError(error_msg, info['status'])
 
         if 'success' not in result:
             error_msg += "; Unexpected error details: {0}".format(result.get('error'))
-            self.module.fail_json(msg=error_msg)
+            raise CloudflareAPIError(error_msg, info['status'])
 
         if not result['success']:
             error_msg += "; Error details: "
@@ -504,7 +652,7 @@ class CloudflareAPI(object):
                 if 'error_chain' in error:
                     for chain_error in error['error_chain']:
                         error_msg += "code: {0}, error: {1}; ".format(chain_error['code'], chain_error['message'])
-            self.module.fail_json(msg=error_msg)
+            raise CloudflareAPIError(error_msg, info['status'])
 
         return result, info['status']
 
@@ -517,16 +665,16 @@ class CloudflareAPI(object):
             pagination = result['result_info']
             if pagination['total_pages'] > 1:
                 next_page = int(pagination['page']) + 1
-                parameters = ['page={0}'.format(next_page)]
+                parameters = []
                 # strip "page" parameter from call parameters (if there are any)
                 if '?' in api_call:
                     raw_api_call, query = api_call.split('?', 1)
-                    parameters += [param for param in query.split('&') if not param.startswith('page')]
+                    parameters += [param for param in query.split('&') if not param.startswith('page=')]
                 else:
                     raw_api_call = api_call
                 while next_page <= pagination['total_pages']:
-                    raw_api_call += '?' + '&'.join(parameters)
-                    result, status = self._cf_simple_api_call(raw_api_call, method, payload)
+                    page_api_call = raw_api_call + '?' + '&'.join(['page={0}'.format(next_page)] + parameters)
+                    result, status = self._cf_simple_api_call(page_api_call, method, payload)
                     data += result['result']
                     next_page += 1
 
@@ -782,6 +930,142 @@ class CloudflareAPI(object):
         self.changed = True
         return result, self.changed
 
+    def _normalize_record(self, record):
+        record = lowercase_string(record)
+        if record == '@':
+            record = self.zone
+        if not record.endswith(self.zone):
+            record = record + '.' + self.zone
+        return record
+
+    @staticmethod
+    def _normalize_value(type, value):
+        if (type in ['CNAME', 'NS', 'MX']) and (value is not None):
+            return value.rstrip('.').lower()
+        if (type == 'AAAA') and (value is not None):
+            return value.lower()
+        return value
+
+    def _cf_sync_call(self, call):
+        """Run an API call of the synchronization, and return a tuple (call, result, error)"""
+        api_call, method, payload = call[1:4]
+        for attempt in range(CF_MAX_RETRIES + 1):
+            self.rate_limiter.wait()
+            try:
+                result, status = self._cf_request(api_call, method, payload)
+                return call, result['result'], None
+            except CloudflareAPIError as e:
+                if e.status != 429 or attempt == CF_MAX_RETRIES:
+                    return call, None, to_native(e)
+            # Back off before retrying a rate limited call
+            time.sleep(2 ** attempt)
+
+    def sync_dns_records(self, entries):
+        """
+        Synchronize the zone with entries, fetching the records of the zone once and
+        applying the changes concurrently
+        """
+        zone_id = self._get_zone_id()
+        current, status = self._cf_api_call('/zones/{0}/dns_records?per_page={1}'.format(zone_id, CF_MAX_PER_PAGE))
+
+        # Index the records by (type, name, content), and by (type, name)
+        index = {}
+        by_name = {}
+        for rr in current:
+            index[(rr['type'], rr['name'], rr['content'])] = rr
+            by_name.setdefault((rr['type'], rr['name']), []).append(rr)
+
+        calls = []
+        kept = set()
+        to_delete = {}
+        for entry in entries:
+            type = entry['type']
+            name = self._normalize_record(entry['record'])
+            value = self._normalize_value(type, entry['value'])
+
+            if entry['state'] == 'absent':
+                if value is None:
+                    matches = by_name.get((type, name), [])
+                else:
+                    matches = [index[(type, name, value)]] if (type, name, value) in index else []
+                for rr in matches:
+                    to_delete[rr['id']] = rr
+                continue
+
+            if not value:
+                self.module.fail_json(msg="You must provide a non-empty value for the {0} record {1}".format(type, name))
+
+            new_record = {
+                "type": type,
+                "name": name,
+                "content": value,
+                "ttl": entry['ttl'],
+            }
+            if type in ['A', 'AAAA', 'CNAME']:
+                new_record['proxied'] = entry['proxied']
+            if type == 'MX':
+                new_record['priority'] = entry['priority']
+
+            # there can only be one CNAME per record, its value can be updated
+            if type == 'CNAME' and by_name.get((type, name)):
+                cur_record = by_name[(type, name)][0]
+            else:
+                cur_record = index.get((type, name, value))
+
+            if entry['solo']:
+                for rr in by_name.get((type, name), []):
+                    if rr is not cur_record:
+                        to_delete.setdefault(rr['id'], rr)
+
+            if cur_record is None:
+                calls.append(('created', '/zones/{0}/dns_records'.format(zone_id), 'POST', new_record))
+                continue
+
+            kept.add(cur_record['id'])
+            do_update = cur_record['content'] != value
+            if (entry['ttl'] is not None) and (cur_record['ttl'] != entry['ttl']):
+                do_update = True
+            if ('priority' in new_record) and ('priority' in cur_record) and (cur_record['priority'] != entry['priority']):
+                do_update = True
+            if ('proxied' in new_record) and ('proxied' in cur_record) and (cur_record['proxied'] != entry['proxied']):
+                do_update = True
+            if do_update:
+                calls.append(('updated', '/zones/{0}/dns_records/{1}'.format(zone_id, cur_record['id']), 'PUT', new_record))
+
+        for rr_id, rr in to_delete.items():
+            # a record which is also wanted by another entry is kept
+            if rr_id not in kept:
+                calls.append(('deleted', '/zones/{0}/dns_records/{1}'.format(zone_id, rr_id), 'DELETE', rr))
+
+        result = dict(created=[], updated=[], deleted=[])
+        if self.module.check_mode:
+            for call in calls:
+                result[call[0]].append(call[3])
+            return result, bool(calls)
+
+        errors = []
+        if calls:
+            self.rate_limiter = RateLimiter(self.module.params['rate_limit'])
+            pool = ThreadPool(min(self.module.params['concurrency'], len(calls)))
+            try:
+                for call, call_result, error in pool.imap_unordered(self._cf_sync_call, calls):
+                    if error is not None:
+                        errors.append(error)
+                    elif call[0] == 'deleted':
+                        result['deleted'].append(call[3])
+                    else:
+                        result[call[0]].append(call_result)
+            finally:
+                pool.close()
+                pool.join()
+
+        changed = any(result.values())
+        if errors:
+            self.module.fail_json(msg="Failed to synchronize {0} records: {1}".format(len(errors), '; '.join(errors)),
+                                  changed=changed, result=result)
+
+        return result, changed
+
 
 def main():
     module = AnsibleModule(
@@ -808,10 +1092,25 @@ def main():
             value=dict(type='str', aliases=['content']),
             weight=dict(type='int', default=1),
             zone=dict(type='str', required=True, aliases=['domain']),
+            records=dict(type='list', elements='dict', options=dict(
+                record=dict(type='str', default='@', aliases=['name']),
+                type=dict(type='str', required=True, choices=['A', 'AAAA', 'CNAME', 'MX', 'NS', 'SPF', 'TXT']),
+                value=dict(type='str', aliases=['content']),
+                ttl=dict(type='int'),
+                priority=dict(type='int'),
+                proxied=dict(type='bool'),
+                solo=dict(type='bool'),
+                state=dict(type='str', choices=['absent', 'present']),
+            )),
+            concurrency=dict(type='int', default=4),
+            rate_limit=dict(type='float', default=4),
         ),
         supports_check_mode=True,
+        mutually_exclusive=[
+            ('records', 'type'),
+            ('records', 'value'),
+        ],
         required_if=[
-            ('state', 'present', ['record', 'type', 'value']),
             ('state', 'absent', ['record']),
             ('type', 'SRV', ['proto', 'service']),
             ('type', 'TLSA', ['proto', 'port']),
@@ -820,6 +1119,13 @@ def main():
 
     if not module.params['api_token'] and not (module.params['account_api_key'] and module.params['account_email']):
         module.fail_json(msg="Either api_token or account_api_key and account_email params are required.")
+    if module.params['records'] is None:
+        # required_if does not apply when synchronizing records
+        missing = [param for param in ['record', 'type', 'value'] if module.params[param] is None]
+        if module.params['state'] == 'present' and missing:
+            module.fail_json(msg="state is present but all of the following are missing: {0}".format(', '.join(missing)))
+    elif module.params['concurrency'] < 1 or module.params['rate_limit'] <= 0:
+        module.fail_json(msg="concurrency and rate_limit must be positive numbers.")
     if module.params['type'] == 'SRV':
         if not ((module.params['weight'] is not None and module.params['port'] is not None
                  and not (module.params['value'] is None or module.params['value'] == ''))
@@ -851,6 +1157,19 @@ def main():
     changed = False
     cf_api = CloudflareAPI(module)
 
+    if module.params['records'] is not None:
+        entries = []
+        for entry in module.params['records']:
+            entry = dict(entry)
+            for param in ['ttl', 'priority', 'proxied', 'solo', 'state']:
+                if entry[param] is None:
+                    entry[param] = module.params[param]
+            if entry['solo'] and entry['state'] == 'absent':
+                module.fail_json(msg="solo=true can only be used with state=present")
+            entries.append(entry)
+        result, changed = cf_api.sync_dns_records(entries)
+        module.exit_json(changed=changed, **result)
+
     # sanity checks
     if cf_api.is_solo and cf_api.state == 'absent':
         module.fail_json(msg="solo=true can only be used with state=present")
@@ -22,12 +22,24 @@ notes:
       haproxy.cfg. See U(http://haproxy.1wt.eu/download/1.5/doc/configuration.txt).
     - Depends on netcat (nc) being available; you need to install the appropriate
       package for your operating system before this module can be used.
+    - All the commands of a task are sent over a single connection to the socket, in
+      HAProxy's interactive C(prompt) mode.
+    - The state of all the servers is read from one C(show stat) snapshot, and the wait
+      loops only ask for the stats of the server they wait for.
 options:
   backend:
     description:
       - Name of the HAProxy backend pool.
       - If this parameter is unset, it will be auto-detected.
+      - Mutually exclusive with I(backends).
     type: str
+  backends:
+    description:
+      - List of names of HAProxy backend pools, changed in a single task.
+      - Mutually exclusive with I(backend).
+    type: list
+    elements: str
+    version_added: 1.0.0
   drain:
     description:
       - Wait until the server has no active connections or until the timeout
@@ -38,8 +50,16 @@ options:
   host:
     description:
       - Name of the backend host to change.
+      - Exactly one of I(host) and I(hosts) is required.
     type: str
-    required: true
+  hosts:
+    description:
+      - List of names of backend hosts to change in a single task.
+      - When set, C(state_before) and C(state_after) are dictionaries of the states of every host.
+      - Exactly one of I(host) and I(hosts) is required.
+    type: list
+    elements: str
+    version_added: 1.0.0
   shutdown_sessions:
     description:
       - When disabling a server, immediately terminate all the sessions attached
@@ -183,11 +203,21 @@ EXAMPLES = r'''
     host: '{{ inventory_hostname }}'
     socket: /var/run/haproxy.sock
     backend: www
+
+- name: Disable many servers in the 'www' and 'api' backend pools at once
+  haproxy:
+    state: disabled
+    hosts: "{{ groups['web'] }}"
+    backends:
+      - www
+      - api
+    wait: yes
 '''
 
 import csv
 import socket
 import time
+from collections import OrderedDict
 from string import Template
 
 from ansible.module_utils.basic import AnsibleModule
@@ -199,6 +229,10 @@ RECV_SIZE = 1024
 ACTION_CHOICES = ['enabled', 'disabled', 'drain']
 WAIT_RETRIES = 25
 WAIT_INTERVAL = 5
+# In prompt mode, HAProxy ends every response with an empty line and this prompt
+PROMPT = b'> '
+# Value of the type argument of 'show stat' that selects servers only
+STAT_TYPE_SERVER = 4
 
 
 ######################################################################
@@ -223,7 +257,8 @@ class HAProxy(object):
 
         self.state = self.module.params['state']
         self.host = self.module.params['host']
-        self.backend = self.module.params['backend']
+        self.hosts = self.module.params['hosts']
+        self.backend = self.module.params['backends'] or self.module.params['backend']
         self.weight = self.module.params['weight']
         self.socket = self.module.params['socket']
         self.shutdown_sessions = self.module.params['shutdown_sessions']
@@ -233,27 +268,67 @@ class HAProxy(object):
         self.wait_interval = self.module.params['wait_interval']
         self._drain = self.module.params['drain']
         self.command_results = {}
+        self.client = None
+        self.stats = None
 
-    def execute(self, cmd, timeout=200, capture_output=True):
+    def connect(self):
         """
-        Executes a HAProxy command by sending a message to a HAProxy's local
-        UNIX socket and waiting up to 'timeout' milliseconds for the response.
+        Connects to the HAProxy socket and switches to the interactive prompt mode,
+        so that the connection stays open for the next commands.
         """
         self.client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         self.client.connect(self.socket)
-        self.client.sendall(to_bytes('%s\n' % cmd))
-
+        self.client.sendall(b'prompt\n')
+        self.read_response()
+
+    def close(self):
+        if self.client is not None:
+            try:
+                self.client.sendall(b'quit\n')
+            except socket.error:
+                pass
+            self.client.close()
+            self.client = None
+
+    def read_response(self):
+        """
+        Reads the response to a command, up to the next prompt.
+        Returns None if HAProxy closed the connection before answering.
+        """
         result = b''
-        buf = b''
-        buf = self.client.recv(RECV_SIZE)
-        while buf:
-            result += buf
+        while not (result == PROMPT or result.endswith(b'\n' + PROMPT)):
             buf = self.client.recv(RECV_SIZE)
+            if not buf:
+                return None if not result else result
+            result += buf
+        return result[:-len(PROMPT)]
+
+    def execute(self, cmd, timeout=200, capture_output=True):
+        """
+        Executes a HAProxy command by sending a message to a HAProxy's local
+        UNIX socket and waiting for the response. The connection is kept open
+        for the next commands, and opened again if HAProxy closed it in between,
+        for example after its 'stats timeout'.
+        """
+        for attempt in (1, 2):
+            reused = self.client is not None
+            if self.client is None:
+                self.connect()
+            try:
+                self.client.sendall(to_bytes('%s\n' % cmd))
+                result = self.read_response()
+            except socket.error:
+                result = None
+            if result is not None:
+                break
+            self.client.close()
+            self.client = None
+            if not reused or attempt == 2:
+                self.module.fail_json(msg="HAProxy closed the connection to '%s' while running '%s'" % (self.socket, cmd))
         result = to_text(result, errors='surrogate_or_strict')
 
         if capture_output:
             self.capture_command_output(cmd, result.strip())
-        self.client.close()
         return result
 
     def capture_command_output(self, cmd, output):
@@ -267,14 +342,29 @@ class HAProxy(object):
             self.command_results['output'] = []
         self.command_results['output'].append(output)
 
+    def show_stat(self, args=''):
+        """
+        Runs 'show stat' with the given arguments and returns its rows indexed by (pxname, svname)
+        """
+        data = self.execute(('show stat %s' % args).strip(), 200, False).lstrip('# ')
+        r = csv.DictReader(data.splitlines())
+        return OrderedDict(((d['pxname'], d['svname']), d) for d in r)
+
+    def update_stats(self):
+        """
+        Takes a new snapshot of the stats of all the proxies and servers
+        """
+        self.stats = self.show_stat()
+        return self.stats
+
     def discover_all_backends(self):
         """
         Discover all entries with svname = 'BACKEND' and return a list of their corresponding
         pxnames
         """
-        data = self.execute('show stat', 200, False).lstrip('# ')
-        r = csv.DictReader(data.splitlines())
-        return tuple(map(lambda d: d['pxname'], filter(lambda d: d['svname'] == 'BACKEND', r)))
+        if self.stats is None:
+            self.update_stats()
+        return tuple(pxname for (pxname, svname) in self.stats if svname == 'BACKEND')
 
     def discover_version(self):
         """
@@ -300,6 +390,8 @@ class HAProxy(object):
         # Discover backends if none are given
         if pxname is None:
             backends = self.discover_all_backends()
+        elif isinstance(pxname, list):
+            backends = pxname
         else:
             backends = [pxname]
 
@@ -320,18 +412,31 @@ class HAProxy(object):
         """
         Find the state of specific services. When pxname is not set, get all backends for a specific host.
         Returns a list of dictionaries containing the status and weight for those services.
+        The states are read from the last stats snapshot.
         """
-        data = self.execute('show stat', 200, False).lstrip('# ')
-        r = csv.DictReader(data.splitlines())
-        state = tuple(
-            map(
-                lambda d: {'status': d['status'], 'weight': d['weight'], 'scur': d['scur']},
-                filter(lambda d: (pxname is None or d['pxname']
-                                  == pxname) and d['svname'] == svname, r)
-            )
-        )
+        if self.stats is None:
+            self.update_stats()
+        if pxname is None:
+            rows = [d for (px, sv), d in self.stats.items() if sv == svname]
+        elif isinstance(pxname, list):
+            rows = [self.stats[(px, svname)] for px in pxname if (px, svname) in self.stats]
+        else:
+            rows = [self.stats[(pxname, svname)]] if (pxname, svname) in self.stats else []
+        state = tuple({'status': d['status'], 'weight': d['weight'], 'scur': d['scur']} for d in rows)
         return state or None
 
+    def get_server_stat(self, pxname, svname):
+        """
+        Get the current stats of a single server, only asking HAProxy for that server
+        when its proxy and server IDs are known from the stats snapshot.
+        """
+        row = self.stats.get((pxname, svname)) if self.stats is not None else None
+        if row is not None and row.get('iid') and row.get('sid'):
+            stats = self.show_stat('%s %d %s' % (row['iid'], STAT_TYPE_SERVER, row['sid']))
+        else:
+            stats = self.update_stats()
+        return stats.get((pxname, svname))
+
     def wait_until_status(self, pxname, svname, status):
         """
         Wait for a service to reach the specified status. Try RETRIES times
@@ -340,15 +445,13 @@ class HAProxy(object):
         not found, the module will fail.
         """
         for i in range(1, self.wait_retries):
-            state = self.get_state_for(pxname, svname)
+            state = self.get_server_stat(pxname, svname)
 
-            # We can assume there will only be 1 element in state because both svname and pxname are always set when we get here
             # When using track we get a status like this: MAINT (via pxname/svname) so we need to do substring matching
-            if status in state[0]['status']:
-                if not self._drain or (state[0]['scur'] == '0' and 'MAINT' in state):
+            if state is not None and status in state['status']:
+                if not self._drain or (state['scur'] == '0' and 'MAINT' in state['status']):
                     return True
-            else:
-                time.sleep(self.wait_interval)
+            time.sleep(self.wait_interval)
 
         self.module.fail_json(msg="server %s/%s not status '%s' after %d retries. Aborting." %
                               (pxname, svname, status, self.wait_retries))
@@ -375,40 +478,56 @@ class HAProxy(object):
             cmd += "; shutdown sessions server $pxname/$svname"
         self.execute_for_backends(cmd, backend, host, 'MAINT')
 
-    def drain(self, host, backend, status='DRAIN'):
+    def drain(self, host, backend, status='DRAIN', haproxy_version=None):
         """
         Drain action, sets the server to DRAIN mode.
         In this mode mode, the server will not accept any new connections
         other than those that are accepted via persistence.
         """
-        haproxy_version = self.discover_version()
+        if haproxy_version is None:
+            haproxy_version = self.discover_version()
 
         # check if haproxy version suppots DRAIN state (starting with 1.5)
         if haproxy_version and (1, 5) <= haproxy_version:
             cmd = "set server $pxname/$svname state drain"
             self.execute_for_backends(cmd, backend, host, status)
 
+    def get_states(self, hosts):
+        if self.hosts is None:
+            return self.get_state_for(self.backend, self.host)
+        return dict((host, self.get_state_for(self.backend, host)) for host in hosts)
+
     def act(self):
         """
         Figure out what you want to do from ansible, and then do it.
         """
+        hosts = self.hosts if self.hosts is not None else [self.host]
+
         # Get the state before the run
-        self.command_results['state_before'] = self.get_state_for(self.backend, self.host)
-
-        # toggle enable/disbale server
-        if self.state == 'enabled':
-            self.enabled(self.host, self.backend, self.weight)
-        elif self.state == 'disabled' and self._drain:
-            self.drain(self.host, self.backend, status='MAINT')
-        elif self.state == 'disabled':
-            self.disabled(self.host, self.backend, self.shutdown_sessions)
-        elif self.state == 'drain':
-            self.drain(self.host, self.backend)
-        else:
-            self.module.fail_json(msg="unknown state specified: '%s'" % self.state)
+        self.update_stats()
+        self.command_results['state_before'] = self.get_states(hosts)
+
+        haproxy_version = None
+        if self._drain or self.state == 'drain':
+            haproxy_version = self.discover_version()
+
+        for host in hosts:
+            # toggle enable/disbale server
+            if self.state == 'enabled':
+                self.enabled(host, self.backend, self.weight)
+            elif self.state == 'disabled' and self._drain:
+                self.drain(host, self.backend, status='MAINT', haproxy_version=haproxy_version)
+            elif self.state == 'disabled':
+                self.disabled(host, self.backend, self.shutdown_sessions)
+            elif self.state == 'drain':
+                self.drain(host, self.backend, haproxy_version=haproxy_version)
+            else:
+                self.module.fail_json(msg="unknown state specified: '%s'" % self.state)
 
         # Get the state after the run
-        self.command_results['state_after'] = self.get_state_for(self.backend, self.host)
+        self.update_stats()
+        self.command_results['state_after'] = self.get_states(hosts)
+        self.close()
 
         # Report change status
         self.command_results['changed'] = (self.command_results['state_before'] != self.command_results['state_after'])
@@ -422,8 +541,10 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             state=dict(type='str', required=True, choices=ACTION_CHOICES),
-            host=dict(type='str', required=True),
+            host=dict(type='str'),
+            hosts=dict(type='list', elements='str'),
             backend=dict(type='str'),
+            backends=dict(type='list', elements='str'),
             weight=dict(type='str'),
             socket=dict(type='path', default=DEFAULT_SOCKET_LOCATION),
             shutdown_sessions=dict(type='bool', default=False),
@@ -433,6 +554,8 @@ def main():
             wait_interval=dict(type='int', default=WAIT_INTERVAL),
             drain=dict(type='bool', default=False),
         ),
+        required_one_of=[('host', 'hosts')],
+        mutually_exclusive=[('host', 'hosts'), ('backend', 'backends')],
     )
 
     if not socket:
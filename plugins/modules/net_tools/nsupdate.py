@@ -56,7 +56,7 @@ options:
     record:
         description:
             - Sets the DNS record to modify. When zone is omitted this has to be absolute (ending with a dot).
-        required: true
+            - One of I(record) or I(records) is required.
     type:
         description:
             - Sets the record type.
@@ -73,6 +73,54 @@ options:
             - Sets the transport protocol (TCP or UDP). TCP is the recommended and a more robust option.
         default: 'tcp'
         choices: ['tcp', 'udp']
+    records:
+        description:
+            - List of DNS records to manage in C(zone), which is then required.
+            - The current records are fetched once, the changes are computed locally and sent
+              in as few UPDATE messages as possible, see I(zone_transfer) and I(batch_size).
+            - I(type), I(ttl) and I(state) default to the values of the options of the same name.
+        type: list
+        elements: dict
+        suboptions:
+            record:
+                description:
+                    - The DNS record to manage, relative to C(zone) or absolute (ending with a dot).
+                type: str
+                required: true
+            type:
+                description:
+                    - The record type.
+                type: str
+            ttl:
+                description:
+                    - The record TTL.
+                type: int
+            value:
+                description:
+                    - The record value(s). Required when the record is present.
+                type: list
+                elements: str
+            state:
+                description:
+                    - Whether the record is present or absent.
+                type: str
+                choices: ['present', 'absent']
+        version_added: 1.0.0
+    zone_transfer:
+        description:
+            - With I(records), fetch the current records with a zone transfer (AXFR) of C(zone).
+            - When the transfer is refused, or with C(no), the records are queried one after the other
+              over a single TCP connection.
+        type: bool
+        default: yes
+        version_added: 1.0.0
+    batch_size:
+        description:
+            - With I(records), the maximum number of changed records sent in one UPDATE message.
+            - Messages too big for the transport are split further.
+        type: int
+        default: 500
+        version_added: 1.0.0
 '''
 
 EXAMPLES = '''
@@ -122,6 +170,23 @@ EXAMPLES = '''
     record: "1.1.168.192.in-addr.arpa."
     type: "PTR"
     state: absent
+
+- name: Synchronize many records of example.org
+  nsupdate:
+    key_name: "nsupdate"
+    key_secret: "+bFQtBCta7j2vWkjPkAFtgA=="
+    server: "10.1.1.1"
+    zone: "example.org"
+    records:
+      - record: "ansible"
+        value: ["192.168.1.1"]
+      - record: "www"
+        type: "CNAME"
+        value: ["ansible.example.org."]
+        ttl: 600
+      - record: "puppet"
+        type: "CNAME"
+        state: absent
 '''
 
 RETURN = '''
@@ -164,8 +229,18 @@ dns_rc_str:
     returned: always
     type: str
     sample: 'REFUSED'
+records:
+    description:
+        - The records of the I(records) option, with their defaults applied
+          and whether they have been changed.
+    returned: success, when I(records) is used
+    type: list
+    elements: dict
+    sample: [{"record": "ansible", "type": "A", "ttl": 3600, "value": ["192.168.1.1"], "state": "present", "changed": true}]
 '''
 
+import socket
+import time
 import traceback
 
 from binascii import Error as binascii_error
@@ -178,6 +253,8 @@ try:
     import dns.tsigkeyring
     import dns.message
     import dns.resolver
+    import dns.rdata
+    import dns.zone
 
     HAVE_DNSPYTHON = True
 except ImportError:
@@ -219,6 +296,12 @@ class RecordManager(object):
             if self.zone[-1] != '.':
                 self.zone += '.'
 
+        self.dns_rc = 0
+
+        if module.params['record'] is None:
+            # Managing the records option
+            return
+
         if module.params['record'][-1] != '.':
             self.fqdn = module.params['record'] + '.' + self.zone
         else:
@@ -229,8 +312,6 @@ class RecordManager(object):
         else:
             self.value = self.module.params['value']
 
-        self.dns_rc = 0
-
     def txt_helper(self, entry):
         if entry[0] == '"' and entry[-1] == '"':
             return entry
@@ -278,6 +359,148 @@ class RecordManager(object):
             self.module.fail_json(msg='DNS server error: (%s): %s' % (e.__class__.__name__, to_native(e)))
         return response
 
+    def __transfer_zone(self, keys):
+        """Fetch the rdatasets of keys with a zone transfer, or return None if the transfer failed"""
+        try:
+            xfr = dns.query.xfr(self.module.params['server'], self.zone, port=self.module.params['port'], timeout=10,
+                                keyring=self.keyring, keyalgorithm=self.algorithm, relativize=False)
+            zone = dns.zone.from_xfr(xfr, relativize=False)
+        except (dns.exception.DNSException, socket_error, EOFError):
+            return None
+
+        current = {}
+        for name, rdataset in zone.iterate_rdatasets():
+            if (name, rdataset.rdtype) in keys:
+                current[(name, rdataset.rdtype)] = (rdataset.ttl, set(rdataset))
+        return current
+
+    def __query_records(self, keys):
+        """Fetch the rdatasets of keys with one query each, over a single TCP connection"""
+        current = {}
+        sock = None
+        try:
+            if self.module.params['protocol'] == 'tcp':
+                sock = socket.create_connection((self.module.params['server'], self.module.params['port']), timeout=10)
+            for name, rdtype in keys:
+                query = dns.message.make_query(name, rdtype)
+                if self.keyring:
+                    query.use_tsig(keyring=self.keyring, algorithm=self.algorithm)
+                if sock is None:
+                    lookup = dns.query.udp(query, self.module.params['server'], timeout=10, port=self.module.params['port'])
+                else:
+                    expiration = time.time() + 10
+                    dns.query.send_tcp(sock, query, expiration)
+                    lookup = dns.query.receive_tcp(sock, expiration, keyring=query.keyring, request_mac=query.mac)[0]
+
+                if lookup.rcode() == dns.rcode.NXDOMAIN:
+                    continue
+                if lookup.rcode() != dns.rcode.NOERROR:
+                    self.module.fail_json(msg='Failed to lookup %s %s (rc: %d)' % (
+                        name.to_text(), dns.rdatatype.to_text(rdtype), lookup.rcode()))
+                try:
+                    rrset = lookup.find_rrset(lookup.answer, name, dns.rdataclass.IN, rdtype)
+                except KeyError:
+                    continue
+                current[(name, rdtype)] = (rrset.ttl, set(rrset))
+        except (dns.tsig.PeerBadKey, dns.tsig.PeerBadSignature) as e:
+            self.module.fail_json(msg='TSIG update error (%s): %s' % (e.__class__.__name__, to_native(e)))
+        except (socket_error, EOFError, dns.exception.Timeout) as e:
+            self.module.fail_json(msg='DNS server error: (%s): %s' % (e.__class__.__name__, to_native(e)))
+        finally:
+            if sock is not None:
+                sock.close()
+        return current
+
+    def __send_changes(self, changes):
+        """Send changes in one UPDATE message, split it when it is too big, and return the list of (changes, rcode)"""
+        update = dns.update.Update(self.zone, keyring=self.keyring, keyalgorithm=self.algorithm)
+        for name, rdtype, ttl, rdatas in changes:
+            if rdatas is None:
+                update.delete(name, rdtype)
+            else:
+                update.replace(name, ttl, *rdatas)
+
+        try:
+            response = self.__do_update(update)
+        except dns.exception.TooBig:
+            if len(changes) == 1:
+                self.module.fail_json(msg='The update of %s is too big' % changes[0][0].to_text())
+            half = len(changes) // 2
+            return self.__send_changes(changes[:half]) + self.__send_changes(changes[half:])
+
+        return [(changes, dns.message.Message.rcode(response))]
+
+    def sync_records(self, entries):
+        """Fetch the current records once, and apply the changes of entries in batched UPDATE messages"""
+        result = {'changed': False, 'failed': False, 'records': entries}
+        origin = dns.name.from_text(self.zone)
+
+        wanted = []
+        for entry in entries:
+            name = dns.name.from_text(entry['record'], origin)
+            try:
+                rdtype = dns.rdatatype.from_text(entry['type'])
+            except dns.rdatatype.UnknownRdatatype as e:
+                self.module.fail_json(msg='Record error: {0}'.format(to_native(e)))
+
+            rdatas = None
+            if entry['state'] == 'present':
+                if entry['value'] is None:
+                    self.module.fail_json(msg='value needed when state=present for record %s' % entry['record'])
+                values = entry['value']
+                if rdtype == dns.rdatatype.TXT:
+                    values = list(map(self.txt_helper, values))
+                try:
+                    rdatas = set(dns.rdata.from_text(dns.rdataclass.IN, rdtype, value, origin, False) for value in values)
+                except dns.exception.SyntaxError:
+                    self.module.fail_json(msg='Invalid/malformed value for record %s' % entry['record'])
+            wanted.append((entry, name, rdtype, rdatas))
+
+        keys = set((name, rdtype) for entry, name, rdtype, rdatas in wanted)
+        current = None
+        if self.module.params['zone_transfer']:
+            current = self.__transfer_zone(keys)
+        if current is None:
+            current = self.__query_records(keys)
+
+        changes = []
+        for entry, name, rdtype, rdatas in wanted:
+            existing = current.get((name, rdtype))
+            if rdatas is None:
+                entry['changed'] = existing is not None
+            else:
+                entry['changed'] = existing is None or existing != (entry['ttl'], rdatas)
+            if entry['changed']:
+                changes.append((name, rdtype, entry['ttl'], rdatas))
+                # Later entries for the same record are compared with this one
+                if rdatas is None:
+                    del current[(name, rdtype)]
+                else:
+                    current[(name, rdtype)] = (entry['ttl'], rdatas)
+
+        if not changes or self.module.check_mode:
+            result['changed'] = bool(changes)
+            return result
+
+        failed = set()
+        batch_size = self.module.params['batch_size']
+        for i in range(0, len(changes), batch_size):
+            for sent, rcode in self.__send_changes(changes[i:i + batch_size]):
+                if rcode != 0:
+                    self.dns_rc = rcode
+                    failed.update((name, rdtype) for name, rdtype, ttl, rdatas in sent)
+                else:
+                    result['changed'] = True
+
+        if failed:
+            for entry, name, rdtype, rdatas in wanted:
+                if (name, rdtype) in failed:
+                    entry['changed'] = False
+            result['failed'] = True
+            result['msg'] = "Failed to update %d DNS records (rc: %d)" % (len(failed), self.dns_rc)
+
+        return result
+
     def create_or_update_record(self):
         result = {'changed': False, 'failed': False}
 
@@ -429,24 +652,48 @@ def main():
             key_secret=dict(required=False, type='str', no_log=True),
             key_algorithm=dict(required=False, default='hmac-md5', choices=tsig_algs, type='str'),
             zone=dict(required=False, default=None, type='str'),
-            record=dict(required=True, type='str'),
+            record=dict(required=False, type='str'),
             type=dict(required=False, default='A', type='str'),
             ttl=dict(required=False, default=3600, type='int'),
             value=dict(required=False, default=None, type='list'),
-            protocol=dict(required=False, default='tcp', choices=['tcp', 'udp'], type='str')
+            protocol=dict(required=False, default='tcp', choices=['tcp', 'udp'], type='str'),
+            records=dict(required=False, type='list', elements='dict', options=dict(
+                record=dict(required=True, type='str'),
+                type=dict(required=False, type='str'),
+                ttl=dict(required=False, type='int'),
+                value=dict(required=False, type='list', elements='str'),
+                state=dict(required=False, choices=['present', 'absent'], type='str'),
+            )),
+            zone_transfer=dict(required=False, default=True, type='bool'),
+            batch_size=dict(required=False, default=500, type='int'),
         ),
+        required_one_of=[('record', 'records')],
+        mutually_exclusive=[('record', 'records')],
+        required_by=dict(records='zone'),
         supports_check_mode=True
     )
 
     if not HAVE_DNSPYTHON:
         module.fail_json(msg=missing_required_lib('dnspython'), exception=DNSPYTHON_IMP_ERR)
 
-    if len(module.params["record"]) == 0:
+    if module.params["record"] is not None and len(module.params["record"]) == 0:
         module.fail_json(msg='record cannot be empty.')
 
+    if module.params['batch_size'] < 1:
+        module.fail_json(msg='batch_size must be a positive number.')
+
     record = RecordManager(module)
     result = {}
-    if module.params["state"] == 'absent':
+    if module.params["records"] is not None:
+        entries = []
+        for entry in module.params["records"]:
+            entry = dict(entry)
+            for option in ('type', 'ttl', 'state'):
+                if entry[option] is None:
+                    entry[option] = module.params[option]
+            entries.append(entry)
+        result = record.sync_records(entries)
+    elif module.params["state"] == 'absent':
         result = record.remove_record()
     elif module.params["state"] == 'present':
         result = record.create_or_update_record()
@@ -455,6 +702,9 @@ def main():
     result['dns_rc_str'] = dns.rcode.to_text(record.dns_rc)
     if result['failed']:
         module.fail_json(**result)
+    elif module.params["records"] is not None:
+        result['zone'] = record.zone
+        module.exit_json(**result)
     else:
         result['record'] = dict(zone=record.zone,
                                 record=module.params['record'],
@@ -59,7 +59,9 @@ options:
     default: system
   name:
     description:
-    - The name of the flatpak to manage.
+    - The name of the flatpak to manage, or a list of names.
+    - The installed flatpaks are queried once and all names that need a change are installed
+      or removed together, with a single C(flatpak) command where possible.
     - When used with I(state=present), I(name) can be specified as an C(http(s)) URL to a
       C(flatpakref) file or the unique reverse DNS name that identifies a flatpak.
     - When supplying a reverse DNS name, you can use the I(remote) option to specify on what remote
@@ -70,7 +72,8 @@ options:
       installed flatpak based on the name of the flatpakref to remove it. However, there is no
       guarantee that the names of the flatpakref file and the reverse DNS name of the installed
       flatpak do match.
-    type: str
+    type: list
+    elements: str
     required: true
   remote:
     description:
@@ -111,6 +114,13 @@ EXAMPLES = r'''
     state: present
     remote: gnome
 
+- name: Install multiple packages from flathub with a single command
+  flatpak:
+    name:
+    - org.gnome.Calculator
+    - org.gnome.Calendar
+    state: present
+
 - name: Remove the gedit flatpak
   flatpak:
     name: org.gnome.gedit
@@ -151,79 +161,46 @@ from ansible.module_utils.basic import AnsibleModule
 OUTDATED_FLATPAK_VERSION_ERROR_MESSAGE = "Unknown option --columns=application"
 
 
-def install_flat(module, binary, remote, name, method):
-    """Add a new flatpak."""
+def install_flat(module, binary, remote, names, method):
+    """Add new flatpaks."""
     global result
-    if name.startswith('http://') or name.startswith('https://'):
+    flatpakrefs = [name for name in names if name.startswith('http://') or name.startswith('https://')]
+    refs = [name for name in names if name not in flatpakrefs]
+    # A flatpakref URL has to be installed on its own, all other names go in a single command
+    for name in flatpakrefs:
         command = [binary, "install", "--{0}".format(method), "-y", name]
-    else:
-        command = [binary, "install", "--{0}".format(method), "-y", remote, name]
-    _flatpak_command(module, module.check_mode, command)
+        _flatpak_command(module, module.check_mode, command)
+    if refs:
+        command = [binary, "install", "--{0}".format(method), "-y", remote] + refs
+        _flatpak_command(module, module.check_mode, command)
     result['changed'] = True
 
 
-def uninstall_flat(module, binary, name, method):
-    """Remove an existing flatpak."""
+def uninstall_flat(module, binary, names, method):
+    """Remove existing flatpaks."""
     global result
-    installed_flat_name = _match_installed_flat_name(module, binary, name, method)
-    command = [binary, "uninstall", "--{0}".format(method), "-y", name]
+    command = [binary, "uninstall", "--{0}".format(method), "-y"] + names
     _flatpak_command(module, module.check_mode, command)
     result['changed'] = True
 
 
-def flatpak_exists(module, binary, name, method):
-    """Check if the flatpak is installed."""
-    command = [binary, "list", "--{0}".format(method), "--app"]
-    output = _flatpak_command(module, False, command)
-    name = _parse_flatpak_name(name).lower()
-    if name in output.lower():
-        return True
-    return False
-
-
-def _match_installed_flat_name(module, binary, name, method):
-    # This is a difficult function, since if the user supplies a flatpakref url,
-    # we have to rely on a naming convention:
-    # The flatpakref file name needs to match the flatpak name
+def get_installed_flats(module, binary, method):
+    """Return the application IDs of all installed flatpaks, keyed by their lowercase form."""
     global result
-    parsed_name = _parse_flatpak_name(name)
-    # Try running flatpak list with columns feature
     command = [binary, "list", "--{0}".format(method), "--app", "--columns=application"]
-    _flatpak_command(module, False, command, ignore_failure=True)
+    output = _flatpak_command(module, False, command, ignore_failure=True)
     if result['rc'] != 0 and OUTDATED_FLATPAK_VERSION_ERROR_MESSAGE in result['stderr']:
-        # Probably flatpak before 1.2
-        matched_flatpak_name = \
-            _match_flat_using_flatpak_column_feature(module, binary, parsed_name, method)
+        # Probably flatpak before 1.2, the first column holds the whole ref
+        command = [binary, "list", "--{0}".format(method), "--app"]
+        output = _flatpak_command(module, False, command)
+        flats = [row.split()[0].split('/')[0] for row in output.split('\n') if row.strip()]
+    elif result['rc'] != 0:
+        result['msg'] = "Failed to list the installed flatpaks"
+        module.fail_json(**result)
     else:
         # Probably flatpak >= 1.2
-        matched_flatpak_name = \
-            _match_flat_using_outdated_flatpak_format(module, binary, parsed_name, method)
-
-    if matched_flatpak_name:
-        return matched_flatpak_name
-    else:
-        result['msg'] = "Flatpak removal failed: Could not match any installed flatpaks to " +\
-            "the name `{0}`. ".format(_parse_flatpak_name(name)) +\
-            "If you used a URL, try using the reverse DNS name of the flatpak"
-        module.fail_json(**result)
-
-
-def _match_flat_using_outdated_flatpak_format(module, binary, parsed_name, method):
-    global result
-    command = [binary, "list", "--{0}".format(method), "--app", "--columns=application"]
-    output = _flatpak_command(module, False, command)
-    for row in output.split('\n'):
-        if parsed_name.lower() == row.lower():
-            return row
-
-
-def _match_flat_using_flatpak_column_feature(module, binary, parsed_name, method):
-    global result
-    command = [binary, "list", "--{0}".format(method), "--app"]
-    output = _flatpak_command(module, False, command)
-    for row in output.split('\n'):
-        if parsed_name.lower() in row.lower():
-            return row.split()[0]
+        flats = [row.strip() for row in output.split('\n') if row.strip()]
+    return dict((flat.lower(), flat) for flat in flats)
 
 
 def _parse_flatpak_name(name):
@@ -253,7 +230,7 @@ def main():
     # This module supports check mode
     module = AnsibleModule(
         argument_spec=dict(
-            name=dict(type='str', required=True),
+            name=dict(type='list', elements='str', required=True),
             remote=dict(type='str', default='flathub'),
             method=dict(type='str', default='system',
                         choices=['user', 'system']),
@@ -264,7 +241,7 @@ def main():
         supports_check_mode=True,
     )
 
-    name = module.params['name']
+    names = module.params['name']
     state = module.params['state']
     remote = module.params['remote']
     method = module.params['method']
@@ -280,10 +257,16 @@ def main():
     if not binary:
         module.fail_json(msg="Executable '%s' was not found on the system." % executable, **result)
 
-    if state == 'present' and not flatpak_exists(module, binary, name, method):
-        install_flat(module, binary, remote, name, method)
-    elif state == 'absent' and flatpak_exists(module, binary, name, method):
-        uninstall_flat(module, binary, name, method)
+    installed_flats = get_installed_flats(module, binary, method)
+    if state == 'present':
+        names_to_install = [name for name in names if _parse_flatpak_name(name).lower() not in installed_flats]
+        if names_to_install:
+            install_flat(module, binary, remote, names_to_install, method)
+    else:
+        names_to_remove = [installed_flats[_parse_flatpak_name(name).lower()] for name in names
+                           if _parse_flatpak_name(name).lower() in installed_flats]
+        if names_to_remove:
+            uninstall_flat(module, binary, names_to_remove, method)
 
     module.exit_json(**result)
 
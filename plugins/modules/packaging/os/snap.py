@@ -23,6 +23,8 @@ options:
     name:
         description:
             - Name of the snap to install or remove. Can be a list of snaps.
+            - The installed snaps are queried once for all names, and all snaps that need
+              a change are installed or removed with a single C(snap) command where possible.
         required: true
     state:
         description:
@@ -108,32 +110,45 @@ import re
 from ansible.module_utils.basic import AnsibleModule
 
 
-def validate_input_snaps(module):
+def validate_input_snaps(module, installed_snaps):
     """Ensure that all exist."""
-    for snap_name in module.params['name']:
-        if not snap_exists(module, snap_name):
+    # Installed snaps exist, the others are looked up with a single 'snap info' call
+    snap_names = [s for s in module.params['name'] if s not in installed_snaps]
+    if not snap_names:
+        return
+
+    available_snaps = get_available_snaps(module, snap_names)
+    for snap_name in snap_names:
+        if snap_name not in available_snaps:
             module.fail_json(msg="No snap matching '%s' available." % snap_name)
 
 
-def snap_exists(module, snap_name):
+def get_available_snaps(module, snap_names):
+    """Return the set of the given snaps that are available from the store."""
     snap_path = module.get_bin_path("snap", True)
-    cmd_parts = [snap_path, 'info', snap_name]
+    cmd_parts = [snap_path, 'info'] + snap_names
     cmd = ' '.join(cmd_parts)
     rc, out, err = module.run_command(cmd, check_rc=False)
 
-    return rc == 0
+    # 'snap info' prints one document per snap found and a warning for every other one
+    return set(m.group(1) for m in re.finditer(r'^name:\s+(\S+)', out, re.MULTILINE))
 
 
-def is_snap_installed(module, snap_name):
+def get_installed_snaps(module):
+    """Return the set of installed snaps, with a single 'snap list' call."""
     snap_path = module.get_bin_path("snap", True)
-    cmd_parts = [snap_path, 'list', snap_name]
+    cmd_parts = [snap_path, 'list']
     cmd = ' '.join(cmd_parts)
     rc, out, err = module.run_command(cmd, check_rc=False)
 
-    return rc == 0
+    if rc != 0:
+        return set()
 
+    # Skip the header line, the name is the first column
+    return set(line.split()[0] for line in out.splitlines()[1:] if line.strip())
 
-def get_snap_for_action(module):
+
+def get_snap_for_action(module, installed_snaps):
     """Construct a list of snaps to use for current action."""
     snaps = module.params['name']
 
@@ -141,7 +156,7 @@ def get_snap_for_action(module):
     negation_predicate = operator.not_ if is_present_state else bool
 
     def predicate(s):
-        return negation_predicate(is_snap_installed(module, s))
+        return negation_predicate(s in installed_snaps)
 
     return [s for s in snaps if predicate(s)]
 
@@ -190,14 +205,14 @@ def run_cmd_for(module, snap_names):
     return (cmd, ) + module.run_command(cmd, check_rc=False)
 
 
-def execute_action(module):
+def execute_action(module, installed_snaps):
     is_install_mode = module.params['state'] == 'present'
     exit_kwargs = {
         'classic': module.params['classic'],
         'channel': module.params['channel'],
     } if is_install_mode else {}
 
-    actionable_snaps = get_snap_for_action(module)
+    actionable_snaps = get_snap_for_action(module, installed_snaps)
     if not actionable_snaps:
         module.exit_json(changed=False, **exit_kwargs)
 
@@ -243,10 +258,12 @@ def main():
         supports_check_mode=True,
     )
 
-    validate_input_snaps(module)
+    installed_snaps = get_installed_snaps(module)
+
+    validate_input_snaps(module, installed_snaps)
 
     # Apply changes to the snaps
-    execute_action(module)
+    execute_action(module, installed_snaps)
 
 
 if __name__ == '__main__':
@@ -29,10 +29,24 @@ options:
       - List of commands to execute on OOB controller
     type: list
   baseuri:
-    required: true
     description:
       - Base URI of OOB controller
+      - Exactly one of I(baseuri) and I(baseuris) is required.
     type: str
+  baseuris:
+    description:
+      - List of base URIs of OOB controllers.
+      - The same category and commands are run on all the controllers concurrently.
+      - The module fails if any controller fails, after all the controllers have been handled.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  concurrency:
+    description:
+      - Maximum number of OOB controllers of I(baseuris) handled at the same time.
+    default: 10
+    type: int
+    version_added: 1.0.0
   username:
     required: true
     description:
@@ -424,6 +438,17 @@ EXAMPLES = '''
       virtual_media:
         image_url: 'http://example.com/images/SomeLinux-current.iso'
       resource_id: BMC
+
+  - name: Restart system power gracefully on many OOB controllers at once
+    redfish_command:
+      category: Systems
+      command: PowerGracefulRestart
+      baseuris:
+        - 10.0.0.1
+        - 10.0.0.2
+      username: "{{ username }}"
+      password: "{{ password }}"
+      concurrency: 20
 '''
 
 RETURN = '''
@@ -432,10 +457,20 @@ msg:
     returned: always
     type: str
     sample: "Action was successful"
+results_by_baseuri:
+    description: The result of every OOB controller of I(baseuris) that succeeded, by base URI
+    returned: when I(baseuris) is used
+    type: dict
+    sample: {"10.0.0.1": {"changed": true, "msg": "Action was successful"}}
+failed_baseuris:
+    description: The error message of every OOB controller of I(baseuris) that failed, by base URI
+    returned: when I(baseuris) is used
+    type: dict
+    sample: {"10.0.0.2": "URL Error on GET request to 'https://10.0.0.2/redfish/v1/': 'timed out'"}
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.general.plugins.module_utils.redfish_utils import RedfishUtils
+from ansible_collections.community.general.plugins.module_utils.redfish_utils import RedfishUtils, run_on_baseuris
 from ansible.module_utils._text import to_native
 
 
@@ -454,13 +489,107 @@ CATEGORY_COMMANDS_ALL = {
 }
 
 
-def main():
+def run_commands(module, rf_utils, category, command_list, user, update_opts, virtual_media):
     result = {}
+    # Organize by Categories / Commands
+    if category == "Accounts":
+        ACCOUNTS_COMMANDS = {
+            "AddUser": rf_utils.add_user,
+            "EnableUser": rf_utils.enable_user,
+            "DeleteUser": rf_utils.delete_user,
+            "DisableUser": rf_utils.disable_user,
+            "UpdateUserRole": rf_utils.update_user_role,
+            "UpdateUserPassword": rf_utils.update_user_password,
+            "UpdateUserName": rf_utils.update_user_name,
+            "UpdateAccountServiceProperties": rf_utils.update_accountservice_properties
+        }
+
+        # execute only if we find an Account service resource
+        result = rf_utils._find_accountservice_resource()
+        if result['ret'] is False:
+            return result
+
+        for command in command_list:
+            result = ACCOUNTS_COMMANDS[command](user)
+
+    elif category == "Systems":
+        # execute only if we find a System resource
+        result = rf_utils._find_systems_resource()
+        if result['ret'] is False:
+            return result
+
+        for command in command_list:
+            if "Power" in command:
+                result = rf_utils.manage_system_power(command)
+            elif command == "SetOneTimeBoot":
+                result = rf_utils.set_one_time_boot_device(
+                    module.params['bootdevice'],
+                    module.params['uefi_target'],
+                    module.params['boot_next'])
+
+    elif category == "Chassis":
+        result = rf_utils._find_chassis_resource()
+        if result['ret'] is False:
+            return result
+
+        led_commands = ["IndicatorLedOn", "IndicatorLedOff", "IndicatorLedBlink"]
+
+        # Check if more than one led_command is present
+        num_led_commands = sum([command in led_commands for command in command_list])
+        if num_led_commands > 1:
+            result = {'ret': False, 'msg': "Only one IndicatorLed command should be sent at a time."}
+        else:
+            for command in command_list:
+                if command in led_commands:
+                    result = rf_utils.manage_indicator_led(command)
+
+    elif category == "Sessions":
+        # execute only if we find SessionService resources
+        resource = rf_utils._find_sessionservice_resource()
+        if resource['ret'] is False:
+            return resource
+
+        for command in command_list:
+            if command == "ClearSessions":
+                result = rf_utils.clear_sessions()
+
+    elif category == "Manager":
+        # execute only if we find a Manager service resource
+        result = rf_utils._find_managers_resource()
+        if result['ret'] is False:
+            return result
+
+        for command in command_list:
+            if command == 'GracefulRestart':
+                result = rf_utils.restart_manager_gracefully()
+            elif command == 'ClearLogs':
+                result = rf_utils.clear_logs()
+            elif command == 'VirtualMediaInsert':
+                result = rf_utils.virtual_media_insert(virtual_media)
+            elif command == 'VirtualMediaEject':
+                result = rf_utils.virtual_media_eject(virtual_media)
+
+    elif category == "Update":
+        # execute only if we find UpdateService resources
+        resource = rf_utils._find_updateservice_resource()
+        if resource['ret'] is False:
+            return resource
+
+        for command in command_list:
+            if command == "SimpleUpdate":
+                result = rf_utils.simple_update(update_opts)
+
+    return result
+
+
+def main():
     module = AnsibleModule(
         argument_spec=dict(
             category=dict(required=True),
             command=dict(required=True, type='list'),
-            baseuri=dict(required=True),
+            baseuri=dict(),
+            baseuris=dict(type='list', elements='str'),
+            concurrency=dict(type='int', default=10),
             username=dict(required=True),
             password=dict(required=True, no_log=True),
             id=dict(aliases=["account_id"]),
@@ -498,6 +627,8 @@ def main():
                 )
             )
         ),
+        required_one_of=[('baseuri', 'baseuris')],
+        mutually_exclusive=[('baseuri', 'baseuris')],
         supports_check_mode=False
     )
 
@@ -533,11 +664,6 @@ def main():
     # VirtualMedia options
     virtual_media = module.params['virtual_media']
 
-    # Build root URI
-    root_uri = "https://" + module.params['baseuri']
-    rf_utils = RedfishUtils(creds, root_uri, timeout, module,
-                            resource_id=resource_id, data_modification=True)
-
     # Check that Category is valid
     if category not in CATEGORY_COMMANDS_ALL:
         module.fail_json(msg=to_native("Invalid Category '%s'. Valid Categories = %s" % (category, CATEGORY_COMMANDS_ALL.keys())))
@@ -548,93 +674,37 @@ def main():
         if cmd not in CATEGORY_COMMANDS_ALL[category]:
             module.fail_json(msg=to_native("Invalid Command '%s'. Valid Commands = %s" % (cmd, CATEGORY_COMMANDS_ALL[category])))
 
-    # Organize by Categories / Commands
-    if category == "Accounts":
-        ACCOUNTS_COMMANDS = {
-            "AddUser": rf_utils.add_user,
-            "EnableUser": rf_utils.enable_user,
-            "DeleteUser": rf_utils.delete_user,
-            "DisableUser": rf_utils.disable_user,
-            "UpdateUserRole": rf_utils.update_user_role,
-            "UpdateUserPassword": rf_utils.update_user_password,
-            "UpdateUserName": rf_utils.update_user_name,
-            "UpdateAccountServiceProperties": rf_utils.update_accountservice_properties
-        }
-
-        # execute only if we find an Account service resource
-        result = rf_utils._find_accountservice_resource()
-        if result['ret'] is False:
-            module.fail_json(msg=to_native(result['msg']))
-
-        for command in command_list:
-            result = ACCOUNTS_COMMANDS[command](user)
-
-    elif category == "Systems":
-        # execute only if we find a System resource
-        result = rf_utils._find_systems_resource()
-        if result['ret'] is False:
-            module.fail_json(msg=to_native(result['msg']))
-
-        for command in command_list:
-            if "Power" in command:
-                result = rf_utils.manage_system_power(command)
-            elif command == "SetOneTimeBoot":
-                result = rf_utils.set_one_time_boot_device(
-                    module.params['bootdevice'],
-                    module.params['uefi_target'],
-                    module.params['boot_next'])
-
-    elif category == "Chassis":
-        result = rf_utils._find_chassis_resource()
-        if result['ret'] is False:
-            module.fail_json(msg=to_native(result['msg']))
-
-        led_commands = ["IndicatorLedOn", "IndicatorLedOff", "IndicatorLedBlink"]
-
-        # Check if more than one led_command is present
-        num_led_commands = sum([command in led_commands for command in command_list])
-        if num_led_commands > 1:
-            result = {'ret': False, 'msg': "Only one IndicatorLed command should be sent at a time."}
-        else:
-            for command in command_list:
-                if command in led_commands:
-                    result = rf_utils.manage_indicator_led(command)
-
-    elif category == "Sessions":
-        # execute only if we find SessionService resources
-        resource = rf_utils._find_sessionservice_resource()
-        if resource['ret'] is False:
-            module.fail_json(msg=resource['msg'])
-
-        for command in command_list:
-            if command == "ClearSessions":
-                result = rf_utils.clear_sessions()
+    if module.params['baseuris']:
+        baseuris = module.params['baseuris']
+        if module.params['concurrency'] < 1:
+            module.fail_json(msg="concurrency must be at least 1")
+
+        def run(baseuri):
+            rf_utils = RedfishUtils(creds, "https://" + baseuri, timeout, module,
+                                    resource_id=resource_id, data_modification=True)
+            return run_commands(module, rf_utils, category, command_list, user, update_opts, virtual_media)
+
+        changed = False
+        results_by_baseuri = {}
+        failed_baseuris = {}
+        for baseuri, result in zip(baseuris, run_on_baseuris(baseuris, run, module.params['concurrency'])):
+            if result['ret'] is True:
+                results_by_baseuri[baseuri] = {'changed': result.get('changed', True), 'msg': 'Action was successful'}
+                changed = changed or results_by_baseuri[baseuri]['changed']
+            else:
+                failed_baseuris[baseuri] = to_native(result['msg'])
+        if failed_baseuris:
+            module.fail_json(msg="Action failed on %d of %d OOB controllers" % (len(failed_baseuris), len(baseuris)),
+                             changed=changed, results_by_baseuri=results_by_baseuri, failed_baseuris=failed_baseuris)
+        module.exit_json(changed=changed, msg='Action was successful',
+                         results_by_baseuri=results_by_baseuri, failed_baseuris=failed_baseuris)
 
-    elif category == "Manager":
-        # execute only if we find a Manager service resource
-        result = rf_utils._find_managers_resource()
-        if result['ret'] is False:
-            module.fail_json(msg=to_native(result['msg']))
-
-        for command in command_list:
-            if command == 'GracefulRestart':
-                result = rf_utils.restart_manager_gracefully()
-            elif command == 'ClearLogs':
-                result = rf_utils.clear_logs()
-            elif command == 'VirtualMediaInsert':
-                result = rf_utils.virtual_media_insert(virtual_media)
-            elif command == 'VirtualMediaEject':
-                result = rf_utils.virtual_media_eject(virtual_media)
-
-    elif category == "Update":
-        # execute only if we find UpdateService resources
-        resource = rf_utils._find_updateservice_resource()
-        if resource['ret'] is False:
-            module.fail_json(msg=resource['msg'])
+    # Build root URI
+    root_uri = "https://" + module.params['baseuri']
+    rf_utils = RedfishUtils(creds, root_uri, timeout, module,
+                            resource_id=resource_id, data_modification=True)
 
-        for command in command_list:
-            if command == "SimpleUpdate":
-                result = rf_utils.simple_update(update_opts)
+    result = run_commands(module, rf_utils, category, command_list, user, update_opts, virtual_media)
 
     # Return data back or fail with proper message
     if result['ret'] is True:
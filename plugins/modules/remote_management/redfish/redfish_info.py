@@ -30,10 +30,25 @@ options:
       - List of commands to execute on OOB controller
     type: list
   baseuri:
-    required: true
     description:
       - Base URI of OOB controller
+      - Exactly one of I(baseuri) and I(baseuris) is required.
     type: str
+  baseuris:
+    description:
+      - List of base URIs of OOB controllers.
+      - The same categories and commands are run on all the controllers concurrently, and the
+        information is returned in C(redfish_facts_by_baseuri) instead of C(redfish_facts).
+      - The module fails if any controller fails, and still returns the information of the others.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  concurrency:
+    description:
+      - Maximum number of OOB controllers of I(baseuris) queried at the same time.
+    default: 10
+    type: int
+    version_added: 1.0.0
   username:
     required: true
     description:
@@ -117,6 +132,20 @@ EXAMPLES = '''
   - debug:
       msg: "{{ result.redfish_facts.volume.entries | to_nice_json }}"
 
+  - name: Get CPU inventory of many OOB controllers at once
+    redfish_info:
+      category: Systems
+      command: GetCpuInventory
+      baseuris:
+        - 10.0.0.1
+        - 10.0.0.2
+      username: "{{ username }}"
+      password: "{{ password }}"
+      concurrency: 20
+    register: result
+  - debug:
+      msg: "{{ result.redfish_facts_by_baseuri['10.0.0.1'].cpu.entries | to_nice_json }}"
+
   - name: Get Session information
     redfish_info:
       category: Sessions
@@ -262,10 +291,20 @@ result:
     returned: always
     type: dict
     sample: List of CPUs on system
+redfish_facts_by_baseuri:
+    description: The information of every OOB controller of I(baseuris), by base URI
+    returned: when I(baseuris) is used
+    type: dict
+    sample: {"10.0.0.1": {"cpu": {"entries": [], "ret": true}}}
+failed_baseuris:
+    description: The error message of every OOB controller of I(baseuris) that failed, by base URI
+    returned: when I(baseuris) is used
+    type: dict
+    sample: {"10.0.0.2": "URL Error on GET request to 'https://10.0.0.2/redfish/v1/': 'timed out'"}
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.general.plugins.module_utils.redfish_utils import RedfishUtils
+from ansible_collections.community.general.plugins.module_utils.redfish_utils import RedfishUtils, run_on_baseuris
 
 CATEGORY_COMMANDS_ALL = {
     "Systems": ["GetSystemInventory", "GetPsuInventory", "GetCpuInventory",
@@ -291,73 +330,15 @@ CATEGORY_COMMANDS_DEFAULT = {
 }
 
 
-def main():
+def get_redfish_facts(rf_utils, category_commands):
     result = {}
-    category_list = []
-    module = AnsibleModule(
-        argument_spec=dict(
-            category=dict(type='list', default=['Systems']),
-            command=dict(type='list'),
-            baseuri=dict(required=True),
-            username=dict(required=True),
-            password=dict(required=True, no_log=True),
-            timeout=dict(type='int', default=10)
-        ),
-        supports_check_mode=False
-    )
-    is_old_facts = module._name in ('redfish_facts', 'community.general.redfish_facts')
-    if is_old_facts:
-        module.deprecate("The 'redfish_facts' module has been renamed to 'redfish_info', "
-                         "and the renamed one no longer returns ansible_facts",
-                         version='3.0.0', collection_name='community.general')  # was Ansible 2.13
-
-    # admin credentials used for authentication
-    creds = {'user': module.params['username'],
-             'pswd': module.params['password']}
-
-    # timeout
-    timeout = module.params['timeout']
-
-    # Build root URI
-    root_uri = "https://" + module.params['baseuri']
-    rf_utils = RedfishUtils(creds, root_uri, timeout, module)
-
-    # Build Category list
-    if "all" in module.params['category']:
-        for entry in CATEGORY_COMMANDS_ALL:
-            category_list.append(entry)
-    else:
-        # one or more categories specified
-        category_list = module.params['category']
-
-    for category in category_list:
-        command_list = []
-        # Build Command list for each Category
-        if category in CATEGORY_COMMANDS_ALL:
-            if not module.params['command']:
-                # True if we don't specify a command --> use default
-                command_list.append(CATEGORY_COMMANDS_DEFAULT[category])
-            elif "all" in module.params['command']:
-                for entry in range(len(CATEGORY_COMMANDS_ALL[category])):
-                    command_list.append(CATEGORY_COMMANDS_ALL[category][entry])
-            # one or more commands
-            else:
-                command_list = module.params['command']
-                # Verify that all commands are valid
-                for cmd in command_list:
-                    # Fail if even one command given is invalid
-                    if cmd not in CATEGORY_COMMANDS_ALL[category]:
-                        module.fail_json(msg="Invalid Command: %s" % cmd)
-        else:
-            # Fail if even one category given is invalid
-            module.fail_json(msg="Invalid Category: %s" % category)
-
+    for category, command_list in category_commands:
         # Organize by Categories / Commands
         if category == "Systems":
             # execute only if we find a Systems resource
             resource = rf_utils._find_systems_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "GetSystemInventory":
@@ -387,7 +368,7 @@ def main():
             # execute only if we find Chassis resource
             resource = rf_utils._find_chassis_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "GetFanInventory":
@@ -407,7 +388,7 @@ def main():
             # execute only if we find an Account service resource
             resource = rf_utils._find_accountservice_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "ListUsers":
@@ -417,7 +398,7 @@ def main():
             # execute only if we find UpdateService resources
             resource = rf_utils._find_updateservice_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "GetFirmwareInventory":
@@ -431,7 +412,7 @@ def main():
             # execute only if we find SessionService resources
             resource = rf_utils._find_sessionservice_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "GetSessions":
@@ -441,7 +422,7 @@ def main():
             # execute only if we find a Manager service resource
             resource = rf_utils._find_managers_resource()
             if resource['ret'] is False:
-                module.fail_json(msg=resource['msg'])
+                return resource
 
             for command in command_list:
                 if command == "GetManagerNicInventory":
@@ -455,6 +436,102 @@ def main():
                 elif command == "GetHealthReport":
                     result["health_report"] = rf_utils.get_multi_manager_health_report()
 
+    return {'ret': True, 'redfish_facts': result}
+
+
+def main():
+    category_list = []
+    category_commands = []
+    module = AnsibleModule(
+        argument_spec=dict(
+            category=dict(type='list', default=['Systems']),
+            command=dict(type='list'),
+            baseuri=dict(),
+            baseuris=dict(type='list', elements='str'),
+            concurrency=dict(type='int', default=10),
+            username=dict(required=True),
+            password=dict(required=True, no_log=True),
+            timeout=dict(type='int', default=10)
+        ),
+        required_one_of=[('baseuri', 'baseuris')],
+        mutually_exclusive=[('baseuri', 'baseuris')],
+        supports_check_mode=False
+    )
+    is_old_facts = module._name in ('redfish_facts', 'community.general.redfish_facts')
+    if is_old_facts:
+        module.deprecate("The 'redfish_facts' module has been renamed to 'redfish_info', "
+                         "and the renamed one no longer returns ansible_facts",
+                         version='3.0.0', collection_name='community.general')  # was Ansible 2.13
+
+    # admin credentials used for authentication
+    creds = {'user': module.params['username'],
+             'pswd': module.params['password']}
+
+    # timeout
+    timeout = module.params['timeout']
+
+    # Build Category list
+    if "all" in module.params['category']:
+        for entry in CATEGORY_COMMANDS_ALL:
+            category_list.append(entry)
+    else:
+        # one or more categories specified
+        category_list = module.params['category']
+
+    for category in category_list:
+        command_list = []
+        # Build Command list for each Category
+        if category in CATEGORY_COMMANDS_ALL:
+            if not module.params['command']:
+                # True if we don't specify a command --> use default
+                command_list.append(CATEGORY_COMMANDS_DEFAULT[category])
+            elif "all" in module.params['command']:
+                for entry in range(len(CATEGORY_COMMANDS_ALL[category])):
+                    command_list.append(CATEGORY_COMMANDS_ALL[category][entry])
+            # one or more commands
+            else:
+                command_list = module.params['command']
+                # Verify that all commands are valid
+                for cmd in command_list:
+                    # Fail if even one command given is invalid
+                    if cmd not in CATEGORY_COMMANDS_ALL[category]:
+                        module.fail_json(msg="Invalid Command: %s" % cmd)
+        else:
+            # Fail if even one category given is invalid
+            module.fail_json(msg="Invalid Category: %s" % category)
+        category_commands.append((category, command_list))
+
+    if module.params['baseuris']:
+        baseuris = module.params['baseuris']
+        if module.params['concurrency'] < 1:
+            module.fail_json(msg="concurrency must be at least 1")
+
+        # One RedfishUtils per OOB controller, reused for all the categories
+        def get_facts(baseuri):
+            rf_utils = RedfishUtils(creds, "https://" + baseuri, timeout, module)
+            return get_redfish_facts(rf_utils, category_commands)
+
+        facts_by_baseuri = {}
+        failed_baseuris = {}
+        for baseuri, facts in zip(baseuris, run_on_baseuris(baseuris, get_facts, module.params['concurrency'])):
+            if facts['ret'] is False:
+                failed_baseuris[baseuri] = facts['msg']
+            else:
+                facts_by_baseuri[baseuri] = facts['redfish_facts']
+        if failed_baseuris:
+            module.fail_json(msg="Failed to get information from %d of %d OOB controllers" % (len(failed_baseuris), len(baseuris)),
+                             redfish_facts_by_baseuri=facts_by_baseuri, failed_baseuris=failed_baseuris)
+        module.exit_json(redfish_facts_by_baseuri=facts_by_baseuri, failed_baseuris=failed_baseuris)
+
+    # Build root URI
+    root_uri = "https://" + module.params['baseuri']
+    rf_utils = RedfishUtils(creds, root_uri, timeout, module)
+
+    facts = get_redfish_facts(rf_utils, category_commands)
+    if facts['ret'] is False:
+        module.fail_json(msg=facts['msg'])
+    result = facts['redfish_facts']
+
     # Return data back
     if is_old_facts:
         module.exit_json(ansible_facts=dict(redfish_facts=result))
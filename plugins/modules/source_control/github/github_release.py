@@ -28,7 +28,28 @@ options:
     repo:
         description:
             - Repository name
-        required: true
+            - One of I(repo) and I(organization) is required.
+    organization:
+        description:
+            - Name of an organization, to get the latest release of all its repositories instead of I(repo).
+            - The repositories are listed page by page and their latest releases are queried concurrently with
+              conditional requests, which do not count against the rate limit when the release did not change.
+            - Only supported with I(action=latest_release).
+        type: str
+        version_added: 1.0.0
+    concurrency:
+        description:
+            - With I(organization), the maximum number of repositories queried at the same time.
+        type: int
+        default: 8
+        version_added: 1.0.0
+    etag_cache:
+        description:
+            - With I(organization), cache the ETags and the content of the responses in C(~/.ansible/tmp/github-etags.json),
+              only readable by its owner, to make conditional requests in the next runs.
+        type: bool
+        default: 'yes'
+        version_added: 1.0.0
     action:
         description:
             - Action to perform
@@ -84,6 +105,13 @@ EXAMPLES = '''
     repo: testrepo
     action: latest_release
 
+- name: Get latest release of all the repositories of an organization
+  github_release:
+    token: tokenabc1234567890
+    user: testuser
+    organization: testorg
+    action: latest_release
+
 - name: Create a new release
   github_release:
     token: tokenabc1234567890
@@ -112,6 +140,12 @@ latest_release:
     type: str
     returned: success
     sample: 1.1.0
+
+releases:
+    description: Tag of the latest release of every repository of the organization, indexed by repository full name. C(null) for repositories without release.
+    type: dict
+    returned: when I(organization) is set
+    sample: {"testorg/testrepo": "1.1.0", "testorg/otherrepo": null}
 '''
 
 import traceback
@@ -127,12 +161,43 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible.module_utils._text import to_native
+from ansible_collections.community.general.plugins.module_utils.source_control.github import GitHubAPI, GitHubAPIError
+
+
+def organization_latest_releases(module):
+    api = GitHubAPI(module, user=module.params['user'] if module.params['password'] else None,
+                    password=module.params['password'], token=module.params['token'],
+                    etag_cache=module.params['etag_cache'])
+    try:
+        repositories = api.list_organization_repositories(module.params['organization'])
+    except GitHubAPIError as e:
+        module.fail_json(msg="Unable to list the repositories of organization %s: %s" % (module.params['organization'], to_native(e)))
+
+    def latest_release(repository):
+        try:
+            return api.get(api.repository_path(repository) + '/releases/latest')[0]['tag_name']
+        except GitHubAPIError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    results = api.fan_out(latest_release, repositories, module.params['concurrency'])
+    api.save_cache()
+
+    errors = ["%s: %s" % (repository, error) for repository, tag, error in results if error is not None]
+    if errors:
+        module.fail_json(msg="Unable to get the latest release of repositories: %s" % "; ".join(errors))
+
+    return dict((repository, tag) for repository, tag, error in results)
 
 
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            repo=dict(required=True),
+            repo=dict(),
+            organization=dict(type='str'),
+            concurrency=dict(type='int', default=8),
+            etag_cache=dict(type='bool', default=True),
             user=dict(required=True),
             password=dict(no_log=True),
             token=dict(no_log=True),
@@ -146,11 +211,17 @@ def main():
             prerelease=dict(type='bool', default=False),
         ),
         supports_check_mode=True,
-        mutually_exclusive=(('password', 'token'),),
+        mutually_exclusive=(('password', 'token'), ('repo', 'organization')),
+        required_one_of=(('repo', 'organization'),),
         required_if=[('action', 'create_release', ['tag']),
                      ('action', 'create_release', ['password', 'token'], True)],
     )
 
+    if module.params['organization'] is not None:
+        if module.params['action'] != 'latest_release':
+            module.fail_json(msg="organization is only supported with action=latest_release")
+        module.exit_json(releases=organization_latest_releases(module))
+
     if not HAS_GITHUB_API:
         module.fail_json(msg=missing_required_lib('github3.py >= 1.0.0a3'),
                          exception=GITHUB_IMP_ERR)
@@ -19,9 +19,29 @@ options:
   repository:
     description:
       - Full name of the repository to configure a hook for
-    required: true
+      - One of I(repository) and I(organization) is required.
     aliases:
       - repo
+  organization:
+    description:
+      - Name of an organization, to query the hooks of all its repositories instead of I(repository).
+      - The repositories are listed page by page and their hooks are queried concurrently with conditional
+        requests, which do not count against the rate limit when the hooks did not change.
+    type: str
+    version_added: 1.0.0
+  concurrency:
+    description:
+      - With I(organization), the maximum number of repositories queried at the same time.
+    type: int
+    default: 8
+    version_added: 1.0.0
+  etag_cache:
+    description:
+      - With I(organization), cache the ETags and the content of the responses in C(~/.ansible/tmp/github-etags.json),
+        only readable by its owner, to make conditional requests in the next runs.
+    type: bool
+    default: yes
+    version_added: 1.0.0
   user:
     description:
       - User to authenticate to GitHub as
@@ -59,13 +79,20 @@ EXAMPLES = '''
     token: "{{ github_user_api_token }}"
     github_url: https://github.example.com/api/v3/
   register: myrepo_webhooks
+
+- name: List hooks for all the repositories of an organization
+  github_webhook_info:
+    organization: myorg
+    user: "{{ github_user }}"
+    token: "{{ github_user_api_token }}"
+  register: myorg_webhooks
 '''
 
 RETURN = '''
 ---
 hooks:
   description: A list of hooks that exist for the repo
-  returned: always
+  returned: when I(repository) is set
   type: list
   sample: >
     [{"has_shared_secret": true,
@@ -76,6 +103,19 @@ hooks:
       "active": true,
       "id": 6206,
       "last_response": {"status": "active", "message": "OK", "code": 200}}]
+repositories:
+  description: The list of hooks, as in I(hooks), of every repository of the organization, indexed by repository full name.
+  returned: when I(organization) is set
+  type: dict
+  sample: >
+    {"myorg/myrepo": [{"has_shared_secret": false,
+                       "url": "https://api.github.com/repos/myorg/myrepo/hooks/6206",
+                       "events": ["push"],
+                       "insecure_ssl": "0",
+                       "content_type": "json",
+                       "active": true,
+                       "id": 6206,
+                       "last_response": {"status": "active", "message": "OK", "code": 200}}]}
 '''
 
 import traceback
@@ -90,6 +130,7 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible.module_utils._text import to_native
+from ansible_collections.community.general.plugins.module_utils.source_control.github import GitHubAPI, GitHubAPIError
 
 
 def _munge_hook(hook_obj):
@@ -108,22 +149,65 @@ def _munge_hook(hook_obj):
     return retval
 
 
+def _munge_hook_data(hook):
+    retval = {
+        "active": hook["active"],
+        "events": hook["events"],
+        "id": hook["id"],
+        "url": hook["url"],
+    }
+    retval.update(hook["config"])
+    retval["has_shared_secret"] = "secret" in retval
+    if "secret" in retval:
+        del retval["secret"]
+
+    retval["last_response"] = hook.get("last_response")
+    return retval
+
+
+def organization_hooks(module):
+    api = GitHubAPI(module, base_url=module.params["github_url"], user=module.params["user"],
+                    password=module.params["password"], token=module.params["token"],
+                    etag_cache=module.params["etag_cache"])
+    try:
+        repositories = api.list_organization_repositories(module.params["organization"])
+    except GitHubAPIError as err:
+        module.fail_json(msg="Unable to list the repositories of organization %s: %s" % (
+            module.params["organization"], to_native(err)))
+
+    results = api.fan_out(lambda repository: api.get_all(api.repository_path(repository) + '/hooks?per_page=100'),
+                          repositories, module.params["concurrency"])
+    api.save_cache()
+
+    errors = ["%s: %s" % (repository, error) for repository, hooks, error in results if error is not None]
+    if errors:
+        module.fail_json(msg="Unable to get hooks from repositories: %s" % "; ".join(errors))
+
+    return dict((repository, [_munge_hook_data(h) for h in hooks]) for repository, hooks, error in results)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            repository=dict(type='str', required=True, aliases=["repo"]),
+            repository=dict(type='str', aliases=["repo"]),
+            organization=dict(type='str'),
+            concurrency=dict(type='int', default=8),
+            etag_cache=dict(type='bool', default=True),
             user=dict(type='str', required=True),
             password=dict(type='str', required=False, no_log=True),
             token=dict(type='str', required=False, no_log=True),
             github_url=dict(
                 type='str', required=False, default="https://api.github.com")),
-        mutually_exclusive=(('password', 'token'), ),
-        required_one_of=(("password", "token"), ),
+        mutually_exclusive=(('password', 'token'), ('repository', 'organization')),
+        required_one_of=(("password", "token"), ("repository", "organization")),
         supports_check_mode=True)
     if module._name in ('github_webhook_facts', 'community.general.github_webhook_facts'):
         module.deprecate("The 'github_webhook_facts' module has been renamed to 'github_webhook_info'",
                          version='3.0.0', collection_name='community.general')  # was Ansible 2.13
 
+    if module.params["organization"] is not None:
+        module.exit_json(changed=False, repositories=organization_hooks(module))
+
     if not HAS_GITHUB:
         module.fail_json(msg=missing_required_lib('PyGithub'),
                          exception=GITHUB_IMP_ERR)
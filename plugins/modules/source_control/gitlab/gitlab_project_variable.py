@@ -38,8 +38,23 @@ options:
   project:
     description:
       - The path and name of the project.
-    required: true
+      - One of I(project) and I(projects) is required.
     type: str
+  projects:
+    description:
+      - List of paths and names of projects, to apply the same variables to all of them.
+      - The projects are resolved from a single paginated listing of the projects of the user, and their
+        variables are compared and updated concurrently.
+      - Mutually exclusive with I(project).
+    type: list
+    elements: str
+    version_added: 1.0.0
+  concurrency:
+    description:
+      - With I(projects), the maximum number of projects updated at the same time.
+    type: int
+    default: 4
+    version_added: 1.0.0
   purge:
     description:
       - When set to true, all variables which are not untouched in the task will be deleted.
@@ -86,6 +101,17 @@ EXAMPLES = '''
         protected: true
         variable_type: env_var
 
+- name: Set or update some CI/CD variables of many projects
+  gitlab_project_variable:
+    api_url: https://gitlab.com
+    api_token: secret_access_token
+    projects:
+      - markuman/dotfiles
+      - markuman/tools
+    purge: false
+    vars:
+      ACCESS_KEY_ID: abc123
+
 - name: Delete one variable
   gitlab_project_variable:
     api_url: https://gitlab.com
@@ -122,9 +148,15 @@ project_variable:
       returned: always
       type: list
       sample: "['ACCESS_KEY_ID', 'SECRET_ACCESS_KEY']"
+project_variables:
+  description: The I(project_variable) lists of every project of I(projects), indexed by project.
+  returned: when I(projects) is set
+  type: dict
+  sample: "{'markuman/dotfiles': {'added': ['ACCESS_KEY_ID'], 'removed': [], 'untouched': [], 'updated': []}}"
 '''
 
 import traceback
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible.module_utils._text import to_native
@@ -141,21 +173,21 @@ except Exception:
     GITLAB_IMP_ERR = traceback.format_exc()
     HAS_GITLAB_PACKAGE = False
 
-from ansible_collections.community.general.plugins.module_utils.gitlab import gitlabAuthentication
+from ansible_collections.community.general.plugins.module_utils.gitlab import gitlabAuthentication, indexProjects
 
 
 class GitlabProjectVariables(object):
 
-    def __init__(self, module, gitlab_instance):
+    def __init__(self, module, gitlab_instance, project=None):
         self.repo = gitlab_instance
-        self.project = self.get_project(module.params['project'])
+        self.project = project if project is not None else self.get_project(module.params['project'])
         self._module = module
 
     def get_project(self, project_name):
         return self.repo.projects.get(project_name)
 
     def list_all_project_variables(self):
-        return self.project.variables.list()
+        return self.project.variables.list(all=True)
 
     def create_variable(self, key, value, masked, protected, variable_type):
         if self._module.check_mode:
@@ -247,11 +279,57 @@ def native_python_main(this_gitlab, purge, var_list, state, module):
     return change, return_value
 
 
+def check_var_list(var_list, module):
+    for key in var_list:
+        if not isinstance(var_list[key], (string_types, integer_types, float, dict)):
+            module.fail_json(msg="value must be of type string, integer or dict")
+
+
+def multi_project_main(gitlab_instance, projects, purge, var_list, state, module):
+    # Values are checked first, native_python_main must not fail the module from a thread
+    check_var_list(var_list, module)
+
+    index = indexProjects(gitlab_instance, projects)
+    missing = [project for project in projects if index[project] is None]
+    if missing:
+        module.fail_json(msg="Projects not found: %s" % ', '.join(missing))
+
+    def sync(project):
+        try:
+            this_gitlab = GitlabProjectVariables(module=module, gitlab_instance=gitlab_instance, project=index[project])
+            return project, native_python_main(this_gitlab, purge, var_list, state, module), None
+        except Exception as e:
+            return project, None, to_native(e)
+
+    change = False
+    return_value = dict()
+    errors = []
+    pool = ThreadPool(max(1, min(module.params['concurrency'], len(projects))))
+    try:
+        for project, result, error in pool.imap(sync, projects):
+            if error is not None:
+                errors.append("%s: %s" % (project, error))
+                continue
+            change = result[0] or change
+            return_value[project] = result[1]
+    finally:
+        pool.close()
+        pool.join()
+
+    if errors:
+        module.fail_json(msg="Failed to update the variables of some projects: %s" % '; '.join(errors),
+                         changed=change, project_variables=return_value)
+
+    return change, return_value
+
+
 def main():
     argument_spec = basic_auth_argument_spec()
     argument_spec.update(
         api_token=dict(type='str', required=True, no_log=True),
-        project=dict(type='str', required=True),
+        project=dict(type='str'),
+        projects=dict(type='list', elements='str'),
+        concurrency=dict(type='int', default=4),
         purge=dict(type='bool', required=False, default=False),
         vars=dict(type='dict', required=False, default=dict(), no_log=True),
         state=dict(type='str', default="present", choices=["absent", "present"])
@@ -262,12 +340,14 @@ def main():
         mutually_exclusive=[
             ['api_username', 'api_token'],
             ['api_password', 'api_token'],
+            ['project', 'projects'],
         ],
         required_together=[
             ['api_username', 'api_password'],
         ],
         required_one_of=[
-            ['api_username', 'api_token']
+            ['api_username', 'api_token'],
+            ['project', 'projects'],
         ],
         supports_check_mode=True
     )
@@ -281,6 +361,11 @@ def main():
 
     gitlab_instance = gitlabAuthentication(module)
 
+    if module.params['projects'] is not None:
+        # Authenticated once for all the projects
+        change, return_value = multi_project_main(gitlab_instance, module.params['projects'], purge, var_list, state, module)
+        module.exit_json(changed=change, project_variables=return_value)
+
     this_gitlab = GitlabProjectVariables(module=module, gitlab_instance=gitlab_instance)
 
     change, return_value = native_python_main(this_gitlab, purge, var_list, state, module)
@@ -147,10 +147,7 @@ zfs_datasets:
             }
 '''
 
-from collections import defaultdict
-
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.six import iteritems
 
 
 SUPPORTED_TYPES = ['all', 'filesystem', 'volume', 'snapshot', 'bookmark']
@@ -168,24 +165,10 @@ class ZFSFacts(object):
         self.type = module.params['type']
         self.depth = module.params['depth']
 
-        self._datasets = defaultdict(dict)
         self.facts = []
 
-    def dataset_exists(self):
-        cmd = [self.module.get_bin_path('zfs')]
-
-        cmd.append('list')
-        cmd.append(self.name)
-
-        (rc, out, err) = self.module.run_command(cmd)
-
-        if rc == 0:
-            return True
-        else:
-            return False
-
     def get_facts(self):
-        cmd = [self.module.get_bin_path('zfs')]
+        cmd = [self.module.get_bin_path('zfs', True)]
 
         cmd.append('get')
         cmd.append('-H')
@@ -204,19 +187,23 @@ class ZFSFacts(object):
         cmd.append(self.properties)
         cmd.append(self.name)
 
-        (rc, out, err) = self.module.run_command(cmd)
+        (rc, out, err) = self.module.run_command(cmd, environ_update=dict(LC_ALL='C'))
 
         if rc == 0:
+            # 'zfs get' reports all properties of a dataset on consecutive lines,
+            # so every dataset is complete once the name changes
+            dataset = None
             for line in out.splitlines():
-                dataset, property, value = line.split('\t')
-
-                self._datasets[dataset].update({property: value})
-
-            for k, v in iteritems(self._datasets):
-                v.update({'name': k})
-                self.facts.append(v)
+                name, property, value = line.split('\t', 2)
+                if dataset is None or name != dataset['name']:
+                    dataset = {'name': name}
+                    self.facts.append(dataset)
+                dataset[property] = value
 
             return {'ansible_zfs_datasets': self.facts}
+        elif 'dataset does not exist' in err:
+            # A missing dataset is reported by the same call, no separate 'zfs list' is needed
+            self.module.fail_json(msg='ZFS dataset %s does not exist!' % self.name)
         else:
             self.module.fail_json(msg='Error while trying to get facts about ZFS dataset: %s' % self.name,
                                   stderr=err,
@@ -248,10 +235,7 @@ def main():
     if zfs_facts.recurse:
         result['recurse'] = zfs_facts.recurse
 
-    if zfs_facts.dataset_exists():
-        result['ansible_facts'] = zfs_facts.get_facts()
-    else:
-        module.fail_json(msg='ZFS dataset %s does not exist!' % zfs_facts.name)
+    result['ansible_facts'] = zfs_facts.get_facts()
 
     module.exit_json(**result)
 
@@ -40,6 +40,47 @@ options:
     description:
       - The ICMP block you would like to add/remove to/from a zone in firewalld.
     type: str
+  services:
+    description:
+      - List of services to add/remove to/from a zone in firewalld.
+      - The lists I(services), I(ports), I(sources) and I(rich_rules) are applied together. The permanent configuration
+        of the zone is fetched once and updated once, and the runtime configuration is queried once and only the
+        missing or extra entries are changed.
+      - Cannot be used with I(service), I(port), I(rich_rule), I(source), I(interface), I(masquerade),
+        I(icmp_block), I(icmp_block_inversion) or I(target).
+    type: list
+    elements: str
+    version_added: 1.0.0
+  ports:
+    description:
+      - List of ports or port ranges to add/remove to/from a zone in firewalld.
+      - Each element must be in the form PORT/PROTOCOL or PORT-PORT/PROTOCOL.
+      - See I(services) for how the lists are applied.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  sources:
+    description:
+      - List of sources/networks to add/remove to/from a zone in firewalld.
+      - See I(services) for how the lists are applied.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  rich_rules:
+    description:
+      - List of rich rules to add/remove to/from a zone in firewalld.
+      - See I(services) for how the lists are applied.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  exclusive:
+    description:
+      - When I(state=enabled), remove the entries of the zone which are not in the given lists.
+      - Only the kinds of entries given with I(services), I(ports), I(sources) and I(rich_rules) are considered,
+        for example the services of the zone are left untouched if I(services) is not set.
+    type: bool
+    default: no
+    version_added: 1.0.0
   icmp_block_inversion:
     description:
       - Enable/Disable inversion of ICMP blocks for a zone in firewalld.
@@ -181,6 +222,24 @@ EXAMPLES = r'''
     permanent: yes
     immediate: yes
     state: enabled
+
+- name: Set the whole policy of a zone in one update
+  firewalld:
+    zone: internal
+    services:
+      - http
+      - https
+    ports:
+      - 8080/tcp
+      - 161-162/udp
+    sources:
+      - 192.0.2.0/24
+    rich_rules:
+      - rule service name="ftp" audit limit value="1/m" accept
+    exclusive: yes
+    permanent: yes
+    immediate: yes
+    state: enabled
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -675,6 +734,145 @@ class ZoneTransaction(FirewallTransaction):
         zone_obj.remove()
 
 
+class ZoneRulesTransaction(FirewallTransaction):
+    """
+    ZoneRulesTransaction
+
+    Apply lists of services, ports, sources and rich rules to a zone at once.
+    The zone is considered "enabled" when it is in the desired state, so the
+    transaction only ever runs the set_enabled_* functions, which apply the
+    delta computed by the get_enabled_* functions.
+    """
+
+    def __init__(self, module, action_args=None, zone=None, desired_state=None, permanent=False, immediate=False):
+        super(ZoneRulesTransaction, self).__init__(
+            module, action_args=action_args, desired_state='enabled', zone=zone, permanent=permanent, immediate=immediate
+        )
+
+        self.rules_state = desired_state
+        self.permanent_settings = None
+        self.permanent_delta = None
+        self.immediate_delta = None
+        self.added = set()
+        self.removed = set()
+
+    @staticmethod
+    def normalize_rich_rules(rules):
+        # Convert the rule strings to standard format before comparing them
+        return [str(Rich_Rule(rule_str=rule)) for rule in rules]
+
+    def get_delta(self, current, rules, exclusive):
+        """
+        Compute the entries to add and to remove for each kind of entries.
+
+        :current:   dict, kind of entries to list of the current entries
+        :rules:     dict, kind of entries to list of the wanted entries, or None
+        :exclusive: bool, remove the current entries which are not wanted
+        """
+        delta = {}
+        for kind, wanted in rules.items():
+            if wanted is None:
+                continue
+            if kind == 'rich_rules':
+                wanted = self.normalize_rich_rules(wanted)
+            existing = set(current[kind])
+            if self.rules_state == 'enabled':
+                to_add = [item for item in wanted if item not in existing]
+                to_remove = []
+                if exclusive:
+                    wanted_set = set(wanted)
+                    to_remove = [item for item in current[kind] if item not in wanted_set]
+            else:
+                to_add = []
+                to_remove = [item for item in wanted if item in existing]
+            if to_add or to_remove:
+                delta[kind] = (to_add, to_remove)
+        return delta
+
+    def record_delta(self, delta):
+        for kind, (to_add, to_remove) in delta.items():
+            self.added.update((kind, item) for item in to_add)
+            self.removed.update((kind, item) for item in to_remove)
+
+    def get_enabled_immediate(self, rules, exclusive, timeout):
+        current = dict(
+            services=self.fw.getServices(self.zone),
+            ports=[tuple(port_proto) for port_proto in self.fw.getPorts(self.zone)],
+            sources=self.fw.getSources(self.zone),
+            rich_rules=self.fw.getRichRules(self.zone),
+        )
+        self.immediate_delta = self.get_delta(current, rules, exclusive)
+        return not self.immediate_delta
+
+    def get_enabled_permanent(self, rules, exclusive, timeout):
+        # Keep the fetched settings, the delta is applied to them
+        self.permanent_settings = self.get_fw_zone_settings()
+        fw_zone, fw_settings = self.permanent_settings
+        current = dict(
+            services=fw_settings.getServices(),
+            ports=[tuple(port_proto) for port_proto in fw_settings.getPorts()],
+            sources=fw_settings.getSources(),
+            rich_rules=self.normalize_rich_rules(fw_settings.getRichRules()),
+        )
+        self.permanent_delta = self.get_delta(current, rules, exclusive)
+        return not self.permanent_delta
+
+    def set_enabled_immediate(self, rules, exclusive, timeout):
+        to_add, to_remove = self.immediate_delta.get('services', ([], []))
+        for service in to_remove:
+            self.fw.removeService(self.zone, service)
+        for service in to_add:
+            self.fw.addService(self.zone, service, timeout)
+        to_add, to_remove = self.immediate_delta.get('ports', ([], []))
+        for port, protocol in to_remove:
+            self.fw.removePort(self.zone, port, protocol)
+        for port, protocol in to_add:
+            self.fw.addPort(self.zone, port, protocol, timeout)
+        to_add, to_remove = self.immediate_delta.get('sources', ([], []))
+        for source in to_remove:
+            self.fw.removeSource(self.zone, source)
+        for source in to_add:
+            self.fw.addSource(self.zone, source)
+        to_add, to_remove = self.immediate_delta.get('rich_rules', ([], []))
+        for rule in to_remove:
+            self.fw.removeRichRule(self.zone, rule)
+        for rule in to_add:
+            self.fw.addRichRule(self.zone, rule, timeout)
+        self.record_delta(self.immediate_delta)
+
+    def set_enabled_permanent(self, rules, exclusive, timeout):
+        fw_zone, fw_settings = self.permanent_settings
+        to_add, to_remove = self.permanent_delta.get('services', ([], []))
+        for service in to_remove:
+            fw_settings.removeService(service)
+        for service in to_add:
+            fw_settings.addService(service)
+        to_add, to_remove = self.permanent_delta.get('ports', ([], []))
+        for port, protocol in to_remove:
+            fw_settings.removePort(port, protocol)
+        for port, protocol in to_add:
+            fw_settings.addPort(port, protocol)
+        to_add, to_remove = self.permanent_delta.get('sources', ([], []))
+        for source in to_remove:
+            fw_settings.removeSource(source)
+        for source in to_add:
+            fw_settings.addSource(source)
+        to_add, to_remove = self.permanent_delta.get('rich_rules', ([], []))
+        for rule in to_remove:
+            fw_settings.removeRichRule(rule)
+        for rule in to_add:
+            fw_settings.addRichRule(rule)
+        # All the changes are written with a single update of the zone
+        self.update_fw_settings(fw_zone, fw_settings)
+        self.record_delta(self.permanent_delta)
+
+    def set_disabled_immediate(self, rules, exclusive, timeout):
+        self.set_enabled_immediate(rules, exclusive, timeout)
+
+    def set_disabled_permanent(self, rules, exclusive, timeout):
+        self.set_enabled_permanent(rules, exclusive, timeout)
+
+
 def main():
 
     module = AnsibleModule(
@@ -694,6 +892,11 @@ def main():
             masquerade=dict(type='str'),
             offline=dict(type='bool'),
             target=dict(type='str', required=False, choices=['default', 'ACCEPT', 'DROP', 'REJECT']),
+            services=dict(type='list', elements='str'),
+            ports=dict(type='list', elements='str'),
+            sources=dict(type='list', elements='str'),
+            rich_rules=dict(type='list', elements='str'),
+            exclusive=dict(type='bool', default=False),
         ),
         supports_check_mode=True,
         required_by=dict(
@@ -742,6 +945,20 @@ def main():
     else:
         port = None
 
+    rules = dict(
+        services=module.params['services'],
+        ports=None,
+        sources=module.params['sources'],
+        rich_rules=module.params['rich_rules'],
+    )
+    if module.params['ports'] is not None:
+        rules['ports'] = []
+        for port_proto in module.params['ports']:
+            if '/' not in port_proto:
+                module.fail_json(msg='improper port format for %s (missing protocol?)' % port_proto)
+            rules['ports'].append(tuple(port_proto.strip().split('/', 1)))
+    has_rules = any(value is not None for value in rules.values())
+
     modification_count = 0
     if icmp_block is not None:
         modification_count += 1
@@ -761,10 +978,13 @@ def main():
         modification_count += 1
     if target is not None:
         modification_count += 1
+    if has_rules:
+        modification_count += 1
 
     if modification_count > 1:
         module.fail_json(
-            msg='can only operate on port, service, rich_rule, masquerade, icmp_block, icmp_block_inversion, interface or source at once'
+            msg='can only operate on port, service, rich_rule, masquerade, icmp_block, icmp_block_inversion, interface, source '
+                'or the services, ports, sources and rich_rules lists at once'
         )
     elif (modification_count > 0) and (desired_state in ['absent', 'present']) and (target is None):
         module.fail_json(
@@ -911,6 +1131,24 @@ def main():
         changed, transaction_msgs = transaction.run()
         msgs = msgs + transaction_msgs
 
+    if has_rules:
+
+        transaction = ZoneRulesTransaction(
+            module,
+            action_args=(rules, module.params['exclusive'], timeout),
+            zone=zone,
+            desired_state=desired_state,
+            permanent=permanent,
+            immediate=immediate,
+        )
+
+        changed, transaction_msgs = transaction.run()
+        msgs = msgs + transaction_msgs
+        if changed is True:
+            msgs.append("Added %d and removed %d entries in zone %s" % (
+                len(transaction.added), len(transaction.removed), transaction.zone
+            ))
+
     ''' If there are no changes within the zone we are operating on the zone itself '''
     if modification_count == 0 and desired_state in ['absent', 'present']:
 
@@ -268,16 +268,13 @@ def main():
                 for device in current_devs:
                     pvresize_cmd = module.get_bin_path('pvresize', True)
                     pvdisplay_cmd = module.get_bin_path('pvdisplay', True)
-                    pvdisplay_ops = ["--units", "b", "--columns", "--noheadings", "--nosuffix"]
+                    pvdisplay_ops = ["--units", "b", "--columns", "--noheadings", "--nosuffix", "--separator", ";"]
                     pvdisplay_cmd_device_options = [pvdisplay_cmd, device] + pvdisplay_ops
-                    rc, dev_size, err = module.run_command(pvdisplay_cmd_device_options + ["-o", "dev_size"])
-                    dev_size = int(dev_size.replace(" ", ""))
-                    rc, pv_size, err = module.run_command(pvdisplay_cmd_device_options + ["-o", "pv_size"])
-                    pv_size = int(pv_size.replace(" ", ""))
-                    rc, pe_start, err = module.run_command(pvdisplay_cmd_device_options + ["-o", "pe_start"])
-                    pe_start = int(pe_start.replace(" ", ""))
-                    rc, vg_extent_size, err = module.run_command(pvdisplay_cmd_device_options + ["-o", "vg_extent_size"])
-                    vg_extent_size = int(vg_extent_size.replace(" ", ""))
+                    # Fetch all the sizes we need with a single call
+                    rc, sizes, err = module.run_command(pvdisplay_cmd_device_options + ["-o", "dev_size,pv_size,pe_start,vg_extent_size"])
+                    if rc != 0:
+                        module.fail_json(msg="Failed executing pvdisplay command.", rc=rc, err=err)
+                    dev_size, pv_size, pe_start, vg_extent_size = [int(size.strip()) for size in sizes.strip().split(';')]
                     if (dev_size - (pe_start + pv_size)) > vg_extent_size:
                         if module.check_mode:
                             changed = True
@@ -69,8 +69,59 @@ options:
     - Resize the underlying filesystem together with the logical volume.
     type: bool
     default: 'no'
+  volumes:
+    description:
+    - A list of logical volumes to manage in the volume group C(vg) in one go.
+    - The state of the volume group and all its logical volumes is discovered once, all changes are planned
+      before any of them is applied, and removals and (de)activations are done with a single command each.
+    - Uses the JSON report format of LVM when available.
+    - Options not set for a volume default to the value of the corresponding top-level option.
+    - Mutually exclusive with C(lv), C(size), C(snapshot) and C(thinpool).
+    type: list
+    elements: dict
+    suboptions:
+      lv:
+        description:
+        - The name of the logical volume.
+        type: str
+        required: true
+      size:
+        description:
+        - The size of the logical volume, see the top-level C(size) option.
+        type: str
+      state:
+        description:
+        - Control if the logical volume exists.
+        type: str
+        choices: [ absent, present ]
+      active:
+        description:
+        - Whether the volume is active and visible to the host.
+        type: bool
+      force:
+        description:
+        - Allow shrinking or removing the volume.
+        type: bool
+      opts:
+        description:
+        - Free-form options to be passed to the lvcreate command.
+        type: str
+      pvs:
+        description:
+        - Comma separated list of physical volumes (e.g. /dev/sda,/dev/sdb).
+        type: str
+      shrink:
+        description:
+        - Shrink if current size is higher than size requested.
+        type: bool
+      resizefs:
+        description:
+        - Resize the underlying filesystem together with the logical volume.
+        type: bool
+    version_added: 1.0.0
 notes:
-  - You must specify lv (when managing the state of logical volumes) or thinpool (when managing a thin provisioned volume).
+  - You must specify lv (when managing the state of logical volumes), thinpool (when managing a thin provisioned volume)
+    or volumes (when managing several logical volumes at once).
 '''
 
 EXAMPLES = '''
@@ -192,8 +243,33 @@ EXAMPLES = '''
     lv: test
     thinpool: testpool
     size: 128g
+
+- name: Manage several logical volumes with a single discovery of the volume group
+  lvol:
+    vg: firefly
+    volumes:
+    - lv: data
+      size: 10g
+    - lv: logs
+      size: 20%VG
+      resizefs: yes
+    - lv: scratch
+      active: false
+    - lv: old
+      state: absent
+      force: yes
 '''
 
+RETURN = '''
+volumes:
+  description: The per-volume results when C(volumes) is used.
+  returned: when C(volumes) is set
+  type: list
+  sample: [{lv: data, changed: true, msg: 'Volume data created'}]
+  version_added: 1.0.0
+'''
+
+import json
 import re
 
 from ansible.module_utils.basic import AnsibleModule
@@ -239,6 +315,72 @@ def parse_vgs(data):
     return vgs
 
 
+def parse_lvs_json(data):
+    lvs = []
+    for report in json.loads(data)['report']:
+        for lv in report['lv']:
+            lvs.append({
+                'name': lv['lv_name'].replace('[', '').replace(']', ''),
+                'size': float(lv['lv_size']),
+                'active': (lv['lv_attr'][4] == 'a'),
+                'thinpool': (lv['lv_attr'][0] == 't'),
+                'thinvol': (lv['lv_attr'][0] == 'V'),
+            })
+    return lvs
+
+
+def parse_vgs_json(data):
+    vgs = []
+    for report in json.loads(data)['report']:
+        for vg in report['vg']:
+            vgs.append({
+                'name': vg['vg_name'],
+                'size': float(vg['vg_size']),
+                'free': float(vg['vg_free']),
+                'ext_size': float(vg['vg_extent_size'])
+            })
+    return vgs
+
+
+def get_size_spec(module, size):
+    """ Validate a size specification
+
+    Returns a tuple of (size, size_opt, size_unit, size_percent, size_whole)."""
+    size_opt = 'L'
+    size_unit = 'm'
+    size_percent = None
+    size_whole = None
+
+    # LVCREATE(8) -l --extents option with percentage
+    if '%' in size:
+        size_parts = size.split('%', 1)
+        size_percent = int(size_parts[0])
+        if size_percent > 100:
+            module.fail_json(msg="Size percentage cannot be larger than 100%")
+        size_whole = size_parts[1]
+        if size_whole == 'ORIGIN':
+            module.fail_json(msg="Snapshot Volumes are not supported")
+        elif size_whole not in ['VG', 'PVS', 'FREE']:
+            module.fail_json(msg="Specify extents as a percentage of VG|PVS|FREE")
+        size_opt = 'l'
+        size_unit = ''
+
+    if '%' not in size:
+        # LVCREATE(8) -L --size option unit
+        if size[-1].lower() in 'bskmgtpe':
+            size_unit = size[-1].lower()
+            size = size[0:-1]
+
+        try:
+            float(size)
+            if not size[0].isdigit():
+                raise ValueError()
+        except ValueError:
+            module.fail_json(msg="Bad size specification of '%s'" % size)
+
+    return (size, size_opt, size_unit, size_percent, size_whole)
+
+
 def get_lvm_version(module):
     ver_cmd = module.get_bin_path("lvm", required=True)
     rc, out, err = module.run_command("%s version" % (ver_cmd))
@@ -250,6 +392,176 @@ def get_lvm_version(module):
     return mkversion(m.group(1), m.group(2), m.group(3))
 
 
+# Multipliers of the size units accepted by lvcreate(8), lower case units are powers of 1024
+SIZE_UNITS = dict(b=1, s=512, k=1024, m=1024 ** 2, g=1024 ** 3, t=1024 ** 4, p=1024 ** 5, e=1024 ** 6)
+
+
+def get_vg_state(module, vg, json_report):
+    """ Discover a volume group and all its logical volumes, with sizes in bytes
+
+    Returns a tuple of (vg, lvs), vg is None when the volume group does not exist."""
+    if json_report:
+        report_opts = "--reportformat json"
+        vgs_parser, lvs_parser = parse_vgs_json, parse_lvs_json
+    else:
+        report_opts = "--noheadings --separator ';'"
+        vgs_parser, lvs_parser = parse_vgs, parse_lvs
+
+    vgs_cmd = module.get_bin_path("vgs", required=True)
+    rc, current_vgs, err = module.run_command(
+        "%s %s --nosuffix -o vg_name,size,free,vg_extent_size --units b %s" % (vgs_cmd, report_opts, vg))
+    if rc != 0:
+        return (None, [])
+
+    lvs_cmd = module.get_bin_path("lvs", required=True)
+    rc, current_lvs, err = module.run_command(
+        "%s -a %s --nosuffix -o lv_name,size,lv_attr --units b %s" % (lvs_cmd, report_opts, vg))
+    if rc != 0:
+        module.fail_json(msg="Failed to list logical volumes of volume group %s." % vg, rc=rc, err=err)
+
+    return (vgs_parser(current_vgs)[0], lvs_parser(current_lvs))
+
+
+def plan_volume(module, this_vg, this_lv, spec):
+    """ Compute the action needed to bring one logical volume to its requested state
+
+    Returns one of None, 'create', 'remove', 'extend' or 'reduce'."""
+    if spec['state'] == 'absent':
+        if this_lv is None:
+            return None
+        if not spec['force']:
+            module.fail_json(msg="Sorry, no removal of logical volume %s without force=yes." % spec['lv'])
+        return 'remove'
+
+    if this_lv is None:
+        if not spec['size']:
+            module.fail_json(msg="No size given for logical volume %s." % spec['lv'])
+        return 'create'
+
+    if not spec['size']:
+        return None
+
+    (size, size_opt, size_unit, size_percent, size_whole) = get_size_spec(module, spec['size'])
+    if size_opt == 'l':
+        if size_whole == 'FREE':
+            size_requested = size_percent * this_vg['free'] / 100
+        else:
+            size_requested = size_percent * this_vg['size'] / 100
+        if '+' in size:
+            size_requested += this_lv['size']
+    else:
+        # lvcreate(8) rounds sizes up to a full extent
+        size_requested = float(size) * SIZE_UNITS[size_unit]
+        size_requested = -(-size_requested // this_vg['ext_size']) * this_vg['ext_size']
+
+    if this_lv['size'] < size_requested:
+        size_free = this_vg['free']
+        if size_opt == 'l' and not ((size_free > 0) and (('+' not in size) or (size_free >= (size_requested - this_lv['size'])))):
+            module.fail_json(msg="Logical Volume %s could not be extended. Not enough free space left (%sb required / %sb available)" %
+                                 (spec['lv'], (size_requested - this_lv['size']), size_free))
+        return 'extend'
+    elif spec['shrink'] and this_lv['size'] > size_requested + (this_vg['ext_size'] if size_opt == 'l' else 0):
+        if size_requested == 0:
+            module.fail_json(msg="Sorry, no shrinking of %s to 0 permitted." % spec['lv'])
+        if not spec['force']:
+            module.fail_json(msg="Sorry, no shrinking of %s without force=yes." % spec['lv'])
+        return 'reduce'
+
+    return None
+
+
+def manage_volumes(module, vg, json_report, yesopt, test_opt):
+    """ Discover the volume group once, plan all volumes and apply the changes with as few commands as possible """
+    specs = []
+    for volume in module.params['volumes']:
+        spec = dict(volume)
+        for key in ('state', 'active', 'force', 'opts', 'pvs', 'shrink', 'resizefs'):
+            if spec[key] is None:
+                spec[key] = module.params[key]
+        spec['opts'] = spec['opts'] or ''
+        spec['pvs'] = (spec['pvs'] or '').replace(",", " ")
+        specs.append(spec)
+
+    (this_vg, lvs) = get_vg_state(module, vg, json_report)
+    if this_vg is None:
+        if all(spec['state'] == 'absent' for spec in specs):
+            module.exit_json(changed=False, stdout="Volume group %s does not exist." % vg)
+        module.fail_json(msg="Volume group %s does not exist." % vg)
+
+    lvs_by_name = dict((test_lv['name'], test_lv) for test_lv in lvs)
+
+    # Plan everything before changing anything
+    plan = []
+    for spec in specs:
+        this_lv = lvs_by_name.get(spec['lv'])
+        plan.append((spec, this_lv, plan_volume(module, this_vg, this_lv, spec)))
+
+    # Remove first, the freed space can be used by the volumes created or extended
+    to_remove = [spec['lv'] for spec, this_lv, action in plan if action == 'remove']
+    if to_remove:
+        lvremove_cmd = module.get_bin_path("lvremove", required=True)
+        rc, _, err = module.run_command("%s %s --force %s" % (lvremove_cmd, test_opt, ' '.join('%s/%s' % (vg, lv) for lv in to_remove)))
+        if rc != 0:
+            module.fail_json(msg="Failed to remove logical volumes %s" % ', '.join(to_remove), rc=rc, err=err, volumes=[])
+
+    results = []
+    to_activate = []
+    to_deactivate = []
+    for spec, this_lv, action in plan:
+        result = dict(lv=spec['lv'], changed=action is not None)
+        if action == 'remove':
+            result['msg'] = "Volume %s removed" % spec['lv']
+        elif action == 'create':
+            (size, size_opt, size_unit, size_percent, size_whole) = get_size_spec(module, spec['size'])
+            lvcreate_cmd = module.get_bin_path("lvcreate", required=True)
+            cmd = "%s %s %s -n %s -%s %s%s %s %s %s" % (lvcreate_cmd, test_opt, yesopt, spec['lv'], size_opt, size, size_unit,
+                                                        spec['opts'], vg, spec['pvs'])
+            rc, _, err = module.run_command(cmd)
+            if rc != 0:
+                module.fail_json(msg="Creating logical volume '%s' failed" % spec['lv'], rc=rc, err=err, volumes=results)
+            result['msg'] = "Volume %s created" % spec['lv']
+        elif action in ('extend', 'reduce'):
+            (size, size_opt, size_unit, size_percent, size_whole) = get_size_spec(module, spec['size'])
+            if action == 'extend':
+                tool = module.get_bin_path("lvextend", required=True)
+            else:
+                tool = '%s --force' % module.get_bin_path("lvreduce", required=True)
+            if spec['resizefs']:
+                tool = '%s --resizefs' % tool
+            cmd = "%s %s -%s %s%s %s/%s %s" % (tool, test_opt, size_opt, size, size_unit, vg, spec['lv'], spec['pvs'])
+            rc, out, err = module.run_command(cmd)
+            if "Reached maximum COW size" in out:
+                module.fail_json(msg="Unable to resize %s to %s%s" % (spec['lv'], size, size_unit), rc=rc, err=err, out=out, volumes=results)
+            elif rc == 0:
+                result['msg'] = "Volume %s resized to %s%s" % (spec['lv'], size, size_unit)
+            elif "matches existing size" in err or "not larger than existing size" in err:
+                result['changed'] = False
+            else:
+                module.fail_json(msg="Unable to resize %s to %s%s" % (spec['lv'], size, size_unit), rc=rc, err=err, volumes=results)
+
+        if spec['state'] == 'present':
+            # Newly created volumes are active
+            is_active = this_lv['active'] if this_lv is not None else True
+            if spec['active'] and not is_active:
+                to_activate.append(spec['lv'])
+                result['changed'] = True
+            elif not spec['active'] and is_active:
+                to_deactivate.append(spec['lv'])
+                result['changed'] = True
+
+        results.append(result)
+
+    if not module.check_mode:
+        lvchange_cmd = module.get_bin_path("lvchange", required=True)
+        for flag, names in (('-ay', to_activate), ('-an', to_deactivate)):
+            if names:
+                rc, _, err = module.run_command("%s %s %s" % (lvchange_cmd, flag, ' '.join('%s/%s' % (vg, lv) for lv in names)))
+                if rc != 0:
+                    module.fail_json(msg="Failed to change activation of logical volumes %s" % ', '.join(names), rc=rc, err=err, volumes=results)
+
+    module.exit_json(changed=any(result['changed'] for result in results), volumes=results)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
@@ -265,10 +577,27 @@ def main():
             pvs=dict(type='str'),
             resizefs=dict(type='bool', default=False),
             thinpool=dict(type='str'),
+            volumes=dict(type='list', elements='dict', options=dict(
+                lv=dict(type='str', required=True),
+                size=dict(type='str'),
+                state=dict(type='str', choices=['absent', 'present']),
+                active=dict(type='bool'),
+                force=dict(type='bool'),
+                opts=dict(type='str'),
+                pvs=dict(type='str'),
+                shrink=dict(type='bool'),
+                resizefs=dict(type='bool'),
+            )),
         ),
         supports_check_mode=True,
         required_one_of=(
-            ['lv', 'thinpool'],
+            ['lv', 'thinpool', 'volumes'],
+        ),
+        mutually_exclusive=(
+            ['volumes', 'lv'],
+            ['volumes', 'size'],
+            ['volumes', 'snapshot'],
+            ['volumes', 'thinpool'],
         ),
     )
 
@@ -284,7 +613,18 @@ def main():
     else:
         yesopt = ""
 
+    # Add --test option when running in check-mode
+    if module.check_mode:
+        test_opt = ' --test'
+    else:
+        test_opt = ''
+
     vg = module.params['vg']
+
+    if module.params['volumes']:
+        # JSON report format was added in LVM 2.02.158
+        manage_volumes(module, vg, version_found >= mkversion(2, 2, 158), yesopt, test_opt)
+
     lv = module.params['lv']
     size = module.params['size']
     opts = module.params['opts']
@@ -307,39 +647,8 @@ def main():
     if opts is None:
         opts = ""
 
-    # Add --test option when running in check-mode
-    if module.check_mode:
-        test_opt = ' --test'
-    else:
-        test_opt = ''
-
     if size:
-        # LVCREATE(8) -l --extents option with percentage
-        if '%' in size:
-            size_parts = size.split('%', 1)
-            size_percent = int(size_parts[0])
-            if size_percent > 100:
-                module.fail_json(msg="Size percentage cannot be larger than 100%")
-            size_whole = size_parts[1]
-            if size_whole == 'ORIGIN':
-                module.fail_json(msg="Snapshot Volumes are not supported")
-            elif size_whole not in ['VG', 'PVS', 'FREE']:
-                module.fail_json(msg="Specify extents as a percentage of VG|PVS|FREE")
-            size_opt = 'l'
-            size_unit = ''
-
-        if '%' not in size:
-            # LVCREATE(8) -L --size option unit
-            if size[-1].lower() in 'bskmgtpe':
-                size_unit = size[-1].lower()
-                size = size[0:-1]
-
-            try:
-                float(size)
-                if not size[0].isdigit():
-                    raise ValueError()
-            except ValueError:
-                module.fail_json(msg="Bad size specification of '%s'" % size)
+        (size, size_opt, size_unit, size_percent, size_whole) = get_size_spec(module, size)
 
     # when no unit, megabytes by default
     if size_opt == 'l':
@@ -18,8 +18,8 @@ options:
   target:
     description:
     - Target path (expression).
+    - Exactly one of I(target) and I(entries) is required.
     type: str
-    required: yes
     aliases: [ path ]
   ftype:
     description:
@@ -39,8 +39,45 @@ options:
   setype:
     description:
     - SELinux type for the specified target.
+    - Required when I(target) is used.
     type: str
-    required: yes
+  entries:
+    description:
+    - List of file context mapping definitions, all applied in a single semanage
+      transaction, so that the policy store is loaded and the policy is reloaded only once.
+    - The I(ftype), I(seuser), I(selevel) and I(state) options are used for the entries that do not set them.
+    type: list
+    elements: dict
+    suboptions:
+      target:
+        description:
+        - Target path (expression).
+        type: str
+        required: yes
+      ftype:
+        description:
+        - The file type that should have SELinux contexts applied.
+        type: str
+        choices: [ a, b, c, d, f, l, p, s ]
+      setype:
+        description:
+        - SELinux type for the specified target.
+        - Required when the I(state) of the entry is C(present).
+        type: str
+      seuser:
+        description:
+        - SELinux user for the specified target.
+        type: str
+      selevel:
+        description:
+        - SELinux range for the specified target.
+        type: str
+      state:
+        description:
+        - Whether the SELinux file context must be C(absent) or C(present).
+        type: str
+        choices: [ absent, present ]
+    version_added: 1.0.0
   seuser:
     description:
     - SELinux user for the specified target.
@@ -93,6 +130,16 @@ EXAMPLES = r'''
 
 - name: Apply new SELinux file context to filesystem
   command: restorecon -irv /srv/git_repos
+
+- name: Manage many file contexts in one transaction
+  sefcontext:
+    entries:
+      - target: '/srv/www(/.*)?'
+        setype: httpd_sys_content_t
+      - target: '/srv/www/uploads(/.*)?'
+        setype: httpd_sys_rw_content_t
+      - target: '/srv/old(/.*)?'
+        state: absent
 '''
 
 RETURN = r'''
@@ -150,12 +197,13 @@ def get_runtime_status(ignore_selinux_state=False):
     return True if ignore_selinux_state is True else selinux.is_selinux_enabled()
 
 
-def semanage_fcontext_exists(sefcontext, target, ftype):
+def semanage_fcontext_exists(sefcontext, target, ftype, records=None):
     ''' Get the SELinux file context mapping definition from policy. Return None if it does not exist. '''
 
     # Beware that records comprise of a string representation of the file_type
     record = (target, option_to_file_type_str[ftype])
-    records = sefcontext.get_all()
+    if records is None:
+        records = sefcontext.get_all()
     try:
         return records[record]
     except KeyError:
@@ -245,18 +293,115 @@ def semanage_fcontext_delete(module, result, target, ftype, do_reload, sestore='
     module.exit_json(changed=changed, **result)
 
 
+def semanage_fcontext_entries(module, entries, do_reload, sestore=''):
+    ''' Add, modify and delete many SELinux file context mapping definitions in one transaction. '''
+
+    changed = False
+    prepared_diff = ''
+    result = dict(entries=[])
+
+    try:
+        sefcontext = seobject.fcontextRecords(sestore)
+        sefcontext.set_reload(do_reload)
+        # Load the records once, and keep them up to date with the changes of the entries
+        records = sefcontext.get_all()
+        in_transaction = False
+
+        for entry in entries:
+            target, ftype, setype = entry['target'], entry['ftype'], entry['setype']
+            seuser, serange = entry['seuser'], entry['selevel']
+            record = (target, option_to_file_type_str[ftype])
+            exists = semanage_fcontext_exists(sefcontext, target, ftype, records)
+
+            if entry['state'] == 'absent':
+                action = 'delete' if exists else None
+            elif exists:
+                orig_seuser, orig_serole, orig_setype, orig_serange = exists
+                if seuser is None:
+                    seuser = orig_seuser
+                if serange is None:
+                    serange = orig_serange
+                action = 'modify' if (setype, seuser, serange) != (orig_setype, orig_seuser, orig_serange) else None
+            else:
+                if seuser is None:
+                    seuser = 'system_u'
+                if serange is None:
+                    serange = 's0'
+                action = 'add'
+
+            result['entries'].append(dict(target=target, ftype=ftype, state=entry['state'], changed=action is not None))
+            if action is None:
+                continue
+            changed = True
+
+            if not module.check_mode:
+                if not in_transaction:
+                    sefcontext.start()
+                    in_transaction = True
+                if action == 'delete':
+                    sefcontext.delete(target, ftype)
+                elif action == 'modify':
+                    sefcontext.modify(target, setype, ftype, serange, seuser)
+                else:
+                    sefcontext.add(target, setype, ftype, serange, seuser)
+
+            if action == 'delete':
+                del records[record]
+                if module._diff:
+                    prepared_diff += '# Deletion to semanage file context mappings\n'
+                    prepared_diff += '-%s      %s      %s:%s:%s:%s\n' % (target, ftype, exists[0], exists[1], exists[2], exists[3])
+            elif action == 'modify':
+                records[record] = (seuser, exists[1], setype, serange)
+                if module._diff:
+                    prepared_diff += '# Change to semanage file context mappings\n'
+                    prepared_diff += '-%s      %s      %s:%s:%s:%s\n' % (target, ftype, exists[0], exists[1], exists[2], exists[3])
+                    prepared_diff += '+%s      %s      %s:%s:%s:%s\n' % (target, ftype, seuser, exists[1], setype, serange)
+            else:
+                records[record] = (seuser, 'object_r', setype, serange)
+                if module._diff:
+                    prepared_diff += '# Addition to semanage file context mappings\n'
+                    prepared_diff += '+%s      %s      %s:%s:%s:%s\n' % (target, ftype, seuser, 'object_r', setype, serange)
+
+        # Commit all the changes, and reload the policy once
+        if in_transaction:
+            sefcontext.finish()
+
+    except Exception as e:
+        module.fail_json(msg="%s: %s\n" % (e.__class__.__name__, to_native(e)))
+
+    if module._diff and prepared_diff:
+        result['diff'] = dict(prepared=prepared_diff)
+
+    module.exit_json(changed=changed, **result)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
             ignore_selinux_state=dict(type='bool', default=False),
-            target=dict(type='str', required=True, aliases=['path']),
+            target=dict(type='str', aliases=['path']),
             ftype=dict(type='str', default='a', choices=option_to_file_type_str.keys()),
-            setype=dict(type='str', required=True),
+            setype=dict(type='str'),
+            entries=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    target=dict(type='str', required=True),
+                    ftype=dict(type='str', choices=list(option_to_file_type_str.keys())),
+                    setype=dict(type='str'),
+                    seuser=dict(type='str'),
+                    selevel=dict(type='str'),
+                    state=dict(type='str', choices=['absent', 'present']),
+                ),
+            ),
             seuser=dict(type='str'),
             selevel=dict(type='str', aliases=['serange']),
             state=dict(type='str', default='present', choices=['absent', 'present']),
             reload=dict(type='bool', default=True),
         ),
+        required_one_of=[('target', 'entries')],
+        mutually_exclusive=[('target', 'entries')],
+        required_by=dict(target='setype'),
         supports_check_mode=True,
     )
     if not HAVE_SELINUX:
@@ -270,6 +415,18 @@ def main():
     if not get_runtime_status(ignore_selinux_state):
         module.fail_json(msg="SELinux is disabled on this host.")
 
+    if module.params['entries'] is not None:
+        entries = []
+        for entry in module.params['entries']:
+            entry = dict(entry)
+            for option in ('ftype', 'seuser', 'selevel', 'state'):
+                if entry[option] is None:
+                    entry[option] = module.params[option]
+            if entry['state'] == 'present' and entry['setype'] is None:
+                module.fail_json(msg='setype is required for the present entry of target %s' % entry['target'])
+            entries.append(entry)
+        semanage_fcontext_entries(module, entries, module.params['reload'])
+
     target = module.params['target']
     ftype = module.params['ftype']
     setype = module.params['setype']
@@ -18,19 +18,50 @@ options:
     description:
       - Ports or port ranges.
       - Can be a list (since 2.6) or comma separated string.
+      - Exactly one of I(ports) and I(entries) is required.
     type: list
-    required: true
   proto:
     description:
       - Protocol for the specified port.
+      - Required when I(ports) is used.
     type: str
-    required: true
     choices: [ tcp, udp ]
   setype:
     description:
       - SELinux type for the specified port.
+      - Required when I(ports) is used.
     type: str
-    required: true
+  entries:
+    description:
+      - List of port type definitions, all applied in a single semanage transaction,
+        so that the policy store is loaded and the policy is reloaded only once.
+      - The I(state) option is used for the entries that do not set it.
+    type: list
+    elements: dict
+    suboptions:
+      ports:
+        description:
+          - Ports or port ranges.
+        type: list
+        elements: str
+        required: true
+      proto:
+        description:
+          - Protocol for the specified ports.
+        type: str
+        required: true
+        choices: [ tcp, udp ]
+      setype:
+        description:
+          - SELinux type for the specified ports.
+        type: str
+        required: true
+      state:
+        description:
+          - Desired state of the port type definitions.
+        type: str
+        choices: [ absent, present ]
+    version_added: 1.0.0
   state:
     description:
       - Desired boolean value.
@@ -49,6 +80,7 @@ options:
     default: no
 notes:
    - The changes are persistent across reboots.
+   - All the changes of a task are committed in a single semanage transaction.
    - Not tested on any debian based system.
 requirements:
 - libselinux-python
@@ -87,6 +119,20 @@ EXAMPLES = r'''
     proto: tcp
     setype: memcache_port_t
     state: present
+
+- name: Manage the ports of many types in one transaction
+  seport:
+    entries:
+      - ports: [8888, 8889]
+        proto: tcp
+        setype: http_port_t
+      - ports: [8991]
+        proto: tcp
+        setype: ssh_port_t
+      - ports: [10112]
+        proto: tcp
+        setype: memcache_port_t
+        state: absent
 '''
 
 import traceback
@@ -136,7 +182,26 @@ def semanage_port_get_ports(seport, setype, proto):
         return []
 
 
-def semanage_port_get_type(seport, port, proto):
+def semanage_port_get_key(port, proto):
+    """ Get the key of the specified port in the port records.
+
+    :type port: str
+    :param port: Port or port range (example: "8080", "8080-9090")
+
+    :type proto: str
+    :param proto: Protocol ('tcp' or 'udp')
+
+    :rtype: tuple
+    :return: Tuple containing the low port, the high port and the protocol.
+    """
+    ports = str(port).split('-', 1)
+    if len(ports) == 1:
+        ports.extend(ports)
+
+    return (int(ports[0]), int(ports[1]), proto)
+
+
+def semanage_port_get_type(seport, port, proto, records=None):
     """ Get the SELinux type of the specified port.
 
     :param seport: Instance of seobject.portRecords
@@ -147,39 +212,30 @@ def semanage_port_get_type(seport, port, proto):
     :type proto: str
     :param proto: Protocol ('tcp' or 'udp')
 
+    :type records: dict
+    :param records: Port records already loaded with seport.get_all()
+
     :rtype: tuple
     :return: Tuple containing the SELinux type and MLS/MCS level, or None if not found.
     """
-    if isinstance(port, str):
-        ports = port.split('-', 1)
-        if len(ports) == 1:
-            ports.extend(ports)
-    else:
-        ports = (port, port)
+    key = semanage_port_get_key(port, proto)
 
-    key = (int(ports[0]), int(ports[1]), proto)
-
-    records = seport.get_all()
+    if records is None:
+        records = seport.get_all()
     if key in records:
         return records[key]
     else:
         return None
 
 
-def semanage_port_add(module, ports, proto, setype, do_reload, serange='s0', sestore=''):
-    """ Add SELinux port type definition to the policy.
+def semanage_port_entries(module, entries, do_reload, serange='s0', sestore=''):
+    """ Add, modify and delete many SELinux port type definitions in one transaction.
 
     :type module: AnsibleModule
     :param module: Ansible module
 
-    :type ports: list
-    :param ports: List of ports and port ranges to add (e.g. ["8080", "8080-9090"])
-
-    :type proto: str
-    :param proto: Protocol ('tcp' or 'udp')
-
-    :type setype: str
-    :param setype: SELinux type
+    :type entries: list
+    :param entries: List of dicts with the ports, proto, setype and state of the definitions
 
     :type do_reload: bool
     :param do_reload: Whether to reload SELinux policy after commit
@@ -197,15 +253,42 @@ def semanage_port_add(module, ports, proto, setype, do_reload, serange='s0', ses
         seport = seobject.portRecords(sestore)
         seport.set_reload(do_reload)
         change = False
-        ports_by_type = semanage_port_get_ports(seport, setype, proto)
-        for port in ports:
-            if port not in ports_by_type:
+        in_transaction = False
+        # Load the records once, and keep them up to date with the changes of the entries
+        records = seport.get_all()
+        for entry in entries:
+            proto = entry['proto']
+            setype = entry['setype']
+            for port in entry['ports']:
+                key = semanage_port_get_key(port, proto)
+                port_type = semanage_port_get_type(seport, port, proto, records)
+                if entry['state'] == 'present' and (port_type is None or port_type[0] != setype):
+                    action = 'add' if port_type is None else 'modify'
+                elif entry['state'] == 'absent' and port_type is not None and port_type[0] == setype:
+                    action = 'delete'
+                else:
+                    continue
+
                 change = True
-                port_type = semanage_port_get_type(seport, port, proto)
-                if port_type is None and not module.check_mode:
-                    seport.add(port, proto, serange, setype)
-                elif port_type is not None and not module.check_mode:
-                    seport.modify(port, proto, serange, setype)
+                if not module.check_mode:
+                    if not in_transaction:
+                        seport.start()
+                        in_transaction = True
+                    if action == 'add':
+                        seport.add(port, proto, serange, setype)
+                    elif action == 'modify':
+                        seport.modify(port, proto, serange, setype)
+                    else:
+                        seport.delete(port, proto)
+
+                if action == 'delete':
+                    del records[key]
+                else:
+                    records[key] = (setype, serange)
+
+        # Commit all the changes, and reload the policy once
+        if in_transaction:
+            seport.finish()
 
     except (ValueError, IOError, KeyError, OSError, RuntimeError) as e:
         module.fail_json(msg="%s: %s\n" % (e.__class__.__name__, to_native(e)), exception=traceback.format_exc())
@@ -213,6 +296,37 @@ def semanage_port_add(module, ports, proto, setype, do_reload, serange='s0', ses
     return change
 
 
+def semanage_port_add(module, ports, proto, setype, do_reload, serange='s0', sestore=''):
+    """ Add SELinux port type definition to the policy.
+
+    :type module: AnsibleModule
+    :param module: Ansible module
+
+    :type ports: list
+    :param ports: List of ports and port ranges to add (e.g. ["8080", "8080-9090"])
+
+    :type proto: str
+    :param proto: Protocol ('tcp' or 'udp')
+
+    :type setype: str
+    :param setype: SELinux type
+
+    :type do_reload: bool
+    :param do_reload: Whether to reload SELinux policy after commit
+
+    :type serange: str
+    :param serange: SELinux MLS/MCS range (defaults to 's0')
+
+    :type sestore: str
+    :param sestore: SELinux store
+
+    :rtype: bool
+    :return: True if the policy was changed, otherwise False
+    """
+    entry = dict(ports=ports, proto=proto, setype=setype, state='present')
+    return semanage_port_entries(module, [entry], do_reload, serange, sestore)
+
+
 def semanage_port_del(module, ports, proto, setype, do_reload, sestore=''):
     """ Delete SELinux port type definition from the policy.
 
@@ -237,33 +351,33 @@ def semanage_port_del(module, ports, proto, setype, do_reload, sestore=''):
     :rtype: bool
     :return: True if the policy was changed, otherwise False
     """
-    try:
-        seport = seobject.portRecords(sestore)
-        seport.set_reload(do_reload)
-        change = False
-        ports_by_type = semanage_port_get_ports(seport, setype, proto)
-        for port in ports:
-            if port in ports_by_type:
-                change = True
-                if not module.check_mode:
-                    seport.delete(port, proto)
-
-    except (ValueError, IOError, KeyError, OSError, RuntimeError) as e:
-        module.fail_json(msg="%s: %s\n" % (e.__class__.__name__, to_native(e)), exception=traceback.format_exc())
-
-    return change
+    entry = dict(ports=ports, proto=proto, setype=setype, state='absent')
+    return semanage_port_entries(module, [entry], do_reload, sestore=sestore)
 
 
 def main():
     module = AnsibleModule(
         argument_spec=dict(
             ignore_selinux_state=dict(type='bool', default=False),
-            ports=dict(type='list', required=True),
-            proto=dict(type='str', required=True, choices=['tcp', 'udp']),
-            setype=dict(type='str', required=True),
+            ports=dict(type='list'),
+            proto=dict(type='str', choices=['tcp', 'udp']),
+            setype=dict(type='str'),
+            entries=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    ports=dict(type='list', elements='str', required=True),
+                    proto=dict(type='str', required=True, choices=['tcp', 'udp']),
+                    setype=dict(type='str', required=True),
+                    state=dict(type='str', choices=['absent', 'present']),
+                ),
+            ),
             state=dict(type='str', default='present', choices=['absent', 'present']),
             reload=dict(type='bool', default=True),
         ),
+        required_one_of=[('ports', 'entries')],
+        mutually_exclusive=[('ports', 'entries')],
+        required_by=dict(ports=('proto', 'setype')),
         supports_check_mode=True,
     )
 
@@ -278,6 +392,16 @@ def main():
     if not get_runtime_status(ignore_selinux_state):
         module.fail_json(msg="SELinux is disabled on this host.")
 
+    if module.params['entries'] is not None:
+        entries = []
+        for entry in module.params['entries']:
+            entry = dict(entry)
+            if entry['state'] is None:
+                entry['state'] = module.params['state']
+            entries.append(entry)
+        changed = semanage_port_entries(module, entries, module.params['reload'])
+        module.exit_json(changed=changed, entries=entries)
+
     ports = module.params['ports']
     proto = module.params['proto']
     setype = module.params['setype']
@@ -51,6 +51,39 @@ options:
       - Validate ssl/tls certificates.
     type: bool
     default: 'yes'
+  members:
+    description:
+      - List of changes to apply to members of the balancers of I(balancer_vhost), instead of I(member_host) and I(state).
+      - The balancer-manager page is fetched once, and the changes are sent over a single kept-alive connection.
+    type: list
+    elements: dict
+    suboptions:
+      host:
+        description:
+          - (ipv4|ipv6|fqdn) of the balancer member, see I(member_host).
+        type: str
+        required: true
+      balancer:
+        description:
+          - Name of the balancer of the member, for instance C(mycluster) for C(balancer://mycluster).
+          - By default the member is changed in all the balancers it belongs to.
+        type: str
+      state:
+        description:
+          - Desired state of the member, see I(state).
+        type: str
+      weight:
+        description:
+          - Load factor of the member.
+        type: int
+    version_added: 1.0.0
+  drain_timeout:
+    description:
+      - With I(members), the maximum time in seconds to wait for the members set to C(drained) to have no busy connection.
+      - The members are polled concurrently. C(0) does not wait.
+    type: int
+    default: 0
+    version_added: 1.0.0
 '''
 
 EXAMPLES = '''
@@ -98,6 +131,21 @@ EXAMPLES = '''
     member_host: '{{ member.host }}'
     state: absent
   delegate_to: myloadbalancernode
+
+- name: Drain two members, waiting for their connections to end, and change the weight of another one
+  apache2_mod_proxy:
+    balancer_vhost: '{{ vhost_host }}'
+    members:
+      - host: node1.myws.mydomain.org
+        state: drained
+      - host: node2.myws.mydomain.org
+        balancer: mywsbalancer
+        state: drained
+      - host: node3.myws.mydomain.org
+        state: present
+        weight: 2
+    drain_timeout: 300
+  delegate_to: myloadbalancernode
 '''
 
 RETURN = '''
@@ -133,7 +181,9 @@ member:
         }
       }
 members:
-    description: list of member (defined above) dictionaries, returned when apache2_mod_proxy is invoked with no member_host and state args.
+    description:
+      - list of member (defined above) dictionaries, returned when apache2_mod_proxy is invoked with no member_host and state args.
+      - With the I(members) option, the members which have been changed, after the changes.
     returned: success
     type: list
     sample:
@@ -192,7 +242,10 @@ members:
 '''
 
 import re
+import socket
+import time
 import traceback
+from multiprocessing.pool import ThreadPool
 
 BEAUTIFUL_SOUP_IMP_ERR = None
 try:
@@ -207,6 +260,10 @@ else:
 EXPRESSION = r"(b=([\w\.\-]+)&w=(https?|ajp|wss?|ftp|[sf]cgi)://([\w\.\-]+):?(\d*)([/\w\.\-]*)&?[\w\-\=]*)"
 # Apache2 server version extraction regexp:
 APACHE_VERSION_EXPRESSION = r"SERVER VERSION: APACHE/([\d.]+)"
+# Maximum number of members polled at the same time while waiting for drains
+DRAIN_POLL_CONCURRENCY = 10
+# Interval in seconds between two polls of a draining member
+DRAIN_POLL_INTERVAL = 1
 
 
 def regexp_extraction(string, _regexp, groups=1):
@@ -218,6 +275,44 @@ def regexp_extraction(string, _regexp, groups=1):
     return None
 
 
+def parse_member_page(page, host):
+    """ Returns the attributes of the member host from its balancer member page, or None if they are not in the page."""
+    soup = BeautifulSoup(page)
+    subsoup = soup.findAll('table')[1].findAll('tr')
+    keys = subsoup[0].findAll('th')
+    for valuesset in subsoup[1::1]:
+        if re.search(pattern=host, string=str(valuesset)):
+            values = valuesset.findAll('td')
+            return dict((keys[x].string, values[x].string) for x in range(0, len(keys)))
+    return None
+
+
+def member_status_from_states(states):
+    """ Returns the status dictionary of a member matching a list of states."""
+    member_status = {'disabled': False, 'drained': False, 'hot_standby': False, 'ignore_errors': False}
+    for mode in member_status.keys():
+        for state in states:
+            if mode == state:
+                member_status[mode] = True
+            elif mode == 'disabled' and state == 'absent':
+                member_status[mode] = True
+    return member_status
+
+
+def check_states(module, state):
+    """ Returns the list of states of a comma separated state, failing if they are not valid."""
+    states = state.split(',')
+    if (len(states) > 1) and (("present" in states) or ("enabled" in states)):
+        module.fail_json(msg="state present/enabled is mutually exclusive with other states!")
+    else:
+        for _state in states:
+            if _state not in ['present', 'absent', 'enabled', 'disabled', 'drained', 'hot_standby', 'ignore_errors']:
+                module.fail_json(
+                    msg="State can only take values amongst 'present', 'absent', 'enabled', 'disabled', 'drained', 'hot_standby', 'ignore_errors'."
+                )
+    return states
+
+
 class BalancerMember(object):
     """ Apache 2.4 mod_proxy LB balancer member.
     attributes:
@@ -234,34 +329,38 @@ class BalancerMember(object):
             status -> status of the member (dictionary)
     """
 
-    def __init__(self, management_url, balancer_url, module):
+    def __init__(self, management_url, balancer_url, module, attributes=None, balancer=None):
         self.host = regexp_extraction(management_url, str(EXPRESSION), 4)
         self.management_url = str(management_url)
         self.protocol = regexp_extraction(management_url, EXPRESSION, 3)
         self.port = regexp_extraction(management_url, EXPRESSION, 5)
         self.path = regexp_extraction(management_url, EXPRESSION, 6)
+        self.balancer_name = regexp_extraction(management_url, EXPRESSION, 2)
         self.balancer_url = str(balancer_url)
         self.module = module
+        # Attributes parsed from the balancer page, the member page is only fetched without them
+        self._attributes = attributes
+        self.balancer = balancer
 
     def get_member_attributes(self):
         """ Returns a dictionary of a balancer member's attributes."""
+        if self._attributes is not None:
+            return self._attributes
 
-        balancer_member_page = fetch_url(self.module, self.management_url)
+        if self.balancer is not None:
+            status, content = self.balancer.request(self.management_url)
+        else:
+            response, info = fetch_url(self.module, self.management_url)
+            status, content = info['status'], response
 
-        if balancer_member_page[1]['status'] != 200:
-            self.module.fail_json(msg="Could not get balancer_member_page, check for connectivity! " + balancer_member_page[1])
+        if status != 200:
+            self.module.fail_json(msg="Could not get balancer_member_page, check for connectivity! " + str(status))
         else:
             try:
-                soup = BeautifulSoup(balancer_member_page[0])
+                self._attributes = parse_member_page(content, self.host)
+                return self._attributes
             except TypeError:
-                self.module.fail_json(msg="Cannot parse balancer_member_page HTML! " + str(soup))
-            else:
-                subsoup = soup.findAll('table')[1].findAll('tr')
-                keys = subsoup[0].findAll('th')
-                for valuesset in subsoup[1::1]:
-                    if re.search(pattern=self.host, string=str(valuesset)):
-                        values = valuesset.findAll('td')
-                        return dict((keys[x].string, values[x].string) for x in range(0, len(keys)))
+                self.module.fail_json(msg="Cannot parse balancer_member_page HTML! " + str(content))
 
     def get_member_status(self):
         """ Returns a dictionary of a balancer member's status attributes."""
@@ -292,9 +391,52 @@ class BalancerMember(object):
             else:
                 request_body = request_body + str(values_mapping[k]) + '=0'
 
-        response = fetch_url(self.module, self.management_url, data=str(request_body))
-        if response[1]['status'] != 200:
-            self.module.fail_json(msg="Could not set the member status! " + self.host + " " + response[1]['status'])
+        self._post(request_body, "Could not set the member status! ")
+
+    def set_member_weight(self, weight):
+        """ Sets a balancer member's load factor."""
+        request_body = regexp_extraction(self.management_url, EXPRESSION, 1) + '&w_lf=' + str(weight)
+        self._post(request_body, "Could not set the member weight! ")
+
+    def _post(self, request_body, error_msg):
+        if self.balancer is not None:
+            status = self.balancer.request(self.management_url, data=str(request_body))[0]
+        else:
+            status = fetch_url(self.module, self.management_url, data=str(request_body))[1]['status']
+        if status != 200:
+            self.module.fail_json(msg=error_msg + self.host + " " + str(status))
+        # The attributes changed, they are fetched again when needed
+        self._attributes = None
+
+    def wait_drained(self, timeout):
+        """ Polls the member page until the member has no busy connection, returns an error message or None.
+        It does not fail the module, so that it can run in a thread."""
+        deadline = time.time() + timeout
+        while True:
+            response, info = fetch_url(self.module, self.management_url)
+            if info['status'] == 200:
+                try:
+                    attributes = parse_member_page(response.read(), self.host)
+                except (TypeError, IndexError) as e:
+                    return "Cannot parse balancer_member_page HTML of %s: %s" % (self.host, str(e))
+                if attributes is not None and str(attributes.get('Busy')).strip() == '0':
+                    return None
+            if time.time() >= deadline:
+                return "Timeout waiting for %s to be drained" % self.host
+            time.sleep(DRAIN_POLL_INTERVAL)
+
+    def to_dict(self):
+        """ Returns the JSON output of the member."""
+        return {
+            "host": self.host,
+            "status": self.status,
+            "protocol": self.protocol,
+            "port": self.port,
+            "path": self.path,
+            "attributes": self.attributes,
+            "management_url": self.management_url,
+            "balancer_url": self.balancer_url
+        }
 
     attributes = property(get_member_attributes)
     status = property(get_member_status, set_member_status)
@@ -311,17 +453,31 @@ class Balancer(object):
             self.base_url = str(str('http://') + str(host))
             self.url = str(str('http://') + str(host) + str(suffix))
         self.module = module
+        self.host = host
+        # All the requests share a kept-alive connection to the balancer vhost when possible
+        self.client = KeepAliveClient(self.base_url, validate_certs=module.params['validate_certs'])
         self.page = self.fetch_balancer_page()
+        self._member_table = None
         if members is None:
             self._members = []
 
+    def request(self, url, data=None):
+        """ Returns the HTTP status and the body of a GET of url, or of a POST of data to url."""
+        try:
+            response = self.client.open(url, method='GET' if data is None else 'POST', data=data)
+            return response.getcode(), response.read()
+        except HTTPError as e:
+            return e.code, e.read()
+        except (URLError, SSLValidationError, ConnectionError, socket.error, http_client.HTTPException) as e:
+            self.module.fail_json(msg="Could not connect to the balancer %s: %s" % (self.host, to_native(e)))
+
     def fetch_balancer_page(self):
         """ Returns the balancer management html page as a string for later parsing."""
-        page = fetch_url(self.module, str(self.url))
-        if page[1]['status'] != 200:
-            self.module.fail_json(msg="Could not get balancer page! HTTP status response: " + str(page[1]['status']))
+        status, content = self.request(str(self.url))
+        if status != 200:
+            self.module.fail_json(msg="Could not get balancer page! HTTP status response: " + str(status))
         else:
-            content = page[0].read()
+            content = to_text(content, errors='surrogate_or_strict')
             apache_version = regexp_extraction(content.upper(), APACHE_VERSION_EXPRESSION, 1)
             if apache_version:
                 if not re.search(pattern=r"2\.4\.[\d]*", string=apache_version):
@@ -330,6 +486,33 @@ class Balancer(object):
             else:
                 self.module.fail_json(msg="Could not get the Apache server version from the balancer-manager")
 
+    def get_member_table(self):
+        """ Returns a dictionary of the attributes of the members listed in the balancer page, indexed by management url.
+        The page is parsed only once."""
+        if self._member_table is None:
+            self._member_table = {}
+            try:
+                soup = BeautifulSoup(self.page)
+            except TypeError:
+                self.module.fail_json(msg="Cannot parse balancer page HTML! " + str(self.page))
+            for table in soup.findAll('table'):
+                keys = [key.string for key in table.findAll('th')]
+                if 'Worker URL' not in keys:
+                    continue
+                for valuesset in table.findAll('tr')[1::1]:
+                    link = valuesset.find('a')
+                    values = valuesset.findAll('td')
+                    if link is None or len(values) != len(keys):
+                        continue
+                    management_url = str(self.base_url + str(link.get('href')))
+                    self._member_table[management_url] = dict((keys[x], values[x].string) for x in range(0, len(keys)))
+        return self._member_table
+
+    def refresh(self):
+        """ Fetches the balancer page again, after changes."""
+        self.page = self.fetch_balancer_page()
+        self._member_table = None
+
     def get_balancer_members(self):
         """ Returns members of the balancer as a generator object for later iteration."""
         try:
@@ -337,16 +520,82 @@ class Balancer(object):
         except TypeError:
             self.module.fail_json(msg="Cannot parse balancer page HTML! " + str(self.page))
         else:
+            member_table = self.get_member_table()
             for element in soup.findAll('a')[1::1]:
                 balancer_member_suffix = str(element.get('href'))
                 if not balancer_member_suffix:
                     self.module.fail_json(msg="Argument 'balancer_member_suffix' is empty!")
+                elif regexp_extraction(balancer_member_suffix, EXPRESSION, 4) is None:
+                    # Link to another balancer of the page
+                    continue
                 else:
-                    yield BalancerMember(str(self.base_url + balancer_member_suffix), str(self.url), self.module)
+                    management_url = str(self.base_url + balancer_member_suffix)
+                    yield BalancerMember(management_url, str(self.url), self.module,
+                                         attributes=member_table.get(management_url), balancer=self)
 
     members = property(get_balancer_members)
 
 
+def apply_member_changes(module, balancer, items):
+    """ Applies the changes of items to the members of the balancer, and waits for the drained members.
+    Returns whether something changed and the list of the changed members."""
+    # Index the members by balancer name and host
+    index = {}
+    for member in balancer.members:
+        if member.host is not None:
+            index.setdefault((member.balancer_name, member.host), member)
+
+    changed_members = []
+    to_drain = []
+    for item in items:
+        members = [member for (name, host), member in index.items()
+                   if host == item['host'] and item['balancer'] in (None, name)]
+        if not members:
+            module.fail_json(msg=str(item['host']) + ' is not a member of the balancer ' + str(module.params['balancer_vhost']) + '!')
+
+        for member in members:
+            member_changed = False
+            if item['state'] is not None:
+                member_status = member_status_from_states(check_states(module, item['state']))
+                if member.status != member_status:
+                    member_changed = True
+                    if not module.check_mode:
+                        member.status = member_status
+                if member_status['drained']:
+                    to_drain.append(member)
+            if item['weight'] is not None:
+                try:
+                    weight_changed = float(member.attributes['Factor']) != item['weight']
+                except (KeyError, TypeError, ValueError):
+                    weight_changed = True
+                if weight_changed:
+                    member_changed = True
+                    if not module.check_mode:
+                        member.set_member_weight(item['weight'])
+            if member_changed and member not in changed_members:
+                changed_members.append(member)
+
+    if to_drain and module.params['drain_timeout'] > 0 and not module.check_mode:
+        pool = ThreadPool(min(DRAIN_POLL_CONCURRENCY, len(to_drain)))
+        try:
+            errors = [error for error in pool.map(lambda member: member.wait_drained(module.params['drain_timeout']), to_drain)
+                      if error is not None]
+        finally:
+            pool.close()
+            pool.join()
+        if errors:
+            module.fail_json(msg='; '.join(errors), changed=bool(changed_members))
+
+    if changed_members and not module.check_mode:
+        # Fetch the balancer page once to output the members after the changes
+        balancer.refresh()
+        member_table = balancer.get_member_table()
+        for member in changed_members:
+            member._attributes = member_table.get(member.management_url)
+
+    return bool(changed_members), [member.to_dict() for member in changed_members]
+
+
 def main():
     """ Initiates module."""
     module = AnsibleModule(
@@ -356,8 +605,16 @@ def main():
             member_host=dict(type='str'),
             state=dict(type='str'),
             tls=dict(default=False, type='bool'),
-            validate_certs=dict(default=True, type='bool')
+            validate_certs=dict(default=True, type='bool'),
+            members=dict(type='list', elements='dict', options=dict(
+                host=dict(type='str', required=True),
+                balancer=dict(type='str'),
+                state=dict(type='str'),
+                weight=dict(type='int'),
+            )),
+            drain_timeout=dict(default=0, type='int'),
         ),
+        mutually_exclusive=[('members', 'member_host'), ('members', 'state')],
         supports_check_mode=True
     )
 
@@ -365,15 +622,7 @@ def main():
         module.fail_json(msg=missing_required_lib('BeautifulSoup'), exception=BEAUTIFUL_SOUP_IMP_ERR)
 
     if module.params['state'] is not None:
-        states = module.params['state'].split(',')
-        if (len(states) > 1) and (("present" in states) or ("enabled" in states)):
-            module.fail_json(msg="state present/enabled is mutually exclusive with other states!")
-        else:
-            for _state in states:
-                if _state not in ['present', 'absent', 'enabled', 'disabled', 'drained', 'hot_standby', 'ignore_errors']:
-                    module.fail_json(
-                        msg="State can only take values amongst 'present', 'absent', 'enabled', 'disabled', 'drained', 'hot_standby', 'ignore_errors'."
-                    )
+        states = check_states(module, module.params['state'])
     else:
         states = ['None']
 
@@ -382,19 +631,16 @@ def main():
                           module=module,
                           tls=module.params['tls'])
 
-    if module.params['member_host'] is None:
+    if module.params['members'] is not None:
+        changed, json_output_list = apply_member_changes(module, mybalancer, module.params['members'])
+        module.exit_json(
+            changed=changed,
+            members=json_output_list
+        )
+    elif module.params['member_host'] is None:
         json_output_list = []
         for member in mybalancer.members:
-            json_output_list.append({
-                "host": member.host,
-                "status": member.status,
-                "protocol": member.protocol,
-                "port": member.port,
-                "path": member.path,
-                "attributes": member.attributes,
-                "management_url": member.management_url,
-                "balancer_url": member.balancer_url
-            })
+            json_output_list.append(member.to_dict())
         module.exit_json(
             changed=False,
             members=json_output_list
@@ -402,13 +648,7 @@ def main():
     else:
         changed = False
         member_exists = False
-        member_status = {'disabled': False, 'drained': False, 'hot_standby': False, 'ignore_errors': False}
-        for mode in member_status.keys():
-            for state in states:
-                if mode == state:
-                    member_status[mode] = True
-                elif mode == 'disabled' and state == 'absent':
-                    member_status[mode] = True
+        member_status = member_status_from_states(states)
 
         for member in mybalancer.members:
             if str(member.host) == str(module.params['member_host']):
@@ -421,16 +661,7 @@ def main():
                         member_status_after = member_status
                     if member_status_before != member_status_after:
                         changed = True
-                json_output = {
-                    "host": member.host,
-                    "status": member.status,
-                    "protocol": member.protocol,
-                    "port": member.port,
-                    "path": member.path,
-                    "attributes": member.attributes,
-                    "management_url": member.management_url,
-                    "balancer_url": member.balancer_url
-                }
+                json_output = member.to_dict()
         if member_exists:
             module.exit_json(
                 changed=changed,
@@ -441,6 +672,10 @@ def main():
 
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-from ansible.module_utils.urls import fetch_url
+from ansible.module_utils._text import to_native, to_text
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils.urls import fetch_url, ConnectionError, SSLValidationError
+from ansible_collections.community.general.plugins.module_utils.keep_alive import KeepAliveClient
 if __name__ == '__main__':
     main()
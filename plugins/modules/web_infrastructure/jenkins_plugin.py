@@ -32,7 +32,35 @@ options:
   name:
     description:
       - Plugin name.
-    required: yes
+      - Exactly one of I(name) and I(names) is required.
+  names:
+    description:
+      - List of plugin names, installed in a single task.
+      - The update center is parsed once into a compact index cached on the
+        disk for I(updates_expiration) seconds, the missing dependencies are
+        resolved from it, and all the plugin files are downloaded concurrently
+        and verified with their SHA-256 checksum.
+      - Only the C(present) and C(latest) states are supported. With C(latest),
+        the installed plugins of the list are updated when their checksum differs
+        from the latest version.
+      - Installed dependencies older than the version required by a plugin are
+        updated as well.
+    type: list
+    elements: str
+    version_added: 1.0.0
+  concurrency:
+    description:
+      - Maximum number of plugin files downloaded at the same time with I(names).
+    type: int
+    default: 4
+    version_added: 1.0.0
+  safe_restart:
+    description:
+      - Safely restart Jenkins once, after all the running builds are finished,
+        when a plugin was installed or updated.
+    type: bool
+    default: no
+    version_added: 1.0.0
   owner:
     description:
       - Name of the Jenkins user on the OS.
@@ -53,6 +81,8 @@ options:
       - Number of seconds after which a new copy of the I(update-center.json)
         file is downloaded. This is used to avoid the need to download the
         plugin to calculate its checksum when C(latest) is specified.
+      - With I(names), the update center is always needed to resolve the
+        dependencies, so it is downloaded by every task when this is C(0).
       - Set it to C(0) if no cache file should be used. In that case, the
         plugin file will always be downloaded to calculate its checksum when
         C(latest) is specified.
@@ -106,6 +136,14 @@ EXAMPLES = '''
   jenkins_plugin:
     name: build-pipeline-plugin
 
+- name: Install many plugins and their dependencies, then restart Jenkins once
+  jenkins_plugin:
+    names:
+      - build-pipeline-plugin
+      - token-macro
+      - git
+    safe_restart: yes
+
 - name: Install plugin without its dependencies
   jenkins_plugin:
     name: build-pipeline-plugin
@@ -256,6 +294,11 @@ state:
     returned: success
     type: str
     sample: "present"
+plugins:
+    description: plugins installed or updated, including dependencies, when I(names) is used
+    returned: success
+    type: list
+    sample: ["token-macro", "build-pipeline-plugin"]
 '''
 
 from ansible.module_utils.basic import AnsibleModule, to_bytes
@@ -264,6 +307,9 @@ from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.urls import fetch_url, url_argument_spec
 from ansible.module_utils.six import text_type, binary_type
 from ansible.module_utils._text import to_native
+from collections import OrderedDict
+from distutils.version import LooseVersion
+from multiprocessing.pool import ThreadPool
 import base64
 import hashlib
 import json
@@ -272,6 +318,12 @@ import tempfile
 import time
 
 
+# Size of the chunks read when streaming plugin files
+CHUNK_SIZE = 64 * 1024
+# Fields of the update center kept in the compact index
+UPDATES_INDEX_FIELDS = ('version', 'url', 'sha1', 'sha256')
+
+
 class JenkinsPlugin(object):
     def __init__(self, module):
         # To be able to call fail_json
@@ -282,6 +334,9 @@ class JenkinsPlugin(object):
         self.url = self.params['url']
         self.timeout = self.params['timeout']
 
+        # Compact update center index, loaded on first use
+        self.updates_index = None
+
         # Crumb
         self.crumb = {}
         # Cookie jar for crumb session
@@ -370,6 +425,8 @@ class JenkinsPlugin(object):
         self.is_installed = False
         self.is_pinned = False
         self.is_enabled = False
+        self.installed_plugins = dict(
+            (p['shortName'], p) for p in plugins_data['plugins'])
 
         for p in plugins_data['plugins']:
             if p['shortName'] == self.params['name']:
@@ -432,9 +489,7 @@ class JenkinsPlugin(object):
             md5sum_old = None
             if os.path.isfile(plugin_file):
                 # Make the checksum of the currently installed plugin
-                with open(plugin_file, 'rb') as md5_plugin_fh:
-                    md5_plugin_content = md5_plugin_fh.read()
-                md5sum_old = hashlib.md5(md5_plugin_content).hexdigest()
+                md5sum_old = self._file_digest(plugin_file, 'md5').hexdigest()
 
             if self.params['version'] in [None, 'latest']:
                 # Take latest version
@@ -457,37 +512,27 @@ class JenkinsPlugin(object):
                     md5sum_old is None):
 
                 # Download the plugin file directly
-                r = self._download_plugin(plugin_url)
+                try:
+                    tmp_f, digests = self._download_to_temp(plugin_url)
+                except Exception as e:
+                    self.module.fail_json(
+                        msg="Plugin download failed.", details=to_native(e))
 
                 # Write downloaded plugin into file if checksums don't match
-                if md5sum_old is None:
-                    # No previously installed plugin
+                if md5sum_old is None or md5sum_old != digests['md5'].hexdigest():
                     if not self.module.check_mode:
-                        self._write_file(plugin_file, r)
+                        self.module.atomic_move(tmp_f, plugin_file)
 
                     changed = True
-                else:
-                    # Get data for the MD5
-                    data = r.read()
 
-                    # Make new checksum
-                    md5sum_new = hashlib.md5(data).hexdigest()
-
-                    # If the checksum is different from the currently installed
-                    # plugin, store the new plugin
-                    if md5sum_old != md5sum_new:
-                        if not self.module.check_mode:
-                            self._write_file(plugin_file, data)
-
-                        changed = True
+                if os.path.exists(tmp_f):
+                    os.remove(tmp_f)
             elif self.params['version'] == 'latest':
                 # Check for update from the updates JSON file
                 plugin_data = self._download_updates()
 
                 try:
-                    with open(plugin_file, 'rb') as sha1_plugin_fh:
-                        sha1_plugin_content = sha1_plugin_fh.read()
-                    sha1_old = hashlib.sha1(sha1_plugin_content)
+                    sha1_old = self._file_digest(plugin_file, 'sha1')
                 except Exception as e:
                     self.module.fail_json(
                         msg="Cannot calculate SHA1 of the old plugin.",
@@ -522,69 +567,81 @@ class JenkinsPlugin(object):
         return changed
 
     def _download_updates(self):
-        updates_filename = 'jenkins-plugin-cache.json'
-        updates_dir = os.path.expanduser('~/.ansible/tmp')
-        updates_file = "%s/%s" % (updates_dir, updates_filename)
-        download_updates = True
+        index = self._get_updates_index()
 
-        # Check if we need to download new updates file
-        if os.path.isfile(updates_file):
-            # Get timestamp when the file was changed last time
-            ts_file = os.stat(updates_file).st_mtime
-            ts_now = time.time()
+        # Check if we have the plugin data available
+        if self.params['name'] not in index:
+            self.module.fail_json(
+                msg="Cannot find plugin data in the updates file.")
 
-            if ts_now - ts_file < self.params['updates_expiration']:
-                download_updates = False
+        return index[self.params['name']]
 
-        updates_file_orig = updates_file
+    def _get_updates_index(self):
+        """
+        Compact index of the update center, with the version, URL, checksums
+        and dependencies of every plugin. It is built only when a new copy of
+        the update-center.json file is downloaded, and cached on the disk.
+        """
+        if self.updates_index is not None:
+            return self.updates_index
 
-        # Download the updates file if needed
-        if download_updates:
-            url = "%s/update-center.json" % self.params['updates_url']
+        updates_dir = os.path.expanduser('~/.ansible/tmp')
+        index_file = "%s/%s" % (updates_dir, 'jenkins-plugin-index.json')
 
-            # Get the data
-            r = self._get_url_data(
-                url,
-                msg_status="Remote updates not found.",
-                msg_exception="Updates download failed.")
+        # Check if the cached index is fresh enough and for the same Update Centre
+        if (
+                self.params['updates_expiration'] > 0 and
+                os.path.isfile(index_file) and
+                time.time() - os.stat(index_file).st_mtime < self.params['updates_expiration']):
+            try:
+                with open(index_file, 'rb') as f:
+                    cached = json.loads(to_native(f.read()))
+                if cached.get('updates_url') == self.params['updates_url']:
+                    self.updates_index = cached['plugins']
+                    return self.updates_index
+            except (IOError, OSError, ValueError, KeyError):
+                pass
 
-            # Write the updates file
-            update_fd, updates_file = tempfile.mkstemp()
-            os.write(update_fd, r.read())
+        url = "%s/update-center.json" % self.params['updates_url']
 
-            try:
-                os.close(update_fd)
-            except IOError as e:
-                self.module.fail_json(
-                    msg="Cannot close the tmp updates file %s." % updates_file,
-                    details=to_native(e))
+        # Get the data
+        r = self._get_url_data(
+            url,
+            msg_status="Remote updates not found.",
+            msg_exception="Updates download failed.")
 
-        # Open the updates file
+        # The file is JSONP, the JSON data is on the second line
+        lines = to_native(r.read()).splitlines()
         try:
-            f = open(updates_file, encoding='utf-8')
-        except IOError as e:
+            if lines and lines[0].startswith('{'):
+                data = json.loads(''.join(lines))
+            else:
+                data = json.loads(lines[1])
+        except Exception as e:
             self.module.fail_json(
-                msg="Cannot open temporal updates file.",
+                msg="Cannot load JSON data from the updates file.",
                 details=to_native(e))
 
-        i = 0
-        for line in f:
-            # Read only the second line
-            if i == 1:
-                try:
-                    data = json.loads(line)
-                except Exception as e:
-                    self.module.fail_json(
-                        msg="Cannot load JSON data from the tmp updates file.",
-                        details=to_native(e))
-
-                break
+        if 'plugins' not in data:
+            self.module.fail_json(
+                msg="Cannot find plugin data in the updates file.")
 
-            i += 1
+        self.updates_index = {}
+        for name, plugin in data['plugins'].items():
+            entry = dict(
+                (field, plugin[field]) for field in UPDATES_INDEX_FIELDS
+                if field in plugin)
+            entry['dependencies'] = [
+                {
+                    'name': dep['name'],
+                    'version': dep.get('version'),
+                    'optional': dep.get('optional', False),
+                }
+                for dep in plugin.get('dependencies', [])]
+            self.updates_index[name] = entry
 
-        # Move the updates file to the right place if we could read it
-        if download_updates:
-            # Make sure the destination directory exists
+        # Store the index if a cache file should be used
+        if self.params['updates_expiration'] > 0:
             if not os.path.isdir(updates_dir):
                 try:
                     os.makedirs(updates_dir, int('0700', 8))
@@ -593,14 +650,201 @@ class JenkinsPlugin(object):
                         msg="Cannot create temporal directory.",
                         details=to_native(e))
 
-            self.module.atomic_move(updates_file, updates_file_orig)
+            self._write_file(index_file, to_bytes(json.dumps({
+                'updates_url': self.params['updates_url'],
+                'plugins': self.updates_index,
+            })))
 
-        # Check if we have the plugin data available
-        if 'plugins' not in data or self.params['name'] not in data['plugins']:
+        return self.updates_index
+
+    def _file_digest(self, path, algorithm):
+        # Hash the file by chunks to not read it into the memory
+        digest = hashlib.new(algorithm)
+
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+
+        return digest
+
+    def _download_to_temp(self, url):
+        """
+        Stream the URL into a temporal file and hash it on the way. Can be
+        called from several threads as it raises exceptions instead of
+        failing the module. Returns the path of the file and its digests.
+        """
+        response, info = fetch_url(self.module, url, timeout=self.timeout)
+
+        if info['status'] != 200:
+            raise Exception(
+                "Cannot get %s: %s" % (url, info.get('msg')))
+
+        digests = dict(
+            (algorithm, hashlib.new(algorithm))
+            for algorithm in ('md5', 'sha1', 'sha256'))
+        tmp_f_fd, tmp_f = tempfile.mkstemp()
+
+        try:
+            with os.fdopen(tmp_f_fd, 'wb') as fh:
+                for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                    fh.write(chunk)
+
+                    for digest in digests.values():
+                        digest.update(chunk)
+        except Exception:
+            os.remove(tmp_f)
+            raise
+
+        return tmp_f, digests
+
+    def _download_verified(self, name, entry):
+        # Download one plugin and check it against the update center checksum
+        try:
+            tmp_f, digests = self._download_to_temp(entry['url'])
+        except Exception as e:
+            return name, None, to_native(e)
+
+        if 'sha256' in entry:
+            expected = entry['sha256']
+            actual = digests['sha256']
+        else:
+            expected = entry.get('sha1')
+            actual = digests['sha1']
+
+        if expected is not None and to_bytes(expected) != base64.b64encode(actual.digest()):
+            os.remove(tmp_f)
+
+            return name, None, "Checksum mismatch for %s." % entry['url']
+
+        return name, tmp_f, None
+
+    def _needs_update(self, name, entry, min_version, requested):
+        installed = self.installed_plugins.get(name)
+
+        if installed is None:
+            return True
+
+        if min_version is not None:
+            try:
+                too_old = LooseVersion(installed['version']) < LooseVersion(min_version)
+            except TypeError:
+                # LooseVersion cannot compare versions like '1.0-beta-1' and '1.0.1' on Python 3
+                too_old = installed['version'] < min_version
+            if too_old:
+                return True
+
+        if requested and self.params['version'] == 'latest':
+            plugin_file = '%s/plugins/%s.jpi' % (
+                self.params['jenkins_home'], name)
+
+            if not os.path.isfile(plugin_file):
+                return installed['version'] != entry['version']
+
+            if 'sha256' in entry:
+                checksum = self._file_digest(plugin_file, 'sha256')
+                expected = entry['sha256']
+            else:
+                checksum = self._file_digest(plugin_file, 'sha1')
+                expected = entry['sha1']
+
+            return base64.b64encode(checksum.digest()) != to_bytes(expected)
+
+        return False
+
+    def resolve(self, names):
+        """
+        Return the update center entries of the plugins to download for the
+        given names, including their missing or too old dependencies.
+        """
+        index = self._get_updates_index()
+        needed = OrderedDict()
+        visited = set()
+        queue = [(name, None, True) for name in names]
+
+        while queue:
+            name, min_version, requested = queue.pop(0)
+
+            if name in needed or (name, min_version, requested) in visited:
+                continue
+
+            visited.add((name, min_version, requested))
+
+            if name not in index:
+                self.module.fail_json(
+                    msg="Cannot find plugin data in the updates file.",
+                    details=name)
+
+            if not self._needs_update(name, index[name], min_version, requested):
+                continue
+
+            needed[name] = index[name]
+
+            if self.params['with_dependencies']:
+                for dep in index[name]['dependencies']:
+                    if not dep['optional']:
+                        queue.append((dep['name'], dep['version'], False))
+
+        return needed
+
+    def install_many(self, names):
+        needed = self.resolve(names)
+
+        if not needed or self.module.check_mode:
+            return list(needed)
+
+        # Check if the plugin directory exists
+        if not os.path.isdir(self.params['jenkins_home']):
             self.module.fail_json(
-                msg="Cannot find plugin data in the updates file.")
+                msg="Jenkins home directory doesn't exist.")
 
-        return data['plugins'][self.params['name']]
+        pool = ThreadPool(max(1, min(self.params['concurrency'], len(needed))))
+
+        try:
+            results = pool.map(
+                lambda item: self._download_verified(item[0], item[1]),
+                list(needed.items()))
+        finally:
+            pool.close()
+            pool.join()
+
+        errors = dict((name, error) for name, tmp_f, error in results if error)
+
+        if errors:
+            for name, tmp_f, error in results:
+                if tmp_f is not None:
+                    os.remove(tmp_f)
+
+            self.module.fail_json(
+                msg="Plugin download failed.", details=errors)
+
+        for name, tmp_f, error in results:
+            plugin_file = '%s/plugins/%s.jpi' % (
+                self.params['jenkins_home'], name)
+            self.module.atomic_move(tmp_f, plugin_file)
+
+            params = {
+                'dest': plugin_file
+            }
+            params.update(self.params)
+            file_args = self.module.load_file_common_arguments(params)
+            self.module.set_fs_attributes_if_different(file_args, True)
+
+        return list(needed)
+
+    def safe_restart(self):
+        # Jenkins answers with a redirection or is already restarting
+        try:
+            response, info = fetch_url(
+                self.module, "%s/safeRestart" % self.url, data='',
+                timeout=self.timeout, cookies=self.cookies,
+                headers=self.crumb, method='POST')
+        except Exception as e:
+            self.module.fail_json(
+                msg="Jenkins restart has failed.", details=to_native(e))
+
+        if info['status'] not in (200, 302, 503):
+            self.module.fail_json(
+                msg="Cannot restart Jenkins.", details=info['msg'])
 
     def _download_plugin(self, plugin_url):
         # Download the plugin
@@ -706,7 +950,10 @@ def main():
         group=dict(default='jenkins'),
         jenkins_home=dict(default='/var/lib/jenkins'),
         mode=dict(default='0644', type='raw'),
-        name=dict(required=True),
+        name=dict(),
+        names=dict(type='list', elements='str'),
+        concurrency=dict(default=4, type='int'),
+        safe_restart=dict(default=False, type='bool'),
         owner=dict(default='jenkins'),
         params=dict(type='dict'),
         state=dict(
@@ -731,6 +978,8 @@ def main():
     module = AnsibleModule(
         argument_spec=argument_spec,
         add_file_common_args=True,
+        required_one_of=[('name', 'names')],
+        mutually_exclusive=[('name', 'names')],
         supports_check_mode=True,
     )
 
@@ -757,14 +1006,28 @@ def main():
 
     # Create some shortcuts
     name = module.params['name']
+    names = module.params['names']
     state = module.params['state']
 
+    if names is not None and state != 'present':
+        module.fail_json(
+            msg="The names option only supports the present and latest states.")
+
     # Initial change state of the task
     changed = False
 
     # Instantiate the JenkinsPlugin object
     jp = JenkinsPlugin(module)
 
+    if names is not None:
+        plugins = jp.install_many(names)
+        changed = bool(plugins)
+
+        if changed and module.params['safe_restart'] and not module.check_mode:
+            jp.safe_restart()
+
+        module.exit_json(changed=changed, plugins=plugins, state=state)
+
     # Perform action depending on the requested state
     if state == 'present':
         changed = jp.install()
@@ -779,6 +1042,11 @@ def main():
     elif state == 'disabled':
         changed = jp.disable()
 
+    if (
+            state == 'present' and changed and
+            module.params['safe_restart'] and not module.check_mode):
+        jp.safe_restart()
+
     # Print status of the change
     module.exit_json(changed=changed, plugin=name, state=state)
 
@@ -14,3 +14,15 @@ export ANSIBLE_LOG_FOLDER="logit.file"
 touch "${ANSIBLE_LOG_FOLDER}"
 ansible-playbook ping_log.yml -v "$@" 2>&1| grep 'Failure using method (v2_runner_on_ok) in callback plugin'
 [[ ! -f "${ANSIBLE_LOG_FOLDER}/localhost" ]]
+
+# compressed JSON lines
+export ANSIBLE_LOG_FOLDER="logit.json"
+ANSIBLE_LOG_PLAYS_FORMAT=json ANSIBLE_LOG_PLAYS_COMPRESS=true ansible-playbook ping_log.yml -v "$@"
+gzip -dc "${ANSIBLE_LOG_FOLDER}/localhost.jsonl.gz" | python -c 'import json, sys; assert json.loads(sys.stdin.readline())["category"] == "OK"'
+
+# rotate on size, the second run starts a new file
+export ANSIBLE_LOG_FOLDER="logit.rotate"
+ANSIBLE_LOG_PLAYS_ROTATE_SIZE=1 ansible-playbook ping_log.yml -v "$@"
+ANSIBLE_LOG_PLAYS_ROTATE_SIZE=1 ansible-playbook ping_log.yml -v "$@"
+[[ -f "${ANSIBLE_LOG_FOLDER}/localhost" ]]
+ls "${ANSIBLE_LOG_FOLDER}"/localhost.* | grep -q .
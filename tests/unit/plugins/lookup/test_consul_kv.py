@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+from ansible_collections.community.general.tests.unit.compat import unittest
+from ansible_collections.community.general.tests.unit.compat.mock import patch, MagicMock
+from ansible_collections.community.general.plugins.lookup import consul_kv
+from ansible.plugins.loader import lookup_loader
+
+
+class FakeKV(object):
+
+    def __init__(self, data):
+        self.data = data
+        self.index = 1
+        self.calls = []
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.index += 1
+
+    def get(self, key, index=None, recurse=False, keys=False, token=None, dc=None):
+        self.calls.append((key, recurse, keys))
+        if keys:
+            return self.index, sorted(k for k in self.data if k.startswith(key))
+        if recurse:
+            return self.index, [{'Key': k, 'Value': self.data[k]} for k in sorted(self.data) if k.startswith(key)]
+        if key in self.data:
+            return self.index, {'Key': key, 'Value': self.data[key]}
+        return self.index, None
+
+
+class TestLookupModule(unittest.TestCase):
+
+    def setUp(self):
+        consul_kv.HAS_CONSUL = True
+        consul_kv.CONSUL_CLIENTS.clear()
+        consul_kv.RECURSE_CACHE.clear()
+        self.kv = FakeKV({'app/a': b'1', 'app/b': b'2', 'other': b'3'})
+        self.consul = MagicMock()
+        self.consul.Consul.return_value.kv = self.kv
+        self.lookup = lookup_loader.get('community.general.consul_kv')
+
+    def run_lookup(self, terms, **kwargs):
+        with patch.object(consul_kv, 'consul', self.consul, create=True):
+            return self.lookup.run(terms, [], **kwargs)
+
+    def test_key(self):
+        self.assertListEqual(['3'], self.run_lookup(['other']))
+        self.assertListEqual([], self.run_lookup(['missing']))
+
+    def test_client_reused(self):
+        self.run_lookup(['other'])
+        self.run_lookup(['app/a', 'app/b'])
+        self.assertEqual(1, self.consul.Consul.call_count)
+
+    def test_prefix(self):
+        self.assertListEqual(['1', '2', '3'], self.run_lookup(['app/a', 'app/b', 'other'], prefix='app/'))
+        self.assertListEqual([('app/', True, False), ('other', False, False)], self.kv.calls)
+
+    def test_recurse_cache_revalidated(self):
+        self.assertListEqual(['1', '2'], self.run_lookup(['app/ recurse=true']))
+        self.assertListEqual(['1', '2'], self.run_lookup(['app/ recurse=true']))
+        self.assertListEqual([('app/', True, False), ('app/', False, True)], self.kv.calls)
+
+        self.kv.put('app/c', b'4')
+        self.assertListEqual(['1', '2', '4'], self.run_lookup(['app/ recurse=true']))
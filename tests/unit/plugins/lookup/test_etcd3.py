@@ -40,6 +40,7 @@ class TestLookupModule(unittest.TestCase):
 
     def setUp(self):
         etcd3.HAS_ETCD = True
+        etcd3.ETCD3_CLIENTS.clear()
         self.lookup = lookup_loader.get('community.general.etcd3')
 
     @patch('ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client', FakeEtcd3Client())
@@ -55,3 +56,25 @@ class TestLookupModule(unittest.TestCase):
             {'key': 'a_key_3', 'value': 'a_key_3 value'},
         ]
         self.assertListEqual(expected_result, self.lookup.run(['a_key'], [], **{'prefix': True}))
+
+    def test_client_reused(self):
+        client = FakeEtcd3Client()
+        with patch('ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client', client):
+            self.lookup.run(['a_key'], [])
+            self.lookup.run(['a_key'], [], **{'prefix': True})
+        self.assertEqual(1, client.call_count)
+
+    def test_cache(self):
+        client = FakeEtcd3Client()
+        etcd = client.return_value
+        etcd.status.return_value.raft_index = 1
+        etcd.get = MagicMock(side_effect=lambda key: ("{0} value".format(key), FakeKVMetadata(key, None)))
+        expected_result = [{'key': 'a_key', 'value': 'a_key value'}]
+        with patch('ansible_collections.community.general.plugins.lookup.etcd3.etcd3_client', client):
+            self.assertListEqual(expected_result, self.lookup.run(['a_key'], [], **{'cache': True}))
+            self.assertListEqual(expected_result, self.lookup.run(['a_key'], [], **{'cache': True}))
+            self.assertEqual(1, etcd.get.call_count)
+
+            etcd.status.return_value.raft_index = 2
+            self.assertListEqual(expected_result, self.lookup.run(['a_key'], [], **{'cache': True}))
+            self.assertEqual(2, etcd.get.call_count)
@@ -1,6 +1,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import time
+
 import pytest
 from itertools import count
 
@@ -167,3 +169,62 @@ def test_json_without_token_returned(mock_json_without_token_returned):
         'Could not obtain access token from http://keycloak.url'
         '/auth/realms/master/protocol/openid-connect/token'
     )
+
+
+@pytest.fixture()
+def mock_token_cache(mocker, tmp_path):
+    mocker.patch(
+        'ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak.TOKEN_CACHE_PATH',
+        str(tmp_path / 'keycloak-tokens.json'))
+    token_response = {
+        'http://keycloak.url/auth/realms/master/protocol/openid-connect/token': [
+            create_wrapper('{"access_token": "firsttoken", "expires_in": 300, '
+                           '"refresh_token": "refreshtoken", "refresh_expires_in": 1800}'),
+            create_wrapper('{"access_token": "secondtoken", "expires_in": 300, '
+                           '"refresh_token": "refreshtoken", "refresh_expires_in": 1800}'),
+        ],
+    }
+    return mocker.patch(
+        'ansible_collections.community.general.plugins.module_utils.identity.keycloak.keycloak.open_url',
+        side_effect=build_mocked_request(count(), token_response),
+        autospec=True
+    )
+
+
+def get_cached_token(auth_password='admin'):
+    return get_token(
+        base_url='http://keycloak.url/auth',
+        validate_certs=True,
+        auth_realm='master',
+        client_id='admin-cli',
+        auth_username='admin',
+        auth_password=auth_password,
+        client_secret=None,
+        token_cache=True,
+    )
+
+
+def test_token_cache_reused(mock_token_cache):
+    assert get_cached_token()['Authorization'] == 'Bearer firsttoken'
+    assert get_cached_token()['Authorization'] == 'Bearer firsttoken'
+    assert mock_token_cache.call_count == 1
+
+
+def test_token_cache_other_credentials(mock_token_cache):
+    assert get_cached_token()['Authorization'] == 'Bearer firsttoken'
+    assert get_cached_token(auth_password='other')['Authorization'] == 'Bearer secondtoken'
+    assert 'grant_type=password' in mock_token_cache.call_args[1]['data']
+
+
+def test_token_cache_refreshed(mock_token_cache, mocker):
+    now = time.time()
+    mocker.patch('time.time', return_value=now)
+    assert get_cached_token()['Authorization'] == 'Bearer firsttoken'
+
+    # The access token expired, but the refresh token did not
+    mocker.patch('time.time', return_value=now + 600)
+    assert get_cached_token()['Authorization'] == 'Bearer secondtoken'
+    data = mock_token_cache.call_args[1]['data']
+    assert 'grant_type=refresh_token' in data
+    assert 'refresh_token=refreshtoken' in data
+    assert 'password' not in data
@@ -72,3 +72,43 @@ def test_gather_vm_params_and_facts(mocker, fake_ansible_module, XenAPI, xenserv
     vm_ref = list(fixture_data_from_file[params_file]['VM'].keys())[0]
 
     assert xenserver.gather_vm_facts(fake_ansible_module, xenserver.gather_vm_params(fake_ansible_module, vm_ref)) == fixture_data_from_file[facts_file]
+
+
+@pytest.mark.parametrize('fixture_data_from_file',
+                         testcase_gather_vm_params_and_facts['params'],
+                         ids=testcase_gather_vm_params_and_facts['ids'],
+                         indirect=True)
+def test_gather_all_vm_params_and_facts(mocker, fake_ansible_module, XenAPI, xenserver, fixture_data_from_file):
+    """Tests gathering of VM parameters and facts using bulk record fetch."""
+    mocked_xenapi = mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+
+    if "params" in list(fixture_data_from_file.keys())[0]:
+        params_file = list(fixture_data_from_file.keys())[0]
+        facts_file = list(fixture_data_from_file.keys())[1]
+    else:
+        params_file = list(fixture_data_from_file.keys())[1]
+        facts_file = list(fixture_data_from_file.keys())[0]
+
+    mocked_returns = {
+        "VM.get_all_records_where.return_value": fixture_data_from_file[params_file]['VM'],
+    }
+
+    for obj_class in ['host', 'VBD', 'VDI', 'SR', 'VIF', 'network', 'VM_guest_metrics']:
+        mocked_returns["%s.get_all_records.return_value" % obj_class] = fixture_data_from_file[params_file].get(obj_class, {})
+
+    mocked_xenapi.configure_mock(**mocked_returns)
+
+    mocked_get_xenserver_version = mocker.patch('ansible_collections.community.general.plugins.module_utils.xenserver.get_xenserver_version',
+                                                return_value=[7, 2, 0])
+
+    cache = xenserver.XAPIObjectCache(fake_ansible_module)
+
+    vm_params_list = xenserver.gather_all_vm_params(fake_ansible_module, cache)
+
+    assert len(vm_params_list) == 1
+    assert xenserver.gather_vm_facts(fake_ansible_module, vm_params_list[0], cache) == fixture_data_from_file[facts_file]
+
+    for obj_class in ['VM', 'host', 'VBD', 'VDI', 'SR', 'VIF', 'network', 'VM_guest_metrics']:
+        getattr(mocked_xenapi, obj_class).get_record.assert_not_called()
+
+    mocked_get_xenserver_version.assert_called_once()
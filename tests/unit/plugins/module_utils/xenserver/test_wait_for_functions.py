@@ -7,6 +7,8 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 
+import itertools
+
 import pytest
 
 from .FakeAnsibleModule import FailJsonException
@@ -109,7 +111,8 @@ def test_wait_for_vm_ip_address_timeout(mocker, fake_ansible_module, XenAPI, xen
 
     mocked_xenapi.configure_mock(**mocked_returns)
 
-    mocker.patch('time.sleep')
+    mocker.patch.object(XenAPI.Session, 'xenapi_request', return_value={"events": [], "token": "fake-token"})
+    mocker.patch('time.time', side_effect=itertools.count())
 
     with pytest.raises(FailJsonException) as exc_info:
         xenserver.wait_for_vm_ip_address(fake_ansible_module, fake_xenapi_ref('VM'), timeout=1)
@@ -150,7 +153,8 @@ def test_wait_for_vm_ip_address(mocker, fake_ansible_module, XenAPI, xenserver):
 
     mocked_xenapi.configure_mock(**mocked_returns)
 
-    mocker.patch('time.sleep')
+    mocker.patch.object(XenAPI.Session, 'xenapi_request', return_value={"events": [], "token": "fake-token"})
+    mocker.patch('time.time', side_effect=itertools.count())
 
     fake_guest_metrics = xenserver.wait_for_vm_ip_address(fake_ansible_module, fake_xenapi_ref('VM'))
 
@@ -185,7 +189,8 @@ def test_wait_for_task_timeout(mocker, fake_ansible_module, XenAPI, xenserver):
 
     mocked_xenapi.configure_mock(**mocked_returns)
 
-    mocker.patch('time.sleep')
+    mocker.patch.object(XenAPI.Session, 'xenapi_request', return_value={"events": [], "token": "fake-token"})
+    mocker.patch('time.time', side_effect=itertools.count())
 
     fake_result = xenserver.wait_for_task(fake_ansible_module, fake_xenapi_ref('task'), timeout=1)
 
@@ -212,9 +217,33 @@ def test_wait_for_task(mocker, fake_ansible_module, XenAPI, xenserver, task_stat
 
     mocked_xenapi.configure_mock(**mocked_returns)
 
-    mocker.patch('time.sleep')
+    mocker.patch.object(XenAPI.Session, 'xenapi_request', return_value={"events": [], "token": "fake-token"})
+    mocker.patch('time.time', side_effect=itertools.count())
 
     fake_result = xenserver.wait_for_task(fake_ansible_module, fake_xenapi_ref('task'))
 
     mocked_xenapi.task.destroy.assert_called_once()
     assert fake_result == result
+
+
+def test_wait_for_event(mocker, fake_ansible_module, XenAPI, xenserver):
+    """Tests waiting with event.from subscription."""
+    mocked_xenapi_request = mocker.patch.object(XenAPI.Session, 'xenapi_request', return_value={"events": [], "token": "fake-token-2"})
+    mocked_sleep = mocker.patch('time.sleep')
+
+    token = xenserver.wait_for_event(fake_ansible_module, ["task/%s" % fake_xenapi_ref('task')], "fake-token-1", 30)
+
+    mocked_xenapi_request.assert_called_once_with("event.from", (["task/%s" % fake_xenapi_ref('task')], "fake-token-1", 30.0))
+    mocked_sleep.assert_not_called()
+    assert token == "fake-token-2"
+
+
+def test_wait_for_event_unsupported(mocker, fake_ansible_module, XenAPI, xenserver):
+    """Tests fallback to sleeping when event.from is not supported."""
+    mocker.patch.object(XenAPI.Session, 'xenapi_request', side_effect=XenAPI.Failure(["MESSAGE_METHOD_UNKNOWN", "event.from"]))
+    mocked_sleep = mocker.patch('time.sleep')
+
+    token = xenserver.wait_for_event(fake_ansible_module, ["task/%s" % fake_xenapi_ref('task')], "fake-token-1", 30)
+
+    mocked_sleep.assert_called_once_with(2)
+    assert token == "fake-token-1"
@@ -75,3 +75,44 @@ def test_xenserver_guest_info(mocker, capfd, XenAPI, xenserver_guest_info):
     result = json.loads(out)
 
     assert result['instance'] == fake_vm_facts
+
+
+@pytest.mark.parametrize('patch_ansible_module',
+                         [
+                             {
+                                 "hostname": "somehost",
+                                 "username": "someuser",
+                                 "password": "somepwd",
+                                 "all_vms": True,
+                             },
+                         ],
+                         ids=['all_vms'],
+                         indirect=True)
+def test_xenserver_guest_info_all_vms(mocker, capfd, XenAPI, xenserver_guest_info):
+    """Tests gathering of facts of all VMs."""
+    fake_vm_facts = {"fake-vm-fact": True}
+
+    mocked_get_object_ref = mocker.patch('ansible_collections.community.general.plugins.modules.cloud.xenserver.xenserver_guest_info.get_object_ref')
+    mocker.patch('ansible_collections.community.general.plugins.modules.cloud.xenserver.xenserver_guest_info.gather_all_vm_params', return_value=[{}, {}])
+    mocker.patch('ansible_collections.community.general.plugins.modules.cloud.xenserver.xenserver_guest_info.gather_vm_facts', return_value=fake_vm_facts)
+
+    mocked_xenapi = mocker.patch.object(XenAPI.Session, 'xenapi', create=True)
+
+    mocked_returns = {
+        "pool.get_all.return_value": [fake_xenapi_ref('pool')],
+        "pool.get_default_SR.return_value": fake_xenapi_ref('SR'),
+    }
+
+    mocked_xenapi.configure_mock(**mocked_returns)
+
+    mocker.patch('ansible_collections.community.general.plugins.module_utils.xenserver.get_xenserver_version', return_value=[7, 2, 0])
+
+    with pytest.raises(SystemExit):
+        xenserver_guest_info.main()
+
+    out, err = capfd.readouterr()
+    result = json.loads(out)
+
+    mocked_get_object_ref.assert_not_called()
+    assert result['instances'] == [fake_vm_facts, fake_vm_facts]
+    assert 'instance' not in result
@@ -3,6 +3,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import base64
+import hashlib
+import os
 from io import BytesIO
 
 from ansible_collections.community.general.plugins.modules.web_infrastructure.jenkins_plugin import JenkinsPlugin
@@ -151,3 +154,85 @@ def test__get_json_data(mocker):
         'CSRF')
 
     assert isinstance(json_data, Mapping)
+
+
+UPDATES_INDEX = {
+    'a': {'version': '1.0', 'url': 'https://updates/a.hpi', 'sha256': 'x', 'dependencies': [
+        {'name': 'b', 'version': '2.0', 'optional': False},
+        {'name': 'c', 'version': '1.0', 'optional': True},
+        {'name': 'd', 'version': '1.0', 'optional': False},
+    ]},
+    'b': {'version': '2.1', 'url': 'https://updates/b.hpi', 'sha256': 'x', 'dependencies': [
+        {'name': 'e', 'version': '1.0', 'optional': False},
+    ]},
+    'c': {'version': '1.0', 'url': 'https://updates/c.hpi', 'sha256': 'x', 'dependencies': []},
+    'd': {'version': '1.5', 'url': 'https://updates/d.hpi', 'sha256': 'x', 'dependencies': []},
+    'e': {'version': '1.0', 'url': 'https://updates/e.hpi', 'sha256': 'x', 'dependencies': []},
+}
+
+
+def get_jenkins_plugin(mocker, **params):
+    module = mocker.Mock()
+    module.params = dict(url='http://localhost:8080', timeout=30, name=None, version=None,
+                         with_dependencies=True, jenkins_home='/nonexistent')
+    module.params.update(params)
+    module.fail_json.side_effect = SystemExit
+
+    mocker.patch.object(JenkinsPlugin, '_csrf_enabled', return_value=False)
+    mocker.patch.object(JenkinsPlugin, '_get_installed_plugins')
+    jenkins_plugin = JenkinsPlugin(module)
+    jenkins_plugin.updates_index = UPDATES_INDEX
+    jenkins_plugin.installed_plugins = {
+        'b': {'shortName': 'b', 'version': '1.9'},
+        'd': {'shortName': 'd', 'version': '1.2'},
+    }
+    return jenkins_plugin
+
+
+def test_resolve_dependencies(mocker):
+    "missing and too old dependencies are resolved transitively, optional ones are skipped"
+    jenkins_plugin = get_jenkins_plugin(mocker)
+
+    assert list(jenkins_plugin.resolve(['a'])) == ['a', 'b', 'e']
+
+
+def test_resolve_without_dependencies(mocker):
+    jenkins_plugin = get_jenkins_plugin(mocker, with_dependencies=False)
+
+    assert list(jenkins_plugin.resolve(['a', 'd'])) == ['a']
+
+
+def test_resolve_non_numeric_version(mocker):
+    "versions which LooseVersion cannot compare do not crash the resolution"
+    jenkins_plugin = get_jenkins_plugin(mocker)
+    jenkins_plugin.updates_index = dict(UPDATES_INDEX, a=dict(UPDATES_INDEX['a'], dependencies=[
+        {'name': 'd', 'version': '1.0.1', 'optional': False},
+    ]))
+    jenkins_plugin.installed_plugins['d']['version'] = '1.0-beta-1'
+
+    assert list(jenkins_plugin.resolve(['a'])) == ['a', 'd']
+
+    jenkins_plugin.installed_plugins['d']['version'] = '1.0.1'
+
+    assert list(jenkins_plugin.resolve(['a'])) == ['a']
+
+
+def test_download_verified(mocker):
+    "downloads are checked against the SHA-256 of the update center"
+    jenkins_plugin = get_jenkins_plugin(mocker)
+    content = b'plugin content'
+    mocker.patch(
+        'ansible_collections.community.general.plugins.modules.web_infrastructure.jenkins_plugin.fetch_url',
+        side_effect=lambda *args, **kwargs: (BytesIO(content), {'status': 200}))
+
+    entry = dict(UPDATES_INDEX['c'], sha256=base64.b64encode(hashlib.sha256(content).digest()).decode())
+    name, tmp_f, error = jenkins_plugin._download_verified('c', entry)
+    assert error is None
+    with open(tmp_f, 'rb') as f:
+        assert f.read() == content
+    os.remove(tmp_f)
+
+    entry['sha256'] = base64.b64encode(hashlib.sha256(b'other').digest()).decode()
+    name, tmp_f, error = jenkins_plugin._download_verified('c', entry)
+    assert tmp_f is None
+    assert 'Checksum mismatch' in error